@@ -2,25 +2,209 @@
 
 ## Dependencies
 from pathlib import Path
+import base64
+import io
+import json
 import zipfile
 import os
+import re
+import tempfile
+import time
+import traceback
+import uuid
+import zlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
 import shutil
+import struct
+from xml.sax.saxutils import quoteattr, unescape
 from analytics_tasks_utils.os_functions import open_file_folder
 import pandas as pd
 import openpyxl
-from openpyxl.styles import Font, Alignment, Border, Side, PatternFill
+import xlsxwriter
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, Alignment, Border, Side, PatternFill, NamedStyle
+from openpyxl.worksheet.dimensions import ColumnDimension
 
 
-def export_folder_as_zip(source_folder, destination_folder, exclude_folder_names=None):
+## Files larger than this are compressed to a temporary file instead of memory when zipping in parallel
+ZIP_PARALLEL_SPILL_BYTES = 64 * 1024**2
+
+
+def _deflate_file(path, arcname, spill_dir):
+    """Compress one file the way ZipFile.write does; returns its ZipInfo and the compressed bytes."""
+    info = zipfile.ZipInfo.from_file(path, arcname)
+    info.compress_type = zipfile.ZIP_DEFLATED
+    if info.file_size > ZIP_PARALLEL_SPILL_BYTES:
+        data = tempfile.TemporaryFile(dir=spill_dir)
+    else:
+        data = io.BytesIO()
+
+    # zlib releases the GIL while deflating, so threads compress on separate cores
+    compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+    crc = file_size = 0
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(1024**2)
+            if not chunk:
+                break
+            crc = zlib.crc32(chunk, crc)
+            file_size += len(chunk)
+            data.write(compressor.compress(chunk))
+    data.write(compressor.flush())
+
+    info.CRC = crc
+    info.file_size = file_size
+    info.compress_size = data.tell()
+    data.seek(0)
+    return info, data
+
+
+def _zip_member_records(info, offset):
+    """Local file header and central directory record for a member whose data starts after the header at offset."""
+    name = info.filename.encode("utf-8")
+    flags = 0 if info.filename.isascii() else 0x800  # UTF-8 names
+    year, month, day, hour, minute, second = info.date_time
+    dos_time = hour << 11 | minute << 5 | second // 2
+    dos_date = (year - 1980) << 9 | month << 5 | day
+
+    if max(info.file_size, info.compress_size, offset) > zipfile.ZIP64_LIMIT:
+        # Sizes and offset move to zip64 extra fields
+        version = 45
+        local_extra = struct.pack("<HHQQ", 1, 16, info.file_size, info.compress_size)
+        central_extra = struct.pack(
+            "<HHQQQ", 1, 24, info.file_size, info.compress_size, offset
+        )
+        compress_size = file_size = record_offset = 0xFFFFFFFF
+    else:
+        version = 20
+        local_extra = central_extra = b""
+        compress_size, file_size, record_offset = info.compress_size, info.file_size, offset
+
+    fields = (
+        version, flags, info.compress_type, dos_time, dos_date, info.CRC, compress_size, file_size
+    )
+    local = struct.pack("<IHHHHHIIIHH", 0x04034B50, *fields, len(name), len(local_extra))
+    central = struct.pack(
+        "<IHHHHHHIIIHHHHHII",
+        0x02014B50,
+        info.create_system << 8 | version,
+        *fields,
+        len(name),
+        len(central_extra),
+        0,
+        0,
+        0,
+        info.external_attr,
+        record_offset,
+    )
+    return local + name + local_extra, central + name + central_extra
+
+
+def _zip_end_records(count, directory_offset, directory_size):
+    """End of central directory record, preceded by its zip64 form when the archive needs it."""
+    records = b""
+    if count > zipfile.ZIP_FILECOUNT_LIMIT or max(directory_offset, directory_size) > zipfile.ZIP64_LIMIT:
+        records += struct.pack(
+            "<IQHHIIQQQQ",
+            0x06064B50, 44, 45, 45, 0, 0, count, count, directory_size, directory_offset,
+        )
+        records += struct.pack("<IIQI", 0x07064B50, 0, directory_offset + directory_size, 1)
+        count = min(count, 0xFFFF)
+        directory_offset = min(directory_offset, 0xFFFFFFFF)
+        directory_size = min(directory_size, 0xFFFFFFFF)
+    records += struct.pack(
+        "<IHHHHIIH", 0x06054B50, 0, 0, count, count, directory_size, directory_offset, 0
+    )
+    return records
+
+
+def _write_zip_parallel(zip_filename, entries, max_workers=None):
+    """
+    Write a deflated zip of (path, arcname) entries, compressing files on a thread pool.
+
+    The main thread writes finished members in entry order, so the layout does not depend
+    on thread timing. At most two files per worker are held compressed at a time.
+    """
+    max_workers = max_workers or os.cpu_count()
+    spill_dir = os.path.dirname(os.path.abspath(zip_filename))
+    pending = deque()
+    central_directory = []
+
+    with open(zip_filename, "wb") as f:
+
+        def write_next():
+            path, arcname, future = pending.popleft()
+            if future is None:
+                info = zipfile.ZipInfo.from_file(path, arcname)
+                info.CRC = info.compress_size = 0
+                data = io.BytesIO()
+            else:
+                info, data = future.result()
+            local, central = _zip_member_records(info, f.tell())
+            f.write(local)
+            shutil.copyfileobj(data, f, 1024**2)
+            data.close()
+            central_directory.append(central)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for path, arcname in entries:
+                if os.path.isdir(path):
+                    pending.append((path, arcname, None))
+                else:
+                    future = executor.submit(_deflate_file, path, arcname, spill_dir)
+                    pending.append((path, arcname, future))
+                while len(pending) > 2 * max_workers:
+                    write_next()
+            while pending:
+                write_next()
+
+        directory_offset = f.tell()
+        f.writelines(central_directory)
+        f.write(
+            _zip_end_records(
+                len(central_directory), directory_offset, f.tell() - directory_offset
+            )
+        )
+
+
+def _write_zip_entries(zip_filename, entries, parallel=False, max_workers=None):
+    """Write (path, arcname) entries to a new deflated zip, in order."""
+    if parallel:
+        _write_zip_parallel(zip_filename, entries, max_workers)
+        return
+
+    with zipfile.ZipFile(zip_filename, "w", zipfile.ZIP_DEFLATED) as zf:
+        for path, arcname in entries:
+            zf.write(path, arcname)
+
+
+def export_folder_as_zip(
+    source_folder,
+    destination_folder,
+    exclude_folder_names=None,
+    parallel=False,
+    max_workers=None,
+):
+    """
+    Zips a folder into <folder name>.zip in the destination folder.
+
+    Args:
+        source_folder (str or Path): The folder to zip.
+        destination_folder (str or Path): Where the zip file is written.
+        exclude_folder_names (list, optional): Folder names to leave out. Defaults to None.
+        parallel (bool, optional): Compress files on a thread pool; members are still
+            written in folder order. Defaults to False.
+        max_workers (int, optional): Compression threads. Defaults to the CPU count.
+    """
     if exclude_folder_names is None:
         exclude_folder_names = []
 
     os.chdir(destination_folder)
 
     output_filename = str(source_folder).rsplit("\\")[-1] + ".zip"
-    zf = zipfile.ZipFile(output_filename, "w", zipfile.ZIP_DEFLATED)
-
+    entries = []
     for dirname, subdirs, files in os.walk(source_folder):
         # Check if current directory or any parent directory should be excluded
         relative_path = os.path.relpath(dirname, source_folder)
@@ -37,18 +221,32 @@ def export_folder_as_zip(source_folder, destination_folder, exclude_folder_names
             subdirs.clear()  # Don't traverse subdirectories of excluded folders
             continue
 
-        zf.write(dirname)
+        entries.append((dirname, None))
         for filename in files:
-            zf.write(os.path.join(dirname, filename))
+            entries.append((os.path.join(dirname, filename), None))
 
-    zf.close()
+    _write_zip_entries(output_filename, entries, parallel, max_workers)
 
 
 def export_folder_as_zip_nfp(
-    source_folder, destination_folder, exclude_folder_names=None
+    source_folder,
+    destination_folder,
+    exclude_folder_names=None,
+    parallel=False,
+    max_workers=None,
 ):
+    """
+    Zips a folder into <folder name>.zip, with paths relative to the folder in the destination folder.
+
+    Args:
+        source_folder (str or Path): The folder to zip.
+        destination_folder (str or Path): Where the zip file is written.
+        exclude_folder_names (list, optional): Folder names to leave out. Defaults to None.
+        parallel (bool, optional): Compress files on a thread pool; members are still
+            written in folder order. Defaults to False.
+        max_workers (int, optional): Compression threads. Defaults to the CPU count.
+    """
     import os
-    import zipfile
 
     if exclude_folder_names is None:
         exclude_folder_names = []
@@ -57,39 +255,55 @@ def export_folder_as_zip_nfp(
 
     output_filename = str(source_folder).rsplit("\\")[-1] + ".zip"
 
+    # Walk through the source folder
+    entries = []
+    for dirname, subdirs, files in os.walk(source_folder):
+        # Check if current directory or any parent directory should be excluded
+        relative_path = os.path.relpath(dirname, source_folder)
+        path_parts = relative_path.split(os.sep)
+
+        # Skip if any part of the path matches excluded folder names
+        if any(part in exclude_folder_names for part in path_parts):
+            subdirs.clear()  # Don't traverse subdirectories of excluded folders
+            continue
+
+        # Also check the folder name itself
+        folder_name = os.path.basename(dirname)
+        if folder_name in exclude_folder_names:
+            subdirs.clear()  # Don't traverse subdirectories of excluded folders
+            continue
+
+        # Add files to zip
+        for filename in files:
+            # Get the absolute path of the file
+            absolute_path = os.path.join(dirname, filename)
+            # Create arcname (path within the zip file)
+            arcname = os.path.relpath(absolute_path, source_folder)
+
+            entries.append((absolute_path, arcname))
+
     # Create zip file
-    with zipfile.ZipFile(output_filename, "w", zipfile.ZIP_DEFLATED) as zf:
-        # Walk through the source folder
-        for dirname, subdirs, files in os.walk(source_folder):
-            # Check if current directory or any parent directory should be excluded
-            relative_path = os.path.relpath(dirname, source_folder)
-            path_parts = relative_path.split(os.sep)
-
-            # Skip if any part of the path matches excluded folder names
-            if any(part in exclude_folder_names for part in path_parts):
-                subdirs.clear()  # Don't traverse subdirectories of excluded folders
-                continue
-
-            # Also check the folder name itself
-            folder_name = os.path.basename(dirname)
-            if folder_name in exclude_folder_names:
-                subdirs.clear()  # Don't traverse subdirectories of excluded folders
-                continue
-
-            # Add files to zip
-            for filename in files:
-                # Get the absolute path of the file
-                absolute_path = os.path.join(dirname, filename)
-                # Create arcname (path within the zip file)
-                arcname = os.path.relpath(absolute_path, source_folder)
-
-                # Write file to zip
-                zf.write(absolute_path, arcname)
+    _write_zip_entries(output_filename, entries, parallel, max_workers)
 
 
 def export_folder_as_zip_timestamp(
-    source_folder, destination_folder, exclude_folder_names=None
+    source_folder,
+    destination_folder,
+    exclude_folder_names=None,
+    parallel=False,
+    max_workers=None,
 ):
+    """
+    Zips a folder into <folder name>_<YYYYMMDD_HHMM>.zip in the destination folder.
+
+    Args:
+        source_folder (str or Path): The folder to zip.
+        destination_folder (str or Path): Where the zip file is written.
+        exclude_folder_names (list, optional): Folder names to leave out. Defaults to None.
+        parallel (bool, optional): Compress files on a thread pool; members are still
+            written in folder order. Defaults to False.
+        max_workers (int, optional): Compression threads. Defaults to the CPU count.
+    """
     if exclude_folder_names is None:
         exclude_folder_names = []
 
@@ -111,8 +325,7 @@ def export_folder_as_zip_timestamp(
     os.chdir(destination_folder)
 
     output_filename = str(source_folder).rsplit("\\")[-1] + "_" + file_dt + ".zip"
-    zf = zipfile.ZipFile(output_filename, "w", zipfile.ZIP_DEFLATED)
-
+    entries = []
     for dirname, subdirs, files in os.walk(source_folder):
         # Check if current directory or any parent directory should be excluded
         relative_path = os.path.relpath(dirname, source_folder)
@@ -129,11 +342,11 @@ def export_folder_as_zip_timestamp(
             subdirs.clear()  # Don't traverse subdirectories of excluded folders
             continue
 
-        zf.write(dirname)
+        entries.append((dirname, None))
         for filename in files:
-            zf.write(os.path.join(dirname, filename))
+            entries.append((os.path.join(dirname, filename), None))
 
-    zf.close()
+    _write_zip_entries(output_filename, entries, parallel, max_workers)
 
 
 def backup_folder_force_old(source_folder, destination_folder):
@@ -222,31 +435,24 @@ if __name__ == "__main__":
 
 # %% Dataframe to HTML
 
+## Page pieces shared by the DataFrame to HTML table writers
+HTML_TABLE_CDN_ASSETS = """\
+    <link href="https://cdn.jsdelivr.net/npm/bootstrap@3.4.1/dist/css/bootstrap.min.css" rel="stylesheet">
+    <script src="https://code.jquery.com/jquery-3.7.1.min.js"></script>
+    <link rel="stylesheet" href="https://cdn.datatables.net/1.13.7/css/jquery.dataTables.min.css">
+    <script type="text/javascript" src="https://cdn.datatables.net/1.13.7/js/jquery.dataTables.min.js"></script>
+    <script type="text/javascript" src="https://cdn.jsdelivr.net/npm/bootstrap@3.4.1/dist/js/bootstrap.min.js"></script>
+"""
 
-def generate_html_with_color_and_copy(hex_color):
-    html_copy_button = f'<button onclick="copyToClipboard(\'{hex_color}\')" style="width: 60px; height: 20px; background-color: {hex_color}; border: none;"></button>'
-    return f"<div>{html_copy_button}</div>"
-
-
-def generate_html_from_dataframe(df, color_column_name):
-    html_content = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="utf-8">
-    <title>Colors.py scan</title>
-    <link href="../../assets/data_table/bootstrap.min.css" rel="stylesheet">
-    <script src="../../assets/data_table/jquery.min.js"></script>
-    <link rel="stylesheet" href="../../assets/data_table/jquery.dataTables.min.css">
-    <script type="text/javascript" src="../../assets/data_table/jquery.dataTables.min.js"></script>
-    <script type="text/javascript" src="../../assets/data_table/bootstrap.min.js"></script>
-    <script>
-        $(document).ready(function () {
-            $('#myTable').dataTable({
-                "pageLength": 100 /*load number of rows*/
-            });
-        });
+HTML_TABLE_LOCAL_ASSETS = """\
+    <link href="{path}bootstrap.min.css" rel="stylesheet">
+    <script src="{path}jquery.min.js"></script>
+    <link rel="stylesheet" href="{path}jquery.dataTables.min.css">
+    <script type="text/javascript" src="{path}jquery.dataTables.min.js"></script>
+    <script type="text/javascript" src="{path}bootstrap.min.js"></script>
+"""
 
+HTML_TABLE_COPY_SCRIPT = """
         function copyToClipboard(text) {
             navigator.clipboard.writeText(text)
                 .then(() => {
@@ -276,9 +482,9 @@ def generate_html_from_dataframe(df, color_column_name):
                 document.body.removeChild(notification);
             }, 3000); // Remove notification after 3 seconds
         }
-    </script>
-    <style>
-        body {
+"""
+
+HTML_TABLE_LIGHT_STYLE = """        body {
             margin: 0;
             padding: 0;
             /*background-color: transparent;*/ /* Set background color to transparent */
@@ -308,99 +514,9 @@ def generate_html_from_dataframe(df, color_column_name):
             padding: 0;
             line-height: 0;
         }
-    </style>
-</head>
-<body style="margin:20px auto">
-    <div class="container">
-        <h1 style="padding:0; margin-top:0px"></h1>
-        <table id="myTable" class="table table-striped">
-            <thead>
-                <tr>
-"""
-
-    # Add table headers dynamically
-    for col in df.columns:
-        html_content += f"                    <th>{col}</th>\n"
-    html_content += "                    <th>Display color</th>\n"
-    html_content += "                </tr>\n"
-    html_content += "            </thead>\n"
-    html_content += "            <tbody>\n"
-
-    # Iterate over DataFrame rows
-    for _, row in df.iterrows():
-        html_content += "                <tr>\n"
-        for col in df.columns:
-            html_content += f"                    <td>{row[col]}</td>\n"
-        html_content += f'                    <td class="color-cell">{generate_html_with_color_and_copy(row[color_column_name])}</td>\n'
-        html_content += "                </tr>\n"
-
-    html_content += """
-            </tbody>
-        </table>
-    </div>
-</body>
-</html>
 """
 
-    return html_content
-
-
-def generate_html_with_color_and_copy_dark(hex_color):
-    html_copy_button = f'<button onclick="copyToClipboard(\'{hex_color}\')" style="width: 60px; height: 20px; background-color: {hex_color}; border: none;"></button>'
-    return f"<div>{html_copy_button}</div>"
-
-
-def generate_html_from_dataframe_dark(df, color_column_name):
-    html_content = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="utf-8">
-    <title>Colors.py scan</title>
-    <link href="../../assets/data_table/bootstrap.min.css" rel="stylesheet">
-    <script src="../../assets/data_table/jquery.min.js"></script>
-    <link rel="stylesheet" href="../../assets/data_table/jquery.dataTables.min.css">
-    <script type="text/javascript" src="../../assets/data_table/jquery.dataTables.min.js"></script>
-    <script type="text/javascript" src="../../assets/data_table/bootstrap.min.js"></script>
-    <script>
-        $(document).ready(function () {
-            $('#myTable').dataTable({
-                "pageLength": 100 /*load number of rows*/
-            });
-        });
-
-        function copyToClipboard(text) {
-            navigator.clipboard.writeText(text)
-                .then(() => {
-                    console.log('Copied to clipboard');
-                    showNotification('Copied: ' + text);
-                })
-                .catch(err => {
-                    console.error('Error copying to clipboard:', err);
-                });
-        }
-
-        function showNotification(message) {
-            var notification = document.createElement('div');
-            notification.textContent = message;
-            notification.style.position = 'fixed';
-            notification.style.top = '20px';
-            notification.style.left = '50%';
-            notification.style.transform = 'translateX(-50%)';
-            notification.style.background = '#d95f0e';
-            notification.style.padding = '10px';
-            notification.style.border = '1px solid #ccc';
-            notification.style.borderRadius = '5px';
-            notification.style.boxShadow = '0 0 10px rgba(0,0,0,0.1)';
-            notification.style.zIndex = '9999';
-            document.body.appendChild(notification);
-            setTimeout(function() {
-                document.body.removeChild(notification);
-            }, 3000); // Remove notification after 3 seconds
-        }
-    </script>
-    <style>
-        /* Light mode styles */
+HTML_TABLE_DARK_STYLE = """        /* Light mode styles */
         body {
             background-color: white;  /* Background outside the table */
             color: black;
@@ -465,719 +581,804 @@ def generate_html_from_dataframe_dark(df, color_column_name):
                 color: #bdbdbd !important; /* Ensure labels like "Show entries" and "Search" are white */
             }
         }
-    </style>
-</head>
-<body style="margin:20px auto">
-    <div class="container">
-        <h1 style="padding:0; margin-top:0px"></h1>
-        <table id="myTable" class="table table-striped">
-            <thead>
-                <tr>
 """
 
-    # Add table headers dynamically
-    for col in df.columns:
-        html_content += f"                    <th>{col}</th>\n"
-    html_content += "                    <th>Display color</th>\n"
-    html_content += "                </tr>\n"
-    html_content += "            </thead>\n"
-    html_content += "            <tbody>\n"
-
-    # Iterate over DataFrame rows
-    for _, row in df.iterrows():
-        html_content += "                <tr>\n"
-        for col in df.columns:
-            html_content += f"                    <td>{row[col]}</td>\n"
-        html_content += f'                    <td class="color-cell">{generate_html_with_color_and_copy_dark(row[color_column_name])}</td>\n'
-        html_content += "                </tr>\n"
-
-    html_content += """
-            </tbody>
-        </table>
-    </div>
-</body>
-</html>
+## Rows converted to HTML per batch when streaming a table
+HTML_TABLE_CHUNK_ROWS = 10_000
+
+## DataTables Scroller extension, used by virtual pages with CDN assets
+HTML_TABLE_CDN_SCROLLER = """\
+    <link rel="stylesheet" href="https://cdn.datatables.net/scroller/2.3.0/css/scroller.dataTables.min.css">
+    <script type="text/javascript" src="https://cdn.datatables.net/scroller/2.3.0/js/dataTables.scroller.min.js"></script>
+"""
+
+## Virtual pages: read the embedded column arrays and let DataTables draw only visible rows
+HTML_TABLE_VIRTUAL_SCRIPT = """\
+        async function tableColumns() {
+            var element = document.getElementById('tableData');
+            if (element.type === 'application/json') {
+                return JSON.parse(element.textContent);
+            }
+            var text = atob(element.textContent.trim());
+            var bytes = new Uint8Array(text.length);
+            for (var i = 0; i < text.length; i++) {
+                bytes[i] = text.charCodeAt(i);
+            }
+            var stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('gzip'));
+            return await new Response(stream).json();
+        }
+
+        function tableRows(columns) {
+            var rows = new Array(columns.length ? columns[0].length : 0);
+            for (var i = 0; i < rows.length; i++) {
+                rows[i] = columns.map(function (column) { return column[i]; });
+            }
+            return rows;
+        }
+
+        function colorSwatch(color) {
+            return '<div><button onclick="copyToClipboard(\\'' + color + '\\')" style="width: 60px; height: 20px; background-color: ' + color + '; border: none;"></button></div>';
+        }
+
+        $(document).ready(async function () {
+            var columns = await tableColumns();
+            $('#myTable').DataTable({
+                data: tableRows(columns),
+                deferRender: true,
+                pageLength: 100,
+                OPTIONS
+            });
+        });
 """
 
-    return html_content
+
+def _html_cells(series):
+    """Text of every value in a column, formatted for the whole column at once."""
+    if series.dtype.kind in "biufc":
+        return series.to_numpy().astype(str).tolist()
+    return list(map(str, series.tolist()))
+
+
+def _json_cells(series):
+    """JSON-ready values of a column, with missing values as None and infinities as text."""
+    if series.dtype.kind in "biuf":
+        values = series.astype(object).where(series.notna(), None)
+        infinite = series.isin([float("inf"), float("-inf")])
+        if infinite.any():
+            values[infinite] = series[infinite].map(str)
+        return values.tolist()
+    return [None if pd.isna(value) else str(value) for value in series.astype(object)]
+
+
+## Characters escaped in embedded JSON so it cannot end or confuse the <script> element
+HTML_SCRIPT_JSON_ESCAPES = str.maketrans(
+    {
+        "<": "\\u003c",
+        ">": "\\u003e",
+        "&": "\\u0026",
+        "\u2028": "\\u2028",
+        "\u2029": "\\u2029",
+    }
+)
+
+
+def _write_table_json(file, df, compress=False):
+    """Write the table as column-oriented JSON, optionally gzipped and base64 encoded."""
+    if compress:
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+        pending = b""
+
+        def write(text):
+            # base64 is written in whole 3-byte groups so pieces can be concatenated
+            nonlocal pending
+            pending += compressor.compress(text.encode("utf-8"))
+            cut = len(pending) - len(pending) % 3
+            file.write(base64.b64encode(pending[:cut]).decode("ascii"))
+            pending = pending[cut:]
+
+    else:
+        write = file.write
+
+    # One column at a time, as strict JSON that is safe inside a <script> element
+    write("[")
+    for i in range(df.shape[1]):
+        values = json.dumps(
+            _json_cells(df.iloc[:, i]),
+            separators=(",", ":"),
+            ensure_ascii=False,
+            allow_nan=False,
+        )
+        write(("," if i else "") + values.translate(HTML_SCRIPT_JSON_ESCAPES))
+    write("]")
+
+    if compress:
+        file.write(base64.b64encode(pending + compressor.flush()).decode("ascii"))
+
+
+def write_data_table_html(
+    df,
+    file,
+    dark=False,
+    asset_path=None,
+    color_column_name=None,
+    title="DataFrame Table",
+    chunk_rows=HTML_TABLE_CHUNK_ROWS,
+    virtual=False,
+    compress=False,
+):
+    """
+    Stream a DataFrame as a DataTables HTML page to an open text file.
+
+    Rows are formatted a batch at a time, one column at a time, and written straight
+    to the file, so the time taken grows linearly with the rows and only one batch of
+    text is held in memory.
+
+    Parameters:
+    -----------
+    df : DataFrame
+        The DataFrame to write
+    file : file-like
+        Text file handle (or io.StringIO) the page is written to
+    dark : bool, default False
+        Follow the browser's dark mode (prefers-color-scheme) instead of the light theme
+    asset_path : str, optional
+        Folder with the local bootstrap, jQuery and DataTables files, relative to the
+        page (e.g. "../../assets/data_table/"). The CDN copies are used if None
+    color_column_name : str, optional
+        Column of hex colors; adds a "Display color" column of swatches that copy
+        their color to the clipboard when clicked
+    title : str, default "DataFrame Table"
+        Page title
+    chunk_rows : int, default HTML_TABLE_CHUNK_ROWS
+        Number of rows formatted per batch
+    virtual : bool, default False
+        Embed the data once as column-oriented JSON instead of one <tr> per row, and
+        let DataTables render rows on demand (deferRender, plus Scroller virtual
+        scrolling with CDN assets). Pages stay responsive with millions of rows
+    compress : bool, default False
+        With virtual=True, gzip and base64 encode the embedded JSON; the browser
+        decodes it with DecompressionStream
+    """
+    if asset_path is None:
+        assets = HTML_TABLE_CDN_ASSETS
+    else:
+        assets = HTML_TABLE_LOCAL_ASSETS.replace("{path}", asset_path)
+
+    if virtual:
+        options = []
+        if asset_path is None:
+            assets += HTML_TABLE_CDN_SCROLLER
+            options += ["scroller: true", "scrollY: '70vh'"]
+        if color_column_name:
+            # The swatch column draws from the color column's values
+            color_index = df.columns.get_loc(color_column_name)
+            options.append(
+                f"columnDefs: [{{targets: -1, data: {color_index}, render: colorSwatch}}]"
+            )
+        init_script = HTML_TABLE_VIRTUAL_SCRIPT.replace(
+            "OPTIONS", ",\n                ".join(options or ["paging: true"])
+        )
+    else:
+        init_script = (
+            "        $(document).ready(function () {\n"
+            "            $('#myTable').dataTable({\n"
+            '                "pageLength": 100 /*load number of rows*/\n'
+            "            });\n"
+            "        });\n"
+        )
+
+    file.write(
+        "\n<!DOCTYPE html>\n"
+        '<html lang="en">\n'
+        "<head>\n"
+        '    <meta charset="utf-8">\n'
+        f"    <title>{title}</title>\n"
+        f"{assets}"
+        "    <script>\n"
+        f"{init_script}"
+        f"{HTML_TABLE_COPY_SCRIPT if color_column_name else ''}"
+        "    </script>\n"
+        "    <style>\n"
+        f"{HTML_TABLE_DARK_STYLE if dark else HTML_TABLE_LIGHT_STYLE}"
+        "    </style>\n"
+        "</head>\n"
+        '<body style="margin:20px auto">\n'
+        '    <div class="container">\n'
+        '        <h1 style="padding:0; margin-top:0px"></h1>\n'
+        '        <table id="myTable" class="table table-striped">\n'
+        "            <thead>\n"
+        "                <tr>\n"
+    )
+
+    # Add table headers
+    headers = list(df.columns) + (["Display color"] if color_column_name else [])
+    file.writelines(f"                    <th>{col}</th>\n" for col in headers)
+    file.write("                </tr>\n            </thead>\n            <tbody>\n")
+
+    if virtual:
+        file.write("            </tbody>\n        </table>\n")
+        file.write(
+            '        <script id="tableData" type="application/'
+            f'{"octet-stream" if compress else "json"}">'
+        )
+        _write_table_json(file, df, compress)
+        file.write("</script>\n    </div>\n</body>\n</html>\n")
+        return
+
+    # Format each batch column by column, then write its rows in one go
+    for start in range(0, len(df), chunk_rows):
+        chunk = df.iloc[start : start + chunk_rows]
+        columns = [
+            [f"                    <td>{value}</td>\n" for value in _html_cells(chunk.iloc[:, i])]
+            for i in range(chunk.shape[1])
+        ]
+        if color_column_name:
+            columns.append(
+                [
+                    f'                    <td class="color-cell">{generate_html_with_color_and_copy(color)}</td>\n'
+                    for color in _html_cells(chunk[color_column_name])
+                ]
+            )
+        file.writelines(
+            f"                <tr>\n{''.join(cells)}                </tr>\n"
+            for cells in zip(*columns)
+        )
+
+    file.write(
+        "\n            </tbody>\n"
+        "        </table>\n"
+        "    </div>\n"
+        "</body>\n"
+        "</html>\n"
+    )
+
+
+def _data_table_html(df, **options):
+    """Whole page from write_data_table_html as a string."""
+    buffer = io.StringIO()
+    write_data_table_html(df, buffer, **options)
+    return buffer.getvalue()
+
+
+def generate_html_with_color_and_copy(hex_color):
+    html_copy_button = f'<button onclick="copyToClipboard(\'{hex_color}\')" style="width: 60px; height: 20px; background-color: {hex_color}; border: none;"></button>'
+    return f"<div>{html_copy_button}</div>"
+
+
+def generate_html_from_dataframe(df, color_column_name):
+    return _data_table_html(
+        df,
+        asset_path="../../assets/data_table/",
+        color_column_name=color_column_name,
+        title="Colors.py scan",
+    )
+
+
+def generate_html_with_color_and_copy_dark(hex_color):
+    return generate_html_with_color_and_copy(hex_color)
+
+
+def generate_html_from_dataframe_dark(df, color_column_name):
+    return _data_table_html(
+        df,
+        dark=True,
+        asset_path="../../assets/data_table/",
+        color_column_name=color_column_name,
+        title="Colors.py scan",
+    )
 
 
 # %% Dataframe to Data table
 
+## write_data_table_html options behind each generate_data_table_* page
+DATA_TABLE_THEMES = {
+    "generate_data_table_from_dataframe_internet": {},
+    "generate_data_table_from_dataframe": {"asset_path": "../../assets/data_table/"},
+    "generate_data_table_from_dataframe_dark_internet": {"dark": True},
+    "generate_data_table_from_dataframe_dark": {
+        "dark": True,
+        "asset_path": "../../assets/data_table/",
+    },
+    "generate_data_table_from_dataframe_text_dark_internet": {"dark": True},
+    "generate_data_table_from_dataframe_text_dark": {
+        "dark": True,
+        "asset_path": "../../../../assets/data_table/",
+    },
+}
+
 
 def dataframe_to_data_table(
-    df, func="generate_data_table_from_dataframe_text_dark_internet", out_file=None
+    df,
+    func="generate_data_table_from_dataframe_text_dark_internet",
+    out_file=None,
+    virtual=False,
+    compress=False,
 ):
-    func_ref = globals()[func]
-    html_content = func_ref(df)
+    """
+    Write a DataFrame to an HTML DataTables page and open it.
+
+    func picks the page theme by generate_data_table_* name. virtual=True embeds the
+    data as column-oriented JSON (gzip + base64 with compress=True) that the browser
+    renders on demand, for tables too large for one <tr> per row; see
+    write_data_table_html.
+    """
     if out_file is None:
         out_file = Path(
             "C:/my_disk/____tmp/generate_data_table_from_dataframe_text_dark_internet.html"
         )
-    with open(Path(out_file), "w") as f:
-        f.write(html_content)
+    with open(Path(out_file), "w", encoding="utf-8") as f:
+        if func in DATA_TABLE_THEMES:
+            # Stream the page straight to the file
+            write_data_table_html(
+                df, f, virtual=virtual, compress=compress, **DATA_TABLE_THEMES[func]
+            )
+        else:
+            f.write(globals()[func](df))
     open_file_folder(out_file)
 
 
 def generate_data_table_from_dataframe_internet(df):
-    html_content = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="utf-8">
-    <title>DataFrame Table</title>
-    <link href="https://cdn.jsdelivr.net/npm/bootstrap@3.4.1/dist/css/bootstrap.min.css" rel="stylesheet">
-    <script src="https://code.jquery.com/jquery-3.7.1.min.js"></script>
-    <link rel="stylesheet" href="https://cdn.datatables.net/1.13.7/css/jquery.dataTables.min.css">
-    <script type="text/javascript" src="https://cdn.datatables.net/1.13.7/js/jquery.dataTables.min.js"></script>
-    <script type="text/javascript" src="https://cdn.jsdelivr.net/npm/bootstrap@3.4.1/dist/js/bootstrap.min.js"></script>
-    <script>
-        $(document).ready(function () {
-            $('#myTable').dataTable({
-                "pageLength": 100 /*load number of rows*/
-            });
-        });
-    </script>
-    <style>
-        body {
-            margin: 0;
-            padding: 0;
-            /*background-color: transparent;*/ /* Set background color to transparent */
-        }
-        h1 {
-            /* text-align: center; */
-            margin-top: 20px;
-        }
-        table {
-            width: 70%;
-            margin: 20px auto;
-            border-collapse: collapse;
-        }
-        th, td {
-            padding: 8px;
-            /* text-align: center; */
-            border: 1px solid #ddd;
-        }
-        th {
-            vertical-align: middle;
-        }
-        .color-cell {
-            width: 100px;
-            /* text-align: center; */
-        }
-        button {
-            padding: 0;
-            line-height: 0;
-        }
-    </style>
-</head>
-<body style="margin:20px auto">
-    <div class="container">
-        <h1 style="padding:0; margin-top:0px"></h1>
-        <table id="myTable" class="table table-striped">
-            <thead>
-                <tr>
-"""
+    return _data_table_html(df, **DATA_TABLE_THEMES["generate_data_table_from_dataframe_internet"])
 
-    # Add table headers dynamically
-    for col in df.columns:
-        html_content += f"                    <th>{col}</th>\n"
-    html_content += "                </tr>\n"
-    html_content += "            </thead>\n"
-    html_content += "            <tbody>\n"
-
-    # Iterate over DataFrame rows
-    for _, row in df.iterrows():
-        html_content += "                <tr>\n"
-        for col in df.columns:
-            html_content += f"                    <td>{row[col]}</td>\n"
-        html_content += "                </tr>\n"
-
-    html_content += """
-            </tbody>
-        </table>
-    </div>
-</body>
-</html>
-"""
 
-    return html_content
-
-
-def generate_data_table_from_dataframe(df):
-    html_content = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="utf-8">
-    <title>DataFrame Table</title>
-    <link href="../../assets/data_table/bootstrap.min.css" rel="stylesheet">
-    <script src="../../assets/data_table/jquery.min.js"></script>
-    <link rel="stylesheet" href="../../assets/data_table/jquery.dataTables.min.css">
-    <script type="text/javascript" src="../../assets/data_table/jquery.dataTables.min.js"></script>
-    <script type="text/javascript" src="../../assets/data_table/bootstrap.min.js"></script>
-    <script>
-        $(document).ready(function () {
-            $('#myTable').dataTable({
-                "pageLength": 100 /*load number of rows*/
-            });
-        });
-    </script>
-    <style>
-        body {
-            margin: 0;
-            padding: 0;
-            /*background-color: transparent;*/ /* Set background color to transparent */
-        }
-        h1 {
-            /* text-align: center; */
-            margin-top: 20px;
-        }
-        table {
-            width: 70%;
-            margin: 20px auto;
-            border-collapse: collapse;
-        }
-        th, td {
-            padding: 8px;
-            /* text-align: center; */
-            border: 1px solid #ddd;
-        }
-        th {
-            vertical-align: middle;
-        }
-        .color-cell {
-            width: 100px;
-            /* text-align: center; */
-        }
-        button {
-            padding: 0;
-            line-height: 0;
-        }
-    </style>
-</head>
-<body style="margin:20px auto">
-    <div class="container">
-        <h1 style="padding:0; margin-top:0px"></h1>
-        <table id="myTable" class="table table-striped">
-            <thead>
-                <tr>
-"""
-
-    # Add table headers dynamically
-    for col in df.columns:
-        html_content += f"                    <th>{col}</th>\n"
-    html_content += "                </tr>\n"
-    html_content += "            </thead>\n"
-    html_content += "            <tbody>\n"
-
-    # Iterate over DataFrame rows
-    for _, row in df.iterrows():
-        html_content += "                <tr>\n"
-        for col in df.columns:
-            html_content += f"                    <td>{row[col]}</td>\n"
-        html_content += "                </tr>\n"
-
-    html_content += """
-            </tbody>
-        </table>
-    </div>
-</body>
-</html>
-"""
-
-    return html_content
+def generate_data_table_from_dataframe(df):
+    return _data_table_html(df, **DATA_TABLE_THEMES["generate_data_table_from_dataframe"])
 
 
 def generate_data_table_from_dataframe_dark_internet(df):
-    html_content = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="utf-8">
-    <title>DataFrame Table</title>
-    <link href="https://cdn.jsdelivr.net/npm/bootstrap@3.4.1/dist/css/bootstrap.min.css" rel="stylesheet">
-    <script src="https://code.jquery.com/jquery-3.7.1.min.js"></script>
-    <link rel="stylesheet" href="https://cdn.datatables.net/1.13.7/css/jquery.dataTables.min.css">
-    <script type="text/javascript" src="https://cdn.datatables.net/1.13.7/js/jquery.dataTables.min.js"></script>
-    <script type="text/javascript" src="https://cdn.jsdelivr.net/npm/bootstrap@3.4.1/dist/js/bootstrap.min.js"></script>
-    <script>
-        $(document).ready(function () {
-            $('#myTable').dataTable({
-                "pageLength": 100 /*load number of rows*/
-            });
-        });
-    </script>
-    <style>
-        /* Light mode styles */
-        body {
-            background-color: white;  /* Background outside the table */
-            color: black;
-        }
-
-        table {
-            background-color: white;
-            color: black;
-        }
-
-        th, td {
-            border: 1px solid #ddd;
-            background-color: white;
-            color: black;
-        }
-
-        /* Dark mode styles */
-        @media (prefers-color-scheme: dark) {
-            body {
-                background-color: #1e2129;  /* Dark mode background outside the table */
-                color: #e0e0e0;
-            }
-
-            /* Optional: you can also target the container specifically if you want */
-            .container {
-                background-color: #1e2129; /* Dark mode container background */
-            }
-
-            /* Table styles in dark mode */
-            table, .dataTables_wrapper {
-                background-color: #333 !important;
-                color: bdbdbd !important;
-            }
-
-            th, td {
-                border-color: #555;
-                background-color: #444 !important; /* Ensure all table cells have dark background */
-                color: #bdbdbd !important; /* Ensure all text in table is white */
-            }
-
-            /* DataTable plugin-specific styles */
-            .dataTables_wrapper .dataTables_paginate .paginate_button {
-                background-color: #444 !important; /* Dark background for pagination buttons */
-                color: bdbdbd !important; /* White text on pagination buttons */
-            }
-
-            .dataTables_wrapper .dataTables_filter input,
-            .dataTables_wrapper .dataTables_length select,
-            .dataTables_wrapper .dataTables_info {
-                background-color: #444 !important; /* Dark background for inputs and dropdowns */
-                color: white !important; /* White text for input fields */
-            }
-
-            /* Change hover effect in dark mode */
-            tr:hover {
-                background-color: #636363 !important;
-            }
-
-            /* Fix for "Show entries" and "Search" labels */
-            .dataTables_wrapper .dataTables_length label,
-            .dataTables_wrapper .dataTables_filter label {
-                color: #bdbdbd !important; /* Ensure labels like "Show entries" and "Search" are white */
-            }
-        }
-    </style>
-</head>
-<body style="margin:20px auto">
-    <div class="container">
-        <h1 style="padding:0; margin-top:0px"></h1>
-        <table id="myTable" class="table table-striped">
-            <thead>
-                <tr>
-"""
-
-    # Add table headers dynamically
-    for col in df.columns:
-        html_content += f"                    <th>{col}</th>\n"
-    html_content += "                </tr>\n"
-    html_content += "            </thead>\n"
-    html_content += "            <tbody>\n"
-
-    # Iterate over DataFrame rows
-    for _, row in df.iterrows():
-        html_content += "                <tr>\n"
-        for col in df.columns:
-            html_content += f"                    <td>{row[col]}</td>\n"
-        html_content += "                </tr>\n"
-
-    html_content += """
-            </tbody>
-        </table>
-    </div>
-</body>
-</html>
-"""
-
-    return html_content
+    return _data_table_html(
+        df, **DATA_TABLE_THEMES["generate_data_table_from_dataframe_dark_internet"]
+    )
 
 
 def generate_data_table_from_dataframe_dark(df):
-    html_content = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="utf-8">
-    <title>DataFrame Table</title>
-    <link href="../../assets/data_table/bootstrap.min.css" rel="stylesheet">
-    <script src="../../assets/data_table/jquery.min.js"></script>
-    <link rel="stylesheet" href="../../assets/data_table/jquery.dataTables.min.css">
-    <script type="text/javascript" src="../../assets/data_table/jquery.dataTables.min.js"></script>
-    <script type="text/javascript" src="../../assets/data_table/bootstrap.min.js"></script>
-    <script>
-        $(document).ready(function () {
-            $('#myTable').dataTable({
-                "pageLength": 100 /*load number of rows*/
-            });
-        });
-    </script>
-    <style>
-        /* Light mode styles */
-        body {
-            background-color: white;  /* Background outside the table */
-            color: black;
-        }
+    return _data_table_html(df, **DATA_TABLE_THEMES["generate_data_table_from_dataframe_dark"])
 
-        table {
-            background-color: white;
-            color: black;
-        }
 
-        th, td {
-            border: 1px solid #ddd;
-            background-color: white;
-            color: black;
-        }
+def generate_data_table_from_dataframe_text_dark_internet(df):
+    return _data_table_html(
+        df, **DATA_TABLE_THEMES["generate_data_table_from_dataframe_text_dark_internet"]
+    )
 
-        /* Dark mode styles */
-        @media (prefers-color-scheme: dark) {
-            body {
-                background-color: #1e2129;  /* Dark mode background outside the table */
-                color: #e0e0e0;
-            }
 
-            /* Optional: you can also target the container specifically if you want */
-            .container {
-                background-color: #1e2129; /* Dark mode container background */
-            }
+def generate_data_table_from_dataframe_text_dark(df):
+    return _data_table_html(
+        df, **DATA_TABLE_THEMES["generate_data_table_from_dataframe_text_dark"]
+    )
 
-            /* Table styles in dark mode */
-            table, .dataTables_wrapper {
-                background-color: #333 !important;
-                color: bdbdbd !important;
-            }
 
-            th, td {
-                border-color: #555;
-                background-color: #444 !important; /* Ensure all table cells have dark background */
-                color: #bdbdbd !important; /* Ensure all text in table is white */
-            }
+# %% Dataframe to excel
 
-            /* DataTable plugin-specific styles */
-            .dataTables_wrapper .dataTables_paginate .paginate_button {
-                background-color: #444 !important; /* Dark background for pagination buttons */
-                color: bdbdbd !important; /* White text on pagination buttons */
+## Workbook options for new files: rows are streamed to disk instead of held in memory
+EXCEL_WORKBOOK_OPTIONS = {"constant_memory": True, "nan_inf_to_errors": True}
+
+
+def _excel_format(workbook, formats, props):
+    """Return a workbook format for `props`, creating it once per workbook."""
+    key = tuple(sorted(props.items()))
+    if key not in formats:
+        formats[key] = workbook.add_format(props)
+    return formats[key]
+
+
+def _parse_cell_ref(cell_ref):
+    """Convert an 'A1' style reference to zero-based (row, col)."""
+    col_letter = "".join(filter(str.isalpha, cell_ref))
+    row_num = int("".join(filter(str.isdigit, cell_ref))) - 1
+    return row_num, openpyxl.utils.column_index_from_string(col_letter) - 1
+
+
+def _report_header_cells(workbook, formats, report_headers, page_bg_color):
+    """Resolve report_headers to (row, col, value, format) tuples sorted by position."""
+    cells = []
+    if isinstance(report_headers, dict):
+        # Simple dict format: {'A1': 'value', 'B1': 'value'}
+        header_text_format = _excel_format(workbook, formats, {"bg_color": page_bg_color})
+        for cell_ref, value in report_headers.items():
+            cells.append((*_parse_cell_ref(cell_ref), value, header_text_format))
+    elif isinstance(report_headers, list):
+        # Advanced list format with styling options
+        for header_item in report_headers:
+            format_props = {
+                "bg_color": header_item.get("bg_color", page_bg_color),
+                "font_size": header_item.get("font_size", 11),
+                "font_color": header_item.get("color", "#000000"),
             }
+            if header_item.get("bold", False):
+                format_props["bold"] = True
+            cells.append(
+                (
+                    *_parse_cell_ref(header_item.get("cell")),
+                    header_item.get("value"),
+                    _excel_format(workbook, formats, format_props),
+                )
+            )
+    return sorted(cells, key=lambda cell: cell[:2])
 
-            .dataTables_wrapper .dataTables_filter input,
-            .dataTables_wrapper .dataTables_length select,
-            .dataTables_wrapper .dataTables_info {
-                background-color: #444 !important; /* Dark background for inputs and dropdowns */
-                color: white !important; /* White text for input fields */
-            }
 
-            /* Change hover effect in dark mode */
-            tr:hover {
-                background-color: #636363 !important;
-            }
+def _excel_column_values(series):
+    """Return one column as Python values (missing values as None) and its default number format."""
+    num_format = None
+    if pd.api.types.is_datetime64_any_dtype(series):
+        if series.dt.tz is not None:
+            series = series.dt.tz_localize(None)
+        valid = series.dropna()
+        dates_only = (valid == valid.dt.normalize()).all()
+        num_format = "yyyy-mm-dd" if dates_only else "yyyy-mm-dd hh:mm:ss"
+    return series.astype(object).where(series.notna(), None).tolist(), num_format
 
-            /* Fix for "Show entries" and "Search" labels */
-            .dataTables_wrapper .dataTables_length label,
-            .dataTables_wrapper .dataTables_filter label {
-                color: #bdbdbd !important; /* Ensure labels like "Show entries" and "Search" are white */
-            }
-        }
-    </style>
-</head>
-<body style="margin:20px auto">
-    <div class="container">
-        <h1 style="padding:0; margin-top:0px"></h1>
-        <table id="myTable" class="table table-striped">
-            <thead>
-                <tr>
-"""
 
-    # Add table headers dynamically
-    for col in df.columns:
-        html_content += f"                    <th>{col}</th>\n"
-    html_content += "                </tr>\n"
-    html_content += "            </thead>\n"
-    html_content += "            <tbody>\n"
-
-    # Iterate over DataFrame rows
-    for _, row in df.iterrows():
-        html_content += "                <tr>\n"
-        for col in df.columns:
-            html_content += f"                    <td>{row[col]}</td>\n"
-        html_content += "                </tr>\n"
-
-    html_content += """
-            </tbody>
-        </table>
-    </div>
-</body>
-</html>
-"""
+def _excel_index_series(df):
+    """Return the DataFrame index as a positional Series, with MultiIndex tuples as strings."""
+    index_values = df.index
+    if isinstance(index_values, pd.MultiIndex):
+        index_values = index_values.map(str)
+    return index_values.to_series(index=range(len(df)))
 
-    return html_content
 
+def _excel_column(series):
+    """Return (values, worksheet writer method name, num_format) for one column; missing values become None."""
+    values, num_format = _excel_column_values(series)
 
-def generate_data_table_from_dataframe_text_dark_internet(df):
-    html_content = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="utf-8">
-    <title>DataFrame Table</title>
-    <link href="https://cdn.jsdelivr.net/npm/bootstrap@3.4.1/dist/css/bootstrap.min.css" rel="stylesheet">
-    <script src="https://code.jquery.com/jquery-3.7.1.min.js"></script>
-    <link rel="stylesheet" href="https://cdn.datatables.net/1.13.7/css/jquery.dataTables.min.css">
-    <script type="text/javascript" src="https://cdn.datatables.net/1.13.7/js/jquery.dataTables.min.js"></script>
-    <script type="text/javascript" src="https://cdn.jsdelivr.net/npm/bootstrap@3.4.1/dist/js/bootstrap.min.js"></script>
-    <script>
-        $(document).ready(function () {
-            $('#myTable').dataTable({
-                "pageLength": 100 /*load number of rows*/
-            });
-        });
-    </script>
-    <style>
-        /* Light mode styles */
-        body {
-            background-color: white;  /* Background outside the table */
-            color: black;
-        }
+    if pd.api.types.is_bool_dtype(series):
+        return values, "write_boolean", None
+    if pd.api.types.is_numeric_dtype(series):
+        return values, "write_number", None
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return values, "write_datetime", num_format
+    if pd.api.types.is_string_dtype(series):
+        # Empty and all-missing columns only hold blanks
+        if series.isna().all() or pd.api.types.infer_dtype(series, skipna=True) == "string":
+            return values, "write_string", None
 
-        table {
-            background-color: white;
-            color: black;
-        }
+    # Convert complex types to string
+    values = [str(value) if isinstance(value, (list, tuple, dict)) else value for value in values]
+    return values, "write", None
 
-        th, td {
-            border: 1px solid #ddd;
-            background-color: white;
-            color: black;
-        }
 
-        /* Dark mode styles */
-        @media (prefers-color-scheme: dark) {
-            body {
-                background-color: #1e2129;  /* Dark mode background outside the table */
-                color: #e0e0e0;
-            }
+## Excel's row limit per sheet
+EXCEL_MAX_ROWS = 1_048_576
 
-            /* Optional: you can also target the container specifically if you want */
-            .container {
-                background-color: #1e2129; /* Dark mode container background */
-            }
+## Rows converted and written per slice when streaming a DataFrame to Excel
+EXCEL_WRITE_CHUNK_ROWS = 100_000
 
-            /* Table styles in dark mode */
-            table, .dataTables_wrapper {
-                background-color: #333 !important;
-                color: bdbdbd !important;
-            }
 
-            th, td {
-                border-color: #555;
-                background-color: #444 !important; /* Ensure all table cells have dark background */
-                color: #bdbdbd !important; /* Ensure all text in table is white */
-            }
+def _excel_chunks(df, chunk_rows=EXCEL_WRITE_CHUNK_ROWS):
+    """Yield a DataFrame in row slices, or pass an iterable of DataFrame chunks through."""
+    if isinstance(df, pd.DataFrame):
+        for start in range(0, max(len(df), 1), chunk_rows):
+            yield df.iloc[start : start + chunk_rows]
+    else:
+        yield from df
+
+
+def _spill_sheet_name(sheet_name, number):
+    """Name of the number-th sheet a table runs over: df, df_2, df_3, ..."""
+    if number == 1:
+        return sheet_name
+    suffix = f"_{number}"
+    return sheet_name[: 31 - len(suffix)] + suffix
+
+
+## Rows sampled per text column when estimating Excel column widths
+EXCEL_WIDTH_SAMPLE_SIZE = 1000
+
+## Widest column Excel allows
+EXCEL_MAX_COLUMN_WIDTH = 255
+
+
+def _sample_rows(series, sample_size):
+    """Return the head, the tail and a fixed-seed random middle of a Series, at most sample_size rows."""
+    if len(series) <= sample_size:
+        return series
+    edge = sample_size // 4
+    middle = series.iloc[edge:-edge].sample(sample_size - 2 * edge, random_state=0)
+    return pd.concat([series.iloc[:edge], middle, series.iloc[-edge:]])
+
+
+def _number_width(values, num_format, is_integer, sample_size):
+    """Characters needed to show a numeric column in num_format (None means General)."""
+    values = values.dropna()
+    if values.empty:
+        return 0
+    negative = bool((values < 0).any())
+    max_abs = float(values.abs().max())
+    if max_abs == float("inf"):
+        max_abs = 0.0
+
+    section = (num_format or "").split(";")[0]
+    if num_format and section != "General":
+        if "%" in section:
+            max_abs *= 100
+        int_digits = len(str(int(max_abs)))
+        int_part, _, decimal_part = section.partition(".")
+        decimals = sum(decimal_part.count(ch) for ch in "0#?")
+        separators = (int_digits - 1) // 3 if "," in int_part else 0
+        literals = len(re.sub(r'[0#?,.%"\\]', "", section))
+        return (
+            negative
+            + int_digits
+            + separators
+            + (decimals + 1 if decimals else 0)
+            + ("%" in section)
+            + literals
+        )
 
-            /* DataTable plugin-specific styles */
-            .dataTables_wrapper .dataTables_paginate .paginate_button {
-                background-color: #444 !important; /* Dark background for pagination buttons */
-                color: bdbdbd !important; /* White text on pagination buttons */
-            }
+    int_digits = len(str(int(max_abs)))
+    if is_integer:
+        return negative + int_digits
+    # General shows at most 11 characters of a decimal number
+    sampled = _sample_rows(values, sample_size).astype(str).str.len().max()
+    return max(negative + int_digits, min(sampled, 11))
 
-            .dataTables_wrapper .dataTables_filter input,
-            .dataTables_wrapper .dataTables_length select,
-            .dataTables_wrapper .dataTables_info {
-                background-color: #444 !important; /* Dark background for inputs and dropdowns */
-                color: white !important; /* White text for input fields */
-            }
 
-            /* Change hover effect in dark mode */
-            tr:hover {
-                background-color: #636363 !important;
-            }
+def _excel_column_width(
+    series,
+    name,
+    num_format=None,
+    sample_size=EXCEL_WIDTH_SAMPLE_SIZE,
+    max_width=None,
+):
+    """
+    Estimate an Excel column width from dtype rules and a bounded sample of values.
 
-            /* Fix for "Show entries" and "Search" labels */
-            .dataTables_wrapper .dataTables_length label,
-            .dataTables_wrapper .dataTables_filter label {
-                color: #bdbdbd !important; /* Ensure labels like "Show entries" and "Search" are white */
-            }
-        }
-    </style>
-</head>
-<body style="margin:20px auto">
-    <div class="container">
-        <h1 style="padding:0; margin-top:0px"></h1>
-        <table id="myTable" class="table table-striped">
-            <thead>
-                <tr>
-"""
+    Numbers are sized from their min/max and number format, dates from their format,
+    categoricals from their categories and text from at most sample_size rows.
+    """
+    if pd.api.types.is_bool_dtype(series):
+        value_width = 5
+    elif pd.api.types.is_numeric_dtype(series):
+        value_width = _number_width(
+            series, num_format, pd.api.types.is_integer_dtype(series), sample_size
+        )
+    elif pd.api.types.is_datetime64_any_dtype(series):
+        value_width = len(num_format or "yyyy-mm-dd hh:mm:ss") if series.notna().any() else 0
+    elif isinstance(series.dtype, pd.CategoricalDtype):
+        categories = series.cat.categories
+        value_width = categories.astype(str).str.len().max() if len(categories) else 0
+    else:
+        sample = _sample_rows(series, sample_size).dropna()
+        value_width = sample.map(lambda value: len(str(value))).max() if len(sample) else 0
 
-    # Add table headers dynamically
-    for col in df.columns:
-        html_content += f"                    <th>{col}</th>\n"
-    html_content += "                </tr>\n"
-    html_content += "            </thead>\n"
-    html_content += "            <tbody>\n"
-
-    # Iterate over DataFrame rows
-    for _, row in df.iterrows():
-        html_content += "                <tr>\n"
-        for col in df.columns:
-            html_content += f"                    <td>{row[col]}</td>\n"
-        html_content += "                </tr>\n"
-
-    html_content += """
-            </tbody>
-        </table>
-    </div>
-</body>
-</html>
-"""
+    width = max(int(value_width), len(str(name) if name is not None else "")) + 2
+    return min(width, max_width or EXCEL_MAX_COLUMN_WIDTH)
 
-    return html_content
 
+def _write_excel_sheet(
+    workbook,
+    df,
+    sheet_name="df",
+    index=False,
+    start_row=1,
+    page_bg_color="#E0C9A6",
+    header_bg_color="#D4BC96",
+    data_bg_color="#D4BC96",
+    border_color="#50ABCD",
+    header_bold=True,
+    alignment="left",
+    data_bars=None,
+    report_headers=None,
+    column_formats=None,
+    width_sample_size=EXCEL_WIDTH_SAMPLE_SIZE,
+    max_column_width=None,
+    formats=None,
+):
+    """
+    Write one formatted DataFrame table into an xlsxwriter workbook.
 
-def generate_data_table_from_dataframe_text_dark(df):
-    html_content = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="utf-8">
-    <title>DataFrame Table</title>
-    <link href="../../../../assets/data_table/bootstrap.min.css" rel="stylesheet">
-    <script src="../../../../assets/data_table/jquery.min.js"></script>
-    <link rel="stylesheet" href="../../../../assets/data_table/jquery.dataTables.min.css">
-    <script type="text/javascript" src="../../../../assets/data_table/jquery.dataTables.min.js"></script>
-    <script type="text/javascript" src="../../../../assets/data_table/bootstrap.min.js"></script>
-    <script>
-        $(document).ready(function () {
-            $('#myTable').dataTable({
-                "pageLength": 100 /*load number of rows*/
-            });
-        });
-    </script>
-    <style>
-        /* Light mode styles */
-        body {
-            background-color: white;  /* Background outside the table */
-            color: black;
-        }
+    Every cell is written exactly once, row by row, with a typed writer and a format
+    resolved per column up front, so the workbook can run in constant_memory mode.
+    `df` may also be an iterable of DataFrame chunks; either way rows are converted
+    and written one slice at a time. Past Excel's row limit the table continues on
+    sheet_name_2, sheet_name_3, ... with the same header and formats.
+    `formats` caches formats across sheets of the same workbook.
 
-        table {
-            background-color: white;
-            color: black;
-        }
+    Returns the list of worksheets written.
+    """
+    formats = {} if formats is None else formats
 
-        th, td {
-            border: 1px solid #ddd;
-            background-color: white;
-            color: black;
-        }
+    base_props = {"border": 1, "border_color": border_color, "align": alignment}
+    page_format = _excel_format(workbook, formats, {"bg_color": page_bg_color})
+    border_format = _excel_format(
+        workbook, formats, {"border": 1, "border_color": border_color}
+    )
+    header_format = _excel_format(
+        workbook, formats, {**base_props, "bold": header_bold, "bg_color": header_bg_color}
+    )
+    data_props = {**base_props, "bg_color": data_bg_color}
+    data_format = _excel_format(workbook, formats, data_props)
+    header_cells = _report_header_cells(workbook, formats, report_headers, page_bg_color)
+
+    capacity = EXCEL_MAX_ROWS - start_row - 1
+    worksheets = []
+    worksheet = None
+    n_rows = 0
+    columns = widths = None
+
+    def finish_sheet(worksheet, n_rows):
+        # Report headers below the table
+        for cell in header_cells:
+            if cell[0] > start_row + n_rows:
+                worksheet.write(*cell)
+
+        # Apply page and border formats to all cells
+        last_col = len(columns)
+        for cell_format in (page_format, border_format):
+            worksheet.conditional_format(
+                0,
+                0,
+                min(start_row + n_rows + 2, EXCEL_MAX_ROWS - 1),
+                last_col,
+                {"type": "formula", "criteria": "TRUE", "format": cell_format},
+            )
 
-        /* Dark mode styles */
-        @media (prefers-color-scheme: dark) {
-            body {
-                background-color: #1e2129;  /* Dark mode background outside the table */
-                color: #e0e0e0;
-            }
+        # Apply filter
+        worksheet.autofilter(start_row, 0, start_row + n_rows, last_col - 1)
 
-            /* Optional: you can also target the container specifically if you want */
-            .container {
-                background-color: #1e2129; /* Dark mode container background */
-            }
+        # Hide columns beyond the last column with data
+        worksheet.set_column(last_col, 16383, None, None, {"hidden": True})
 
-            /* Table styles in dark mode */
-            table, .dataTables_wrapper {
-                background-color: #333 !important;
-                color: bdbdbd !important;
-            }
+        # Freeze top row at start_row + 1
+        worksheet.freeze_panes(start_row + 1, 0)
 
-            th, td {
-                border-color: #555;
-                background-color: #444 !important; /* Ensure all table cells have dark background */
-                color: #bdbdbd !important; /* Ensure all text in table is white */
-            }
+        # Turn off gridlines
+        worksheet.hide_gridlines(2)
 
-            /* DataTable plugin-specific styles */
-            .dataTables_wrapper .dataTables_paginate .paginate_button {
-                background-color: #444 !important; /* Dark background for pagination buttons */
-                color: bdbdbd !important; /* White text on pagination buttons */
-            }
+        # Apply data bars conditional formatting if specified
+        if data_bars:
+            for col_name, color_spec in data_bars.items():
+                if col_name in columns[1 if index else 0 :]:
+                    col_idx = columns.index(col_name, 1 if index else 0)
 
-            .dataTables_wrapper .dataTables_filter input,
-            .dataTables_wrapper .dataTables_length select,
-            .dataTables_wrapper .dataTables_info {
-                background-color: #444 !important; /* Dark background for inputs and dropdowns */
-                color: white !important; /* White text for input fields */
-            }
+                    # Determine colors for data bar
+                    if isinstance(color_spec, dict):
+                        min_color = color_spec.get("min_color", "#FFFFFF")
+                        max_color = color_spec.get("max_color", "#63C384")
+                    else:
+                        # Single color - create gradient from light to specified color
+                        min_color = "#FFFFFF"
+                        max_color = color_spec
+
+                    # Apply data bar formatting
+                    worksheet.conditional_format(
+                        start_row + 1,
+                        col_idx,
+                        start_row + n_rows,
+                        col_idx,
+                        {
+                            "type": "data_bar",
+                            "min_type": "min",
+                            "max_type": "max",
+                            "bar_color": max_color,
+                            "bar_only": False,
+                            "bar_solid": True,
+                            "bar_negative_color": min_color,
+                            "bar_negative_color_same": False,
+                            "bar_negative_border_color": min_color,
+                            "bar_border_color": max_color,
+                            "bar_direction": "left",
+                        },
+                    )
 
-            /* Change hover effect in dark mode */
-            tr:hover {
-                background-color: #636363 !important;
-            }
+    for chunk in _excel_chunks(df):
+        if columns is None:
+            columns = ([chunk.index.name or ""] if index else []) + list(chunk.columns)
 
-            /* Fix for "Show entries" and "Search" labels */
-            .dataTables_wrapper .dataTables_length label,
-            .dataTables_wrapper .dataTables_filter label {
-                color: #bdbdbd !important; /* Ensure labels like "Show entries" and "Search" are white */
-            }
-        }
-    </style>
-</head>
-<body style="margin:20px auto">
-    <div class="container">
-        <h1 style="padding:0; margin-top:0px"></h1>
-        <table id="myTable" class="table table-striped">
-            <thead>
-                <tr>
-"""
+        # Resolve values, writer, format and width per column once per slice
+        series_list = ([_excel_index_series(chunk)] if index else []) + [
+            chunk.iloc[:, i] for i in range(chunk.shape[1])
+        ]
+        names = ([None] if index else []) + list(chunk.columns)
+        values, writer_names, cell_formats, chunk_widths = [], [], [], []
+        for name, series in zip(names, series_list):
+            col_values, writer_name, num_format = _excel_column(series)
+            if column_formats and name in column_formats:
+                num_format = column_formats[name]
+            header = chunk.index.name if name is None else name
+            chunk_widths.append(
+                _excel_column_width(series, header, num_format, width_sample_size, max_column_width)
+            )
+            values.append(col_values)
+            writer_names.append(writer_name)
+            cell_formats.append(
+                _excel_format(workbook, formats, {**data_props, "num_format": num_format})
+                if num_format
+                else data_format
+            )
+        widths = chunk_widths if widths is None else list(map(max, widths, chunk_widths))
+
+        rows = list(zip(*values))
+        offset = 0
+        while offset < len(rows) or worksheet is None:
+            if worksheet is None or n_rows == capacity:
+                if worksheet is not None:
+                    finish_sheet(worksheet, n_rows)
+                worksheet = workbook.add_worksheet(
+                    _spill_sheet_name(sheet_name, len(worksheets) + 1)
+                )
+                worksheets.append(worksheet)
+                n_rows = 0
+
+                # constant_memory flushes a row once a later row is started, so
+                # everything is written in row order: report headers first
+                pending = 0
+                while pending < len(header_cells) and header_cells[pending][0] <= start_row:
+                    worksheet.write(*header_cells[pending])
+                    pending += 1
+
+                # Write header with format at start_row
+                for col_num, value in enumerate(columns):
+                    worksheet.write(start_row, col_num, value, header_format)
+
+            writers = [getattr(worksheet, writer_name) for writer_name in writer_names]
+            write_blank = worksheet.write_blank
+            take = min(capacity - n_rows, len(rows) - offset)
+
+            # Write data cells starting at start_row + 1
+            excel_row = start_row + n_rows
+            for row in rows[offset : offset + take]:
+                excel_row += 1
+                while pending < len(header_cells) and header_cells[pending][0] <= excel_row:
+                    worksheet.write(*header_cells[pending])
+                    pending += 1
+                for col_num, value in enumerate(row):
+                    if value is None:
+                        write_blank(excel_row, col_num, None, cell_formats[col_num])
+                    else:
+                        writers[col_num](excel_row, col_num, value, cell_formats[col_num])
+            n_rows += take
+            offset += take
 
-    # Add table headers dynamically
-    for col in df.columns:
-        html_content += f"                    <th>{col}</th>\n"
-    html_content += "                </tr>\n"
-    html_content += "            </thead>\n"
-    html_content += "            <tbody>\n"
-
-    # Iterate over DataFrame rows
-    for _, row in df.iterrows():
-        html_content += "                <tr>\n"
-        for col in df.columns:
-            html_content += f"                    <td>{row[col]}</td>\n"
-        html_content += "                </tr>\n"
-
-    html_content += """
-            </tbody>
-        </table>
-    </div>
-</body>
-</html>
-"""
+    if worksheet is not None:
+        finish_sheet(worksheet, n_rows)
 
-    return html_content
+    # Auto-adjust column width
+    if widths and index:
+        widths[0] = max(7, widths[0])
+    for worksheet in worksheets:
+        for col_num, width in enumerate(widths):
+            worksheet.set_column(col_num, col_num, width)
 
+    return worksheets
 
-# %% Dataframe to excel
 
+def _openpyxl_named_style(
+    wb, fill_color=None, border_color=None, alignment=None, bold=False, num_format=None
+):
+    """Register a table cell style in the workbook once and return its name."""
+    name = " ".join(
+        [
+            "dataframe_to_excel",
+            (fill_color or "none").lstrip("#"),
+            (border_color or "none").lstrip("#"),
+            alignment or "general",
+            "bold" if bold else "regular",
+            num_format or "General",
+        ]
+    )
+    if name not in wb.named_styles:
+        style = NamedStyle(name=name, number_format=num_format or "General")
+        style.font = Font(name="Calibri", size=11, bold=bold)
+        if fill_color:
+            style.fill = PatternFill(
+                start_color=fill_color.lstrip("#"),
+                end_color=fill_color.lstrip("#"),
+                fill_type="solid",
+            )
+        if border_color:
+            side = Side(style="thin", color=border_color.lstrip("#"))
+            style.border = Border(left=side, right=side, top=side, bottom=side)
+        if alignment:
+            style.alignment = Alignment(horizontal=alignment)
+        wb.add_named_style(style)
+    return name
 
-def dataframe_to_excel_no_formatting(
+
+def _append_excel_sheet(
+    wb,
     df,
-    out_file=None,
     sheet_name="df",
     index=False,
-    open_file=None,
     start_row=1,
     page_bg_color="#E0C9A6",
     header_bg_color="#D4BC96",
@@ -1187,91 +1388,66 @@ def dataframe_to_excel_no_formatting(
     alignment="left",
     data_bars=None,
     report_headers=None,
+    column_formats=None,
+    width_sample_size=EXCEL_WIDTH_SAMPLE_SIZE,
+    max_column_width=None,
 ):
     """
-    Export DataFrame to Excel with customizable formatting.
+    Add one formatted DataFrame table to a workbook loaded with openpyxl.
 
-    Parameters:
-    -----------
-    df : DataFrame
-        The DataFrame to export
-    out_file : str or Path, optional
-        Output file path. Defaults to a temp location if None
-    sheet_name : str, default "df"
-        Name of the Excel sheet
-    index : bool, default False
-        Whether to include the DataFrame index
-    open_file : bool, optional
-        Whether to open the file after creation
-    start_row : int, default 1
-        Starting row for the data (0-indexed). Headers will be at start_row, data at start_row+1
-    page_bg_color : str, default "#E0C9A6"
-        Background color for the entire page
-    header_bg_color : str, default "#D4BC96"
-        Background color for header cells
-    data_bg_color : str, default "#D4BC96"
-        Background color for data cells
-    border_color : str, default "#50ABCD"
-        Color for cell borders
-    header_bold : bool, default True
-        Whether to make header text bold
-    alignment : str, default "left"
-        Text alignment for cells ("left", "center", "right")
-    data_bars : dict, optional
-        Dictionary mapping column names to data bar colors for conditional formatting.
-        Format: {'column_name': 'color'} or {'column_name': {'min_color': '#...', 'max_color': '#...'}}
-        Examples:
-        - {'Sales': '#63C384'} - Single color gradient (light to dark)
-        - {'Revenue': {'min_color': '#FFFFFF', 'max_color': '#FF0000'}} - Two-color gradient
-    report_headers : dict, optional
-        Dictionary or list of dictionaries for report header rows above the data table.
-        Format as dict: {'A1': 'Report name', 'B1': 'First report', 'A2': 'Date', 'B2': '15-11-2025'}
-        Format as list: [
-            {'cell': 'A1', 'value': 'Report name', 'bold': True, 'font_size': 14},
-            {'cell': 'B1', 'value': 'First report'},
-            {'cell': 'A2', 'value': 'Date'},
-            {'cell': 'B2', 'value': '15-11-2025'}
-        ]
-        List format supports additional styling: 'bold', 'font_size', 'color', 'bg_color'
-    """
-    if out_file is None:
-        out_file = Path("C:/my_disk/____tmp/dataframe_to_excel_no_formatting.xlsx")
+    Rows are appended to a regular worksheet as WriteOnlyCell objects that carry
+    registered named styles, so no fill, border or alignment objects are built per
+    cell. `df` may also be an iterable of DataFrame chunks; rows are converted and
+    appended one slice at a time. Past Excel's row limit the table continues on
+    sheet_name_2, sheet_name_3, ... with the same header and styles.
 
-    out_file = Path(out_file)
-    file_exists = out_file.exists()
+    Returns the list of worksheets written.
+    """
+    page_fill = PatternFill(
+        start_color=page_bg_color.lstrip("#"),
+        end_color=page_bg_color.lstrip("#"),
+        fill_type="solid",
+    )
+    page_style = _openpyxl_named_style(wb, page_bg_color)
+    header_style = _openpyxl_named_style(
+        wb, header_bg_color, border_color, alignment, header_bold
+    )
 
-    if file_exists:
-        # Load existing workbook and add new sheet
-        wb = openpyxl.load_workbook(out_file)
+    capacity = EXCEL_MAX_ROWS - start_row - 1
+    header_row = start_row + 1  # Convert to 1-indexed
+    worksheets = []
+    ws = None
+    n_rows = 0
+    header_values = widths = None
 
-        # Remove sheet if it already exists
-        if sheet_name in wb.sheetnames:
-            del wb[sheet_name]
+    def styled_row(ws, row_values, row_styles):
+        cells = []
+        for value, style in zip(row_values, row_styles):
+            cell = WriteOnlyCell(ws, value=value)
+            cell.style = style
+            cells.append(cell)
+        return cells
 
-        ws = wb.create_sheet(sheet_name)
+    def start_sheet(number):
+        name = _spill_sheet_name(sheet_name, number)
 
-        # Define styles with custom colors
-        header_fill = PatternFill(
-            start_color=header_bg_color.lstrip("#"),
-            end_color=header_bg_color.lstrip("#"),
-            fill_type="solid",
-        )
-        data_fill = PatternFill(
-            start_color=data_bg_color.lstrip("#"),
-            end_color=data_bg_color.lstrip("#"),
-            fill_type="solid",
-        )
-        page_fill = PatternFill(
-            start_color=page_bg_color.lstrip("#"),
-            end_color=page_bg_color.lstrip("#"),
-            fill_type="solid",
-        )
-        border_style = Border(
-            left=Side(style="thin", color=border_color.lstrip("#")),
-            right=Side(style="thin", color=border_color.lstrip("#")),
-            top=Side(style="thin", color=border_color.lstrip("#")),
-            bottom=Side(style="thin", color=border_color.lstrip("#")),
+        # Remove sheet if it already exists
+        if name in wb.sheetnames:
+            del wb[name]
+        ws = wb.create_sheet(name)
+
+        # Page background above the table, then the header row at start_row
+        for _ in range(start_row):
+            ws.append(styled_row(ws, page_row, page_styles))
+        ws.append(
+            styled_row(ws, header_values + [None], [header_style] * last_col + [page_style])
         )
+        return ws
+
+    def finish_sheet(ws, n_rows):
+        # Page background below the table: two extra rows
+        for _ in range(min(2, EXCEL_MAX_ROWS - header_row - n_rows)):
+            ws.append(styled_row(ws, page_row, page_styles))
 
         # Write report headers if provided
         if report_headers:
@@ -1284,81 +1460,27 @@ def dataframe_to_excel_no_formatting(
             elif isinstance(report_headers, list):
                 # Advanced list format with styling options
                 for header_item in report_headers:
-                    cell_ref = header_item.get("cell")
-                    value = header_item.get("value")
-                    cell = ws[cell_ref]
-                    cell.value = value
-
-                    # Apply custom styling if provided
-                    if header_item.get("bold", False):
-                        cell.font = Font(
-                            bold=True,
-                            size=header_item.get("font_size", 11),
-                            color=header_item.get("color", "000000").lstrip("#"),
-                        )
-                    else:
-                        cell.font = Font(
-                            size=header_item.get("font_size", 11),
-                            color=header_item.get("color", "000000").lstrip("#"),
-                        )
+                    cell = ws[header_item.get("cell")]
+                    cell.value = header_item.get("value")
+                    cell.font = Font(
+                        bold=header_item.get("bold", False),
+                        size=header_item.get("font_size", 11),
+                        color=header_item.get("color", "000000").lstrip("#"),
+                    )
 
                     # Apply background color if specified
-                    if "bg_color" in header_item:
-                        cell.fill = PatternFill(
-                            start_color=header_item["bg_color"].lstrip("#"),
-                            end_color=header_item["bg_color"].lstrip("#"),
-                            fill_type="solid",
-                        )
-                    else:
-                        cell.fill = page_fill
-
-        # Apply page background
-        for row in range(1, start_row + len(df) + 3):
-            for col in range(1, len(df.columns) + 2):
-                ws.cell(row, col).fill = page_fill
-
-        # Write headers at start_row
-        header_row = start_row + 1  # Convert to 1-indexed
-        start_col = 2 if index else 1
-
-        for col_num, value in enumerate(df.columns, start=start_col):
-            cell = ws.cell(header_row, col_num, value)
-            cell.font = Font(bold=header_bold)
-            cell.fill = header_fill
-            cell.border = border_style
-            cell.alignment = Alignment(horizontal=alignment)
-
-        if index:
-            cell = ws.cell(header_row, 1, df.index.name if df.index.name else "")
-            cell.font = Font(bold=header_bold)
-            cell.fill = header_fill
-            cell.border = border_style
-            cell.alignment = Alignment(horizontal=alignment)
-
-        # Write data starting at start_row + 1
-        for row_num, (idx_val, row) in enumerate(df.iterrows(), start=header_row + 1):
-            if index:
-                # Convert complex types to string for index
-                if isinstance(idx_val, (list, tuple, dict)):
-                    idx_val = str(idx_val)
-                cell = ws.cell(row_num, 1, idx_val)
-                cell.fill = data_fill
-                cell.border = border_style
-                cell.alignment = Alignment(horizontal=alignment)
-
-            for col_num, value in enumerate(row, start=start_col):
-                # Convert complex types to string
-                if isinstance(value, (list, tuple, dict)):
-                    value = str(value)
-                cell = ws.cell(row_num, col_num, value)
-                cell.fill = data_fill
-                cell.border = border_style
-                cell.alignment = Alignment(horizontal=alignment)
+                    bg_color = header_item.get("bg_color", page_bg_color)
+                    cell.fill = PatternFill(
+                        start_color=bg_color.lstrip("#"),
+                        end_color=bg_color.lstrip("#"),
+                        fill_type="solid",
+                    )
 
         # Apply autofilter
-        last_data_row = header_row + len(df)
-        last_data_col = len(df.columns) + (1 if index else 0)
-        ws.auto_filter.ref = f"A{header_row}:{openpyxl.utils.get_column_letter(last_data_col)}{last_data_row}"
+        last_data_row = header_row + n_rows
+        ws.auto_filter.ref = (
+            f"A{header_row}:{openpyxl.utils.get_column_letter(last_col)}{last_data_row}"
+        )
 
         # Freeze top row at start_row
         ws.freeze_panes = f"A{header_row + 1}"
@@ -1366,41 +1488,26 @@ def dataframe_to_excel_no_formatting(
         # Hide gridlines
         ws.sheet_view.showGridLines = False
 
-        # Auto-adjust column widths
-        for idx, column in enumerate(df.columns, start=start_col):
-            series = df[column]
-            max_len = max(series.astype(str).map(len).max(), len(str(column))) + 2
-            ws.column_dimensions[openpyxl.utils.get_column_letter(idx)].width = max_len
-
-        if index:
-            ws.column_dimensions["A"].width = (
-                max(7, len(str(df.index.name)) + 2) if df.index.name else 7
-            )
-
-        # Hide columns beyond the last column with data
-        last_col_num = len(df.columns) + (1 if index else 0)
-        for col_idx in range(last_col_num + 1, 16385):
-            col_letter = openpyxl.utils.get_column_letter(col_idx)
-            ws.column_dimensions[col_letter].hidden = True
+        # Hide columns beyond the last column with data, as a single column range
+        first_hidden = openpyxl.utils.get_column_letter(last_col + 1)
+        ws.column_dimensions[first_hidden] = ColumnDimension(
+            ws, index=first_hidden, min=last_col + 1, max=16384, hidden=True
+        )
 
         # Apply data bars conditional formatting if specified
         if data_bars:
             from openpyxl.formatting.rule import DataBarRule
 
             for col_name, color_spec in data_bars.items():
-                if col_name in df.columns:
-                    col_idx = list(df.columns).index(col_name) + (1 if index else 0) + 1
+                if col_name in header_values[1 if index else 0 :]:
+                    col_idx = header_values.index(col_name, 1 if index else 0) + 1
                     col_letter = openpyxl.utils.get_column_letter(col_idx)
 
                     # Determine colors for data bar
                     if isinstance(color_spec, dict):
-                        min_color = color_spec.get("min_color", "#FFFFFF").lstrip("#")
                         max_color = color_spec.get("max_color", "#63C384").lstrip("#")
                     else:
-                        # Single color - create gradient from light to specified color
                         max_color = color_spec.lstrip("#")
-                        # Create a lighter version for min_color
-                        min_color = "FFFFFF"
 
                     # Create data bar rule
                     data_bar_rule = DataBarRule(
@@ -1413,204 +1520,502 @@ def dataframe_to_excel_no_formatting(
                     )
 
                     # Apply to data range (excluding header)
-                    data_range = f"{col_letter}{header_row + 1}:{col_letter}{header_row + len(df)}"
+                    data_range = f"{col_letter}{header_row + 1}:{col_letter}{last_data_row}"
                     ws.conditional_formatting.add(data_range, data_bar_rule)
 
-        wb.save(out_file)
+    for chunk in _excel_chunks(df):
+        if header_values is None:
+            header_values = ([chunk.index.name or ""] if index else []) + list(chunk.columns)
+            last_col = len(header_values)
+            page_row = [None] * (last_col + 1)
+            page_styles = [page_style] * (last_col + 1)
 
-    else:
-        # Create new workbook with xlsxwriter
-        with pd.ExcelWriter(out_file, engine="xlsxwriter") as writer:
-            df.to_excel(
-                writer,
-                sheet_name=sheet_name,
-                index=index,
-                startrow=start_row + 1,
-                header=False,
+        # Resolve values, style and width per column once per slice
+        columns = ([_excel_index_series(chunk)] if index else []) + [
+            chunk.iloc[:, i] for i in range(chunk.shape[1])
+        ]
+        names = ([None] if index else []) + list(chunk.columns)
+        values, styles, chunk_widths = [], [], []
+        for name, series in zip(names, columns):
+            col_values, num_format = _excel_column_values(series)
+            if column_formats and name in column_formats:
+                num_format = column_formats[name]
+            header = chunk.index.name if name is None else name
+            chunk_widths.append(
+                _excel_column_width(series, header, num_format, width_sample_size, max_column_width)
+            )
+            if series.dtype == object:
+                # Convert complex types to string
+                col_values = [
+                    str(value) if isinstance(value, (list, tuple, dict)) else value
+                    for value in col_values
+                ]
+            values.append(col_values)
+            styles.append(
+                _openpyxl_named_style(
+                    wb, data_bg_color, border_color, alignment, num_format=num_format
+                )
+            )
+        widths = chunk_widths if widths is None else list(map(max, widths, chunk_widths))
+        row_styles = styles + [page_style]
+
+        rows = list(zip(*values))
+        offset = 0
+        while offset < len(rows) or ws is None:
+            if ws is None or n_rows == capacity:
+                if ws is not None:
+                    finish_sheet(ws, n_rows)
+                ws = start_sheet(len(worksheets) + 1)
+                worksheets.append(ws)
+                n_rows = 0
+
+            take = min(capacity - n_rows, len(rows) - offset)
+            for row in rows[offset : offset + take]:
+                ws.append(styled_row(ws, row + (None,), row_styles))
+            n_rows += take
+            offset += take
+
+    if ws is not None:
+        finish_sheet(ws, n_rows)
+
+    # Auto-adjust column widths
+    if widths and index:
+        widths[0] = max(7, widths[0])
+    for ws in worksheets:
+        for col_num, width in enumerate(widths, start=1):
+            ws.column_dimensions[openpyxl.utils.get_column_letter(col_num)].width = width
+
+    return worksheets
+
+
+## Relationship and content types used when splicing a worksheet into an xlsx package
+XLSX_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+XLSX_WORKSHEET_TYPE = XLSX_REL_NS + "/worksheet"
+XLSX_WORKSHEET_CONTENT_TYPE = (
+    "application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"
+)
+
+## styles.xml sections merged when splicing, with the element each one lists
+XLSX_STYLE_SECTIONS = {
+    "numFmts": "numFmt",
+    "fonts": "font",
+    "fills": "fill",
+    "borders": "border",
+    "cellXfs": "xf",
+    "dxfs": "dxf",
+}
+
+
+def _xml_section(xml, tag):
+    """Return (start, end, inner) of the first <tag> element, or None when it is missing."""
+    match = re.search(rf"<{tag}\b[^>]*?(?:/>|>(.*?)</{tag}>)", xml, re.S)
+    if match is None:
+        return None
+    return match.start(), match.end(), match.group(1) or ""
+
+
+def _xml_section_inner(xml, tag):
+    """Return the inner XML of the first <tag> element ('' when it is missing)."""
+    section = _xml_section(xml, tag)
+    return section[2] if section else ""
+
+
+def _merge_excel_styles(target, source):
+    """
+    Append the entries of a source styles.xml to a target styles.xml.
+
+    Returns the merged XML and the offsets to add to the source's cell format (s=)
+    and differential format (dxfId=) indexes.
+    """
+    for tag in ("fonts", "fills", "borders", "cellXfs"):
+        if _xml_section(target, tag) is None:
+            raise ValueError(f"styles.xml has no <{tag}> section")
+
+    # Source entries are appended, so their indexes shift by the target's counts
+    offsets = {
+        tag: len(re.findall(rf"<{child}\b", _xml_section_inner(target, tag)))
+        for tag, child in XLSX_STYLE_SECTIONS.items()
+    }
+
+    # Custom number formats get fresh ids above the target's own
+    target_ids = re.findall(r'numFmtId="(\d+)"', _xml_section_inner(target, "numFmts"))
+    next_id = max([int(i) for i in target_ids] + [163]) + 1
+    num_fmt_map = {}
+    for old_id in re.findall(r'numFmtId="(\d+)"', _xml_section_inner(source, "numFmts")):
+        num_fmt_map[old_id] = str(next_id)
+        next_id += 1
+
+    id_sections = {"fontId": "fonts", "fillId": "fills", "borderId": "borders"}
+
+    def remap(match):
+        attr, value = match.groups()
+        if attr == "numFmtId":
+            value = num_fmt_map.get(value, value)
+        else:
+            value = str(int(value) + offsets[id_sections[attr]])
+        return f'{attr}="{value}"'
+
+    # Rewrite sections back to front so earlier positions stay valid
+    for tag in reversed(XLSX_STYLE_SECTIONS):
+        addition = re.sub(
+            r'\b(numFmtId|fontId|fillId|borderId)="(\d+)"',
+            remap,
+            _xml_section_inner(source, tag),
+        )
+        if not addition:
+            continue
+
+        section = _xml_section(target, tag)
+        if section is not None:
+            start, end, inner = section
+        else:
+            # Only numFmts and dxfs are optional; place them where the schema expects
+            if tag == "numFmts":
+                start = target.index(">", target.index("<styleSheet")) + 1
+            else:
+                start = next(
+                    (
+                        target.index(f"<{after}")
+                        for after in ("tableStyles", "colors", "extLst")
+                        if f"<{after}" in target
+                    ),
+                    target.index("</styleSheet>"),
+                )
+            end, inner = start, ""
+
+        inner += addition
+        count = len(re.findall(rf"<{XLSX_STYLE_SECTIONS[tag]}\b", inner))
+        target = target[:start] + f'<{tag} count="{count}">{inner}</{tag}>' + target[end:]
+
+    return target, offsets["cellXfs"], offsets["dxfs"]
+
+
+def _copy_zip_member(zin, info, zout):
+    """Copy one member from zin to zout, keeping its name, timestamp and attributes."""
+    copied = zipfile.ZipInfo(info.filename, info.date_time)
+    copied.compress_type = info.compress_type
+    copied.create_system = info.create_system
+    copied.external_attr = info.external_attr
+    with zin.open(info) as src, zout.open(
+        copied, "w", force_zip64=info.file_size > zipfile.ZIP64_LIMIT
+    ) as dst:
+        shutil.copyfileobj(src, dst, 1024**2)
+
+
+def _stream_sheet_xml(src, dst, xf_offset, dxf_offset, chunk_size=16 * 1024**2):
+    """Copy worksheet XML from src to dst, shifting style indexes into the merged styles.xml."""
+    style_pattern = re.compile(
+        rb'(<(?:c|row)\b[^>]*?\bs="|<col\b[^>]*?\bstyle="|<cfRule\b[^>]*?\bdxfId=")(\d+)"'
+    )
+
+    def shift_style(match):
+        offset = dxf_offset if match.group(1).startswith(b"<cfRule") else xf_offset
+        return match.group(1) + str(int(match.group(2)) + offset).encode() + b'"'
+
+    # xlsxwriter numbers data bar ids per workbook; they must be unique in the target
+    guid_prefix = ("{" + str(uuid.uuid4())[:18].upper() + "-").encode()
+
+    pending = b""
+    first = True
+    while True:
+        chunk = src.read(chunk_size)
+        data = pending + chunk
+        # Cut after the last '>' so no tag or text node is split across chunks
+        cut = data.rfind(b">") + 1 if chunk else len(data)
+        data, pending = data[:cut], data[cut:]
+        if first:
+            # Only the workbook's active sheet should be selected
+            data = re.sub(rb'(<sheetView\b[^>]*?) tabSelected="1"', rb"\1", data, count=1)
+            first = False
+        data = style_pattern.sub(shift_style, data)
+        dst.write(data.replace(b"{DA7ABA51-AAAA-BBBB-", guid_prefix))
+        if not chunk:
+            break
+
+
+def _xlsx_sheet_names(workbook_xml):
+    """Sheet names listed in a workbook.xml, in tab order."""
+    return [
+        unescape(name, {"&quot;": '"'})
+        for name in re.findall(r'<sheet\b[^>]*?\bname="([^"]*)"', workbook_xml)
+    ]
+
+
+def _splice_excel_sheets(zin, zsheet, zout):
+    """Write zin plus every worksheet of the xlsxwriter workbook zsheet to zout."""
+    names = set(zin.namelist())
+    workbook_xml = zin.read("xl/workbook.xml").decode("utf-8")
+    rels_xml = zin.read("xl/_rels/workbook.xml.rels").decode("utf-8")
+    content_types = zin.read("[Content_Types].xml").decode("utf-8")
+    if "</sheets>" not in workbook_xml or "</Relationships>" not in rels_xml:
+        raise ValueError("unexpected workbook.xml layout")
+
+    source_workbook_xml = zsheet.read("xl/workbook.xml").decode("utf-8")
+    rel_ids = set(re.findall(r'\bId="([^"]+)"', rels_xml))
+    sheet_ids = [int(i) for i in re.findall(r'<sheet\b[^>]*?\bsheetId="(\d+)"', workbook_xml)]
+    first_index = len(sheet_ids)
+    next_sheet_id = max(sheet_ids + [0]) + 1
+
+    # Register each sheet in the workbook, its rels and the content types
+    sheet_elements, relationships, overrides, sheet_parts = "", "", "", []
+    sheet_number = rel_number = 1
+    for sheet_name in _xlsx_sheet_names(source_workbook_xml):
+        while f"xl/worksheets/sheet{sheet_number}.xml" in names:
+            sheet_number += 1
+        while f"rId{rel_number}" in rel_ids:
+            rel_number += 1
+        sheet_part = f"xl/worksheets/sheet{sheet_number}.xml"
+        rel_id = f"rId{rel_number}"
+        names.add(sheet_part)
+        rel_ids.add(rel_id)
+        sheet_parts.append((sheet_number, sheet_part))
+
+        sheet_elements += (
+            f'<sheet name={quoteattr(sheet_name)} sheetId="{next_sheet_id}" '
+            f'r:id="{rel_id}" xmlns:r="{XLSX_REL_NS}"/>'
+        )
+        relationships += (
+            f'<Relationship Id="{rel_id}" Type="{XLSX_WORKSHEET_TYPE}" '
+            f'Target="/{sheet_part}"/>'
+        )
+        overrides += (
+            f'<Override PartName="/{sheet_part}" '
+            f'ContentType="{XLSX_WORKSHEET_CONTENT_TYPE}"/>'
+        )
+        next_sheet_id += 1
+
+    workbook_xml = workbook_xml.replace("</sheets>", sheet_elements + "</sheets>", 1)
+    rels_xml = rels_xml.replace("</Relationships>", relationships + "</Relationships>", 1)
+    content_types = content_types.replace("</Types>", overrides + "</Types>", 1)
+
+    # Defined names (the autofilter ranges) point at the new sheets' positions
+    defined_names = re.sub(
+        r'localSheetId="(\d+)"',
+        lambda match: f'localSheetId="{first_index + int(match.group(1))}"',
+        "".join(re.findall(r"<definedName\b.*?</definedName>", source_workbook_xml, re.S)),
+    )
+    if defined_names and "</definedNames>" in workbook_xml:
+        workbook_xml = workbook_xml.replace(
+            "</definedNames>", defined_names + "</definedNames>", 1
+        )
+    elif defined_names:
+        position = max(
+            workbook_xml.find(tag) + len(tag)
+            for tag in ("</sheets>", "</functionGroups>", "</externalReferences>")
+            if tag in workbook_xml
+        )
+        workbook_xml = (
+            workbook_xml[:position]
+            + f"<definedNames>{defined_names}</definedNames>"
+            + workbook_xml[position:]
+        )
+
+    styles_xml, xf_offset, dxf_offset = _merge_excel_styles(
+        zin.read("xl/styles.xml").decode("utf-8"),
+        zsheet.read("xl/styles.xml").decode("utf-8"),
+    )
+    rewritten = {
+        "xl/workbook.xml": workbook_xml,
+        "xl/_rels/workbook.xml.rels": rels_xml,
+        "[Content_Types].xml": content_types,
+        "xl/styles.xml": styles_xml,
+    }
+
+    # Every other part is copied unchanged
+    for info in zin.infolist():
+        if info.filename in rewritten:
+            zout.writestr(info.filename, rewritten[info.filename])
+        else:
+            _copy_zip_member(zin, info, zout)
+
+    for source_number, (sheet_number, sheet_part) in enumerate(sheet_parts, start=1):
+        source_part = f"xl/worksheets/sheet{source_number}.xml"
+        sheet_info = zipfile.ZipInfo(sheet_part, datetime.now().timetuple()[:6])
+        sheet_info.compress_type = zipfile.ZIP_DEFLATED
+        sheet_size = zsheet.getinfo(source_part).file_size
+        with zsheet.open(source_part) as src, zout.open(
+            sheet_info, "w", force_zip64=sheet_size > 1024**3
+        ) as dst:
+            _stream_sheet_xml(src, dst, xf_offset, dxf_offset)
+
+        sheet_rels = f"xl/worksheets/_rels/sheet{source_number}.xml.rels"
+        if sheet_rels in zsheet.namelist():
+            zout.writestr(
+                f"xl/worksheets/_rels/sheet{sheet_number}.xml.rels", zsheet.read(sheet_rels)
             )
 
-            workbook = writer.book
-            worksheet = writer.sheets[sheet_name]
 
-            # Set formats with custom colors
-            page_format = workbook.add_format({"bg_color": page_bg_color})
+def _check_splice_target(zin):
+    """Raise KeyError or ValueError if zin is not an xlsx package _splice_excel_sheets can edit."""
+    for part, closing_tag in (
+        ("xl/workbook.xml", "</sheets>"),
+        ("xl/_rels/workbook.xml.rels", "</Relationships>"),
+        ("[Content_Types].xml", "</Types>"),
+    ):
+        if closing_tag not in zin.read(part).decode("utf-8"):
+            raise ValueError(f"unexpected {part} layout")
+    _merge_excel_styles(zin.read("xl/styles.xml").decode("utf-8"), "")
 
-            border_format = workbook.add_format(
-                {"border": 1, "border_color": border_color}
-            )
 
-            header_format = workbook.add_format(
-                {
-                    "bold": header_bold,
-                    "border": 1,
-                    "border_color": border_color,
-                    "bg_color": header_bg_color,
-                    "align": alignment,
-                }
-            )
+def _inject_excel_sheet(out_file, df, sheet_name="df", **sheet_kwargs):
+    """
+    Add a formatted DataFrame sheet to an existing xlsx without loading its other sheets.
 
-            data_format = workbook.add_format(
-                {
-                    "bg_color": data_bg_color,
-                    "border": 1,
-                    "border_color": border_color,
-                    "align": alignment,
-                }
-            )
+    The sheet (plus any sheets it spills over to) is written to a scratch workbook with
+    xlsxwriter and spliced into the package: workbook.xml, its rels, the content types
+    and styles.xml are edited as text, and every other part is copied over unchanged.
 
-            # Write report headers if provided
-            if report_headers:
-                if isinstance(report_headers, dict):
-                    # Simple dict format: {'A1': 'value', 'B1': 'value'}
-                    for cell_ref, value in report_headers.items():
-                        # Parse cell reference (e.g., 'A1' -> row=0, col=0)
-                        col_letter = "".join(filter(str.isalpha, cell_ref))
-                        row_num = int("".join(filter(str.isdigit, cell_ref))) - 1
-                        col_num = (
-                            openpyxl.utils.column_index_from_string(col_letter) - 1
-                        )
-
-                        header_text_format = workbook.add_format(
-                            {"bg_color": page_bg_color}
-                        )
-                        worksheet.write(row_num, col_num, value, header_text_format)
-
-                elif isinstance(report_headers, list):
-                    # Advanced list format with styling options
-                    for header_item in report_headers:
-                        cell_ref = header_item.get("cell")
-                        value = header_item.get("value")
-
-                        # Parse cell reference
-                        col_letter = "".join(filter(str.isalpha, cell_ref))
-                        row_num = int("".join(filter(str.isdigit, cell_ref))) - 1
-                        col_num = (
-                            openpyxl.utils.column_index_from_string(col_letter) - 1
-                        )
-
-                        # Create custom format for this header
-                        format_props = {
-                            "bg_color": header_item.get("bg_color", page_bg_color),
-                            "font_size": header_item.get("font_size", 11),
-                            "font_color": header_item.get("color", "#000000"),
-                        }
-                        if header_item.get("bold", False):
-                            format_props["bold"] = True
-
-                        custom_format = workbook.add_format(format_props)
-                        worksheet.write(row_num, col_num, value, custom_format)
-
-            # Apply page format to all cells
-            worksheet.conditional_format(
-                0,
-                0,
-                start_row + len(df) + 2,
-                len(df.columns) + (1 if index else 0),
-                {"type": "formula", "criteria": "TRUE", "format": page_format},
-            )
+    Returns False, before reading any of df, when the sheet already exists or the
+    package is not laid out the way Excel, openpyxl and xlsxwriter write it; the
+    caller can then still write df another way.
+    """
+    out_file = Path(out_file)
+    try:
+        with zipfile.ZipFile(out_file) as zin:
+            _check_splice_target(zin)
+            existing = {
+                name.lower()
+                for name in _xlsx_sheet_names(zin.read("xl/workbook.xml").decode("utf-8"))
+            }
+    except (KeyError, ValueError, zipfile.BadZipFile):
+        return False
+    if sheet_name.lower() in existing:
+        return False
 
-            # Write header with format at start_row
-            for col_num, value in enumerate(df.columns):
-                worksheet.write(
-                    start_row, col_num + (1 if index else 0), value, header_format
-                )
-            if index:
-                worksheet.write(
-                    start_row, 0, df.index.name if df.index.name else "", header_format
-                )
+    with tempfile.TemporaryDirectory(dir=out_file.parent) as tmp_dir:
+        sheet_file = Path(tmp_dir) / "sheet.xlsx"
+        workbook = xlsxwriter.Workbook(sheet_file, EXCEL_WORKBOOK_OPTIONS)
+        worksheets = _write_excel_sheet(workbook, df, sheet_name, **sheet_kwargs)
+        workbook.close()
 
-            # Format data cells starting at start_row + 1
-            for row_num, row in df.iterrows():
-                excel_row = start_row + 1 + row_num
-                if index:
-                    # Convert complex types to string for index
-                    idx_value = row.name
-                    if isinstance(idx_value, (list, tuple, dict)):
-                        idx_value = str(idx_value)
-                    worksheet.write(excel_row, 0, idx_value, data_format)
-                for col_num, value in enumerate(row):
-                    # Convert complex types to string
-                    if isinstance(value, (list, tuple, dict)):
-                        value = str(value)
-                    worksheet.write(
-                        excel_row, col_num + (1 if index else 0), value, data_format
-                    )
+        # Chunks may already be consumed here, so clashing spill-over sheets are an error
+        clashes = [ws.name for ws in worksheets if ws.name.lower() in existing]
+        if clashes:
+            raise ValueError(f"Sheets {clashes} already exist in {out_file.name}")
 
-            # Apply border format to all cells
-            worksheet.conditional_format(
-                0,
-                0,
-                start_row + len(df) + 2,
-                len(df.columns) + (1 if index else 0),
-                {"type": "formula", "criteria": "TRUE", "format": border_format},
-            )
+        spliced_file = Path(tmp_dir) / out_file.name
+        with zipfile.ZipFile(out_file) as zin, zipfile.ZipFile(
+            sheet_file
+        ) as zsheet, zipfile.ZipFile(spliced_file, "w", zipfile.ZIP_DEFLATED) as zout:
+            _splice_excel_sheets(zin, zsheet, zout)
+
+        os.replace(spliced_file, out_file)
+    return True
 
-            # Apply filter
-            worksheet.autofilter(
-                start_row,
-                0,
-                start_row + len(df),
-                len(df.columns) + (1 if index else 0) - 1,
-            )
 
-            # Hide columns beyond the last column with data
-            last_col_num = len(df.columns) + (1 if index else 0)
-            worksheet.set_column(last_col_num, 16383, None, None, {"hidden": True})
+def dataframe_to_excel_no_formatting(
+    df,
+    out_file=None,
+    sheet_name="df",
+    index=False,
+    open_file=None,
+    start_row=1,
+    page_bg_color="#E0C9A6",
+    header_bg_color="#D4BC96",
+    data_bg_color="#D4BC96",
+    border_color="#50ABCD",
+    header_bold=True,
+    alignment="left",
+    data_bars=None,
+    report_headers=None,
+    inject_sheet=False,
+    width_sample_size=EXCEL_WIDTH_SAMPLE_SIZE,
+    max_column_width=None,
+):
+    """
+    Export DataFrame to Excel with customizable formatting.
 
-            # Freeze top row at start_row + 1
-            worksheet.freeze_panes(start_row + 1, 0)
+    Parameters:
+    -----------
+    df : DataFrame or iterable of DataFrame
+        The DataFrame to export, or its chunks (e.g. pd.read_csv(..., chunksize=...))
+        which are written as they arrive. Rows beyond Excel's 1,048,576 row limit
+        spill over to sheets named sheet_name_2, sheet_name_3, ...
+    out_file : str or Path, optional
+        Output file path. Defaults to a temp location if None
+    sheet_name : str, default "df"
+        Name of the Excel sheet
+    index : bool, default False
+        Whether to include the DataFrame index
+    open_file : bool, optional
+        Whether to open the file after creation
+    start_row : int, default 1
+        Starting row for the data (0-indexed). Headers will be at start_row, data at start_row+1
+    page_bg_color : str, default "#E0C9A6"
+        Background color for the entire page
+    header_bg_color : str, default "#D4BC96"
+        Background color for header cells
+    data_bg_color : str, default "#D4BC96"
+        Background color for data cells
+    border_color : str, default "#50ABCD"
+        Color for cell borders
+    header_bold : bool, default True
+        Whether to make header text bold
+    alignment : str, default "left"
+        Text alignment for cells ("left", "center", "right")
+    data_bars : dict, optional
+        Dictionary mapping column names to data bar colors for conditional formatting.
+        Format: {'column_name': 'color'} or {'column_name': {'min_color': '#...', 'max_color': '#...'}}
+        Examples:
+        - {'Sales': '#63C384'} - Single color gradient (light to dark)
+        - {'Revenue': {'min_color': '#FFFFFF', 'max_color': '#FF0000'}} - Two-color gradient
+    report_headers : dict, optional
+        Dictionary or list of dictionaries for report header rows above the data table.
+        Format as dict: {'A1': 'Report name', 'B1': 'First report', 'A2': 'Date', 'B2': '15-11-2025'}
+        Format as list: [
+            {'cell': 'A1', 'value': 'Report name', 'bold': True, 'font_size': 14},
+            {'cell': 'B1', 'value': 'First report'},
+            {'cell': 'A2', 'value': 'Date'},
+            {'cell': 'B2', 'value': '15-11-2025'}
+        ]
+        List format supports additional styling: 'bold', 'font_size', 'color', 'bg_color'
+    inject_sheet : bool, default False
+        When out_file exists, write the new sheet on its own and splice it into the
+        xlsx package instead of loading and re-saving every existing sheet, so the
+        cost scales with the new sheet only. Falls back to the regular path when the
+        sheet already exists or the file is not a standard xlsx package.
+    width_sample_size : int, default EXCEL_WIDTH_SAMPLE_SIZE
+        Rows sampled (head, tail and random middle) to size text columns. Numeric,
+        date and categorical widths come from dtype rules without a sample.
+    max_column_width : int, optional
+        Cap on auto-fitted column widths. Defaults to Excel's maximum of 255
+    """
+    if out_file is None:
+        out_file = Path("C:/my_disk/____tmp/dataframe_to_excel_no_formatting.xlsx")
 
-            # Turn off gridlines
-            worksheet.hide_gridlines(2)
+    out_file = Path(out_file)
+    file_exists = out_file.exists()
+    sheet_kwargs = dict(
+        sheet_name=sheet_name,
+        index=index,
+        start_row=start_row,
+        page_bg_color=page_bg_color,
+        header_bg_color=header_bg_color,
+        data_bg_color=data_bg_color,
+        border_color=border_color,
+        header_bold=header_bold,
+        alignment=alignment,
+        data_bars=data_bars,
+        report_headers=report_headers,
+        width_sample_size=width_sample_size,
+        max_column_width=max_column_width,
+    )
 
-            # Auto-adjust column width
-            for idx, column in enumerate(df.columns):
-                series = df[column]
-                max_len = max(series.astype(str).map(len).max(), len(str(column))) + 2
-                worksheet.set_column(
-                    idx + (1 if index else 0), idx + (1 if index else 0), max_len
-                )
+    if file_exists and inject_sheet and _inject_excel_sheet(out_file, df, **sheet_kwargs):
+        # Spliced into the existing package without touching the other sheets
+        pass
 
-            if index:
-                worksheet.set_column(
-                    0, 0, max(7, len(str(df.index.name)) + 2) if df.index.name else 7
-                )
+    elif file_exists:
+        # Add the sheet to the existing workbook
+        wb = openpyxl.load_workbook(out_file)
+        _append_excel_sheet(wb, df, **sheet_kwargs)
+        wb.save(out_file)
 
-            # Apply data bars conditional formatting if specified
-            if data_bars:
-                for col_name, color_spec in data_bars.items():
-                    if col_name in df.columns:
-                        col_idx = list(df.columns).index(col_name) + (1 if index else 0)
-
-                        # Determine colors for data bar
-                        if isinstance(color_spec, dict):
-                            min_color = color_spec.get("min_color", "#FFFFFF")
-                            max_color = color_spec.get("max_color", "#63C384")
-                        else:
-                            # Single color - create gradient from light to specified color
-                            min_color = "#FFFFFF"
-                            max_color = color_spec
-
-                        # Apply data bar formatting
-                        worksheet.conditional_format(
-                            start_row + 1,
-                            col_idx,
-                            start_row + len(df),
-                            col_idx,
-                            {
-                                "type": "data_bar",
-                                "min_type": "min",
-                                "max_type": "max",
-                                "bar_color": max_color,
-                                "bar_only": False,
-                                "bar_solid": True,
-                                "bar_negative_color": min_color,
-                                "bar_negative_color_same": False,
-                                "bar_negative_border_color": min_color,
-                                "bar_border_color": max_color,
-                                "bar_direction": "left",
-                            },
-                        )
+    else:
+        # Create new workbook with xlsxwriter, streaming rows in constant_memory mode
+        workbook = xlsxwriter.Workbook(out_file, EXCEL_WORKBOOK_OPTIONS)
+        _write_excel_sheet(workbook, df, **sheet_kwargs)
+        workbook.close()
 
     if open_file:
         open_file_folder(out_file)
@@ -1691,14 +2096,19 @@ def dataframe_to_excel(
     data_bars=None,
     report_headers=None,
     column_formats=None,
+    inject_sheet=False,
+    width_sample_size=EXCEL_WIDTH_SAMPLE_SIZE,
+    max_column_width=None,
 ):
     """
     Export DataFrame to Excel with customizable formatting.
 
     Parameters:
     -----------
-    df : DataFrame
-        The DataFrame to export
+    df : DataFrame or iterable of DataFrame
+        The DataFrame to export, or its chunks (e.g. pd.read_csv(..., chunksize=...))
+        which are written as they arrive. Rows beyond Excel's 1,048,576 row limit
+        spill over to sheets named sheet_name_2, sheet_name_3, ...
     out_file : str or Path, optional
         Output file path. Defaults to a temp location if None
     sheet_name : str, default "df"
@@ -1749,409 +2159,54 @@ def dataframe_to_excel(
         - '@' - Text format
         Examples:
         - {'Support': '0.0%', 'sum_A': '#,##0', 'Revenue': '$#,##0.00'}
+    inject_sheet : bool, default False
+        When out_file exists, write the new sheet on its own and splice it into the
+        xlsx package instead of loading and re-saving every existing sheet, so the
+        cost scales with the new sheet only. Falls back to the regular path when the
+        sheet already exists or the file is not a standard xlsx package.
+    width_sample_size : int, default EXCEL_WIDTH_SAMPLE_SIZE
+        Rows sampled (head, tail and random middle) to size text columns. Numeric,
+        date and categorical widths come from dtype rules without a sample.
+    max_column_width : int, optional
+        Cap on auto-fitted column widths. Defaults to Excel's maximum of 255
     """
     if out_file is None:
         out_file = Path("C:/my_disk/____tmp/dataframe_to_excel.xlsx")
 
     out_file = Path(out_file)
     file_exists = out_file.exists()
+    sheet_kwargs = dict(
+        sheet_name=sheet_name,
+        index=index,
+        start_row=start_row,
+        page_bg_color=page_bg_color,
+        header_bg_color=header_bg_color,
+        data_bg_color=data_bg_color,
+        border_color=border_color,
+        header_bold=header_bold,
+        alignment=alignment,
+        data_bars=data_bars,
+        report_headers=report_headers,
+        column_formats=column_formats,
+        width_sample_size=width_sample_size,
+        max_column_width=max_column_width,
+    )
 
-    if file_exists:
-        # Load existing workbook and add new sheet
-        wb = openpyxl.load_workbook(out_file)
-
-        # Remove sheet if it already exists
-        if sheet_name in wb.sheetnames:
-            del wb[sheet_name]
-
-        ws = wb.create_sheet(sheet_name)
-
-        # Define styles with custom colors
-        header_fill = PatternFill(
-            start_color=header_bg_color.lstrip("#"),
-            end_color=header_bg_color.lstrip("#"),
-            fill_type="solid",
-        )
-        data_fill = PatternFill(
-            start_color=data_bg_color.lstrip("#"),
-            end_color=data_bg_color.lstrip("#"),
-            fill_type="solid",
-        )
-        page_fill = PatternFill(
-            start_color=page_bg_color.lstrip("#"),
-            end_color=page_bg_color.lstrip("#"),
-            fill_type="solid",
-        )
-        border_style = Border(
-            left=Side(style="thin", color=border_color.lstrip("#")),
-            right=Side(style="thin", color=border_color.lstrip("#")),
-            top=Side(style="thin", color=border_color.lstrip("#")),
-            bottom=Side(style="thin", color=border_color.lstrip("#")),
-        )
-
-        # Write report headers if provided
-        if report_headers:
-            if isinstance(report_headers, dict):
-                # Simple dict format: {'A1': 'value', 'B1': 'value'}
-                for cell_ref, value in report_headers.items():
-                    cell = ws[cell_ref]
-                    cell.value = value
-                    cell.fill = page_fill
-            elif isinstance(report_headers, list):
-                # Advanced list format with styling options
-                for header_item in report_headers:
-                    cell_ref = header_item.get("cell")
-                    value = header_item.get("value")
-                    cell = ws[cell_ref]
-                    cell.value = value
-
-                    # Apply custom styling if provided
-                    if header_item.get("bold", False):
-                        cell.font = Font(
-                            bold=True,
-                            size=header_item.get("font_size", 11),
-                            color=header_item.get("color", "000000").lstrip("#"),
-                        )
-                    else:
-                        cell.font = Font(
-                            size=header_item.get("font_size", 11),
-                            color=header_item.get("color", "000000").lstrip("#"),
-                        )
-
-                    # Apply background color if specified
-                    if "bg_color" in header_item:
-                        cell.fill = PatternFill(
-                            start_color=header_item["bg_color"].lstrip("#"),
-                            end_color=header_item["bg_color"].lstrip("#"),
-                            fill_type="solid",
-                        )
-                    else:
-                        cell.fill = page_fill
-
-        # Apply page background
-        for row in range(1, start_row + len(df) + 3):
-            for col in range(1, len(df.columns) + 2):
-                ws.cell(row, col).fill = page_fill
-
-        # Write headers at start_row
-        header_row = start_row + 1  # Convert to 1-indexed
-        start_col = 2 if index else 1
-
-        for col_num, value in enumerate(df.columns, start=start_col):
-            cell = ws.cell(header_row, col_num, value)
-            cell.font = Font(bold=header_bold)
-            cell.fill = header_fill
-            cell.border = border_style
-            cell.alignment = Alignment(horizontal=alignment)
-
-        if index:
-            cell = ws.cell(header_row, 1, df.index.name if df.index.name else "")
-            cell.font = Font(bold=header_bold)
-            cell.fill = header_fill
-            cell.border = border_style
-            cell.alignment = Alignment(horizontal=alignment)
-
-        # Write data starting at start_row + 1
-        for row_num, (idx_val, row) in enumerate(df.iterrows(), start=header_row + 1):
-            if index:
-                # Convert complex types to string for index
-                if isinstance(idx_val, (list, tuple, dict)):
-                    idx_val = str(idx_val)
-                cell = ws.cell(row_num, 1, idx_val)
-                cell.fill = data_fill
-                cell.border = border_style
-                cell.alignment = Alignment(horizontal=alignment)
-
-            for col_num, (col_name, value) in enumerate(zip(df.columns, row), start=start_col):
-                # Convert complex types to string
-                if isinstance(value, (list, tuple, dict)):
-                    value = str(value)
-                cell = ws.cell(row_num, col_num, value)
-                cell.fill = data_fill
-                cell.border = border_style
-                cell.alignment = Alignment(horizontal=alignment)
-                
-                # Apply custom number format if specified
-                if column_formats and col_name in column_formats:
-                    cell.number_format = column_formats[col_name]
-
-        # Apply autofilter
-        last_data_row = header_row + len(df)
-        last_data_col = len(df.columns) + (1 if index else 0)
-        ws.auto_filter.ref = f"A{header_row}:{openpyxl.utils.get_column_letter(last_data_col)}{last_data_row}"
-
-        # Freeze top row at start_row
-        ws.freeze_panes = f"A{header_row + 1}"
-
-        # Hide gridlines
-        ws.sheet_view.showGridLines = False
-
-        # Auto-adjust column widths
-        for idx, column in enumerate(df.columns, start=start_col):
-            series = df[column]
-            max_len = max(series.astype(str).map(len).max(), len(str(column))) + 2
-            ws.column_dimensions[openpyxl.utils.get_column_letter(idx)].width = max_len
-
-        if index:
-            ws.column_dimensions["A"].width = (
-                max(7, len(str(df.index.name)) + 2) if df.index.name else 7
-            )
-
-        # Hide columns beyond the last column with data
-        last_col_num = len(df.columns) + (1 if index else 0)
-        for col_idx in range(last_col_num + 1, 16385):
-            col_letter = openpyxl.utils.get_column_letter(col_idx)
-            ws.column_dimensions[col_letter].hidden = True
-
-        # Apply data bars conditional formatting if specified
-        if data_bars:
-            from openpyxl.formatting.rule import DataBarRule
-
-            for col_name, color_spec in data_bars.items():
-                if col_name in df.columns:
-                    col_idx = list(df.columns).index(col_name) + (1 if index else 0) + 1
-                    col_letter = openpyxl.utils.get_column_letter(col_idx)
-
-                    # Determine colors for data bar
-                    if isinstance(color_spec, dict):
-                        min_color = color_spec.get("min_color", "#FFFFFF").lstrip("#")
-                        max_color = color_spec.get("max_color", "#63C384").lstrip("#")
-                    else:
-                        # Single color - create gradient from light to specified color
-                        max_color = color_spec.lstrip("#")
-                        # Create a lighter version for min_color
-                        min_color = "FFFFFF"
-
-                    # Create data bar rule
-                    data_bar_rule = DataBarRule(
-                        start_type="min",
-                        end_type="max",
-                        color=max_color,
-                        showValue=True,
-                        minLength=0,
-                        maxLength=100,
-                    )
-
-                    # Apply to data range (excluding header)
-                    data_range = f"{col_letter}{header_row + 1}:{col_letter}{header_row + len(df)}"
-                    ws.conditional_formatting.add(data_range, data_bar_rule)
+    if file_exists and inject_sheet and _inject_excel_sheet(out_file, df, **sheet_kwargs):
+        # Spliced into the existing package without touching the other sheets
+        pass
 
+    elif file_exists:
+        # Add the sheet to the existing workbook
+        wb = openpyxl.load_workbook(out_file)
+        _append_excel_sheet(wb, df, **sheet_kwargs)
         wb.save(out_file)
 
     else:
-        # Create new workbook with xlsxwriter
-        with pd.ExcelWriter(out_file, engine="xlsxwriter") as writer:
-            df.to_excel(
-                writer,
-                sheet_name=sheet_name,
-                index=index,
-                startrow=start_row + 1,
-                header=False,
-            )
-
-            workbook = writer.book
-            worksheet = writer.sheets[sheet_name]
-
-            # Set formats with custom colors
-            page_format = workbook.add_format({"bg_color": page_bg_color})
-
-            border_format = workbook.add_format(
-                {"border": 1, "border_color": border_color}
-            )
-
-            header_format = workbook.add_format(
-                {
-                    "bold": header_bold,
-                    "border": 1,
-                    "border_color": border_color,
-                    "bg_color": header_bg_color,
-                    "align": alignment,
-                }
-            )
-
-            data_format = workbook.add_format(
-                {
-                    "bg_color": data_bg_color,
-                    "border": 1,
-                    "border_color": border_color,
-                    "align": alignment,
-                }
-            )
-
-            # Create custom formats for columns with specific formatting
-            column_format_objects = {}
-            if column_formats:
-                for col_name, fmt_string in column_formats.items():
-                    column_format_objects[col_name] = workbook.add_format(
-                        {
-                            "bg_color": data_bg_color,
-                            "border": 1,
-                            "border_color": border_color,
-                            "align": alignment,
-                            "num_format": fmt_string,
-                        }
-                    )
-
-            # Write report headers if provided
-            if report_headers:
-                if isinstance(report_headers, dict):
-                    # Simple dict format: {'A1': 'value', 'B1': 'value'}
-                    for cell_ref, value in report_headers.items():
-                        # Parse cell reference (e.g., 'A1' -> row=0, col=0)
-                        col_letter = "".join(filter(str.isalpha, cell_ref))
-                        row_num = int("".join(filter(str.isdigit, cell_ref))) - 1
-                        col_num = (
-                            openpyxl.utils.column_index_from_string(col_letter) - 1
-                        )
-
-                        header_text_format = workbook.add_format(
-                            {"bg_color": page_bg_color}
-                        )
-                        worksheet.write(row_num, col_num, value, header_text_format)
-
-                elif isinstance(report_headers, list):
-                    # Advanced list format with styling options
-                    for header_item in report_headers:
-                        cell_ref = header_item.get("cell")
-                        value = header_item.get("value")
-
-                        # Parse cell reference
-                        col_letter = "".join(filter(str.isalpha, cell_ref))
-                        row_num = int("".join(filter(str.isdigit, cell_ref))) - 1
-                        col_num = (
-                            openpyxl.utils.column_index_from_string(col_letter) - 1
-                        )
-
-                        # Create custom format for this header
-                        format_props = {
-                            "bg_color": header_item.get("bg_color", page_bg_color),
-                            "font_size": header_item.get("font_size", 11),
-                            "font_color": header_item.get("color", "#000000"),
-                        }
-                        if header_item.get("bold", False):
-                            format_props["bold"] = True
-
-                        custom_format = workbook.add_format(format_props)
-                        worksheet.write(row_num, col_num, value, custom_format)
-
-            # Apply page format to all cells
-            worksheet.conditional_format(
-                0,
-                0,
-                start_row + len(df) + 2,
-                len(df.columns) + (1 if index else 0),
-                {"type": "formula", "criteria": "TRUE", "format": page_format},
-            )
-
-            # Write header with format at start_row
-            for col_num, value in enumerate(df.columns):
-                worksheet.write(
-                    start_row, col_num + (1 if index else 0), value, header_format
-                )
-            if index:
-                worksheet.write(
-                    start_row, 0, df.index.name if df.index.name else "", header_format
-                )
-
-            # Format data cells starting at start_row + 1
-            for row_num, row in df.iterrows():
-                excel_row = start_row + 1 + row_num
-                if index:
-                    # Convert complex types to string for index
-                    idx_value = row.name
-                    if isinstance(idx_value, (list, tuple, dict)):
-                        idx_value = str(idx_value)
-                    worksheet.write(excel_row, 0, idx_value, data_format)
-                for col_num, (col_name, value) in enumerate(zip(df.columns, row)):
-                    # Convert complex types to string
-                    if isinstance(value, (list, tuple, dict)):
-                        value = str(value)
-                    
-                    # Use custom format if specified for this column
-                    if column_formats and col_name in column_formats:
-                        cell_format = column_format_objects[col_name]
-                    else:
-                        cell_format = data_format
-                    
-                    worksheet.write(
-                        excel_row, col_num + (1 if index else 0), value, cell_format
-                    )
-
-            # Apply border format to all cells
-            worksheet.conditional_format(
-                0,
-                0,
-                start_row + len(df) + 2,
-                len(df.columns) + (1 if index else 0),
-                {"type": "formula", "criteria": "TRUE", "format": border_format},
-            )
-
-            # Apply filter
-            worksheet.autofilter(
-                start_row,
-                0,
-                start_row + len(df),
-                len(df.columns) + (1 if index else 0) - 1,
-            )
-
-            # Hide columns beyond the last column with data
-            last_col_num = len(df.columns) + (1 if index else 0)
-            worksheet.set_column(last_col_num, 16383, None, None, {"hidden": True})
-
-            # Freeze top row at start_row + 1
-            worksheet.freeze_panes(start_row + 1, 0)
-
-            # Turn off gridlines
-            worksheet.hide_gridlines(2)
-
-            # Auto-adjust column width
-            for idx, column in enumerate(df.columns):
-                series = df[column]
-                max_len = max(series.astype(str).map(len).max(), len(str(column))) + 2
-                worksheet.set_column(
-                    idx + (1 if index else 0), idx + (1 if index else 0), max_len
-                )
-
-            if index:
-                worksheet.set_column(
-                    0, 0, max(7, len(str(df.index.name)) + 2) if df.index.name else 7
-                )
-
-            # Apply data bars conditional formatting if specified
-            if data_bars:
-                for col_name, color_spec in data_bars.items():
-                    if col_name in df.columns:
-                        col_idx = list(df.columns).index(col_name) + (1 if index else 0)
-
-                        # Determine colors for data bar
-                        if isinstance(color_spec, dict):
-                            min_color = color_spec.get("min_color", "#FFFFFF")
-                            max_color = color_spec.get("max_color", "#63C384")
-                        else:
-                            # Single color - create gradient from light to specified color
-                            min_color = "#FFFFFF"
-                            max_color = color_spec
-
-                        # Apply data bar formatting
-                        worksheet.conditional_format(
-                            start_row + 1,
-                            col_idx,
-                            start_row + len(df),
-                            col_idx,
-                            {
-                                "type": "data_bar",
-                                "min_type": "min",
-                                "max_type": "max",
-                                "bar_color": max_color,
-                                "bar_only": False,
-                                "bar_solid": True,
-                                "bar_negative_color": min_color,
-                                "bar_negative_color_same": False,
-                                "bar_negative_border_color": min_color,
-                                "bar_border_color": max_color,
-                                "bar_direction": "left",
-                            },
-                        )
+        # Create new workbook with xlsxwriter, streaming rows in constant_memory mode
+        workbook = xlsxwriter.Workbook(out_file, EXCEL_WORKBOOK_OPTIONS)
+        _write_excel_sheet(workbook, df, **sheet_kwargs)
+        workbook.close()
 
     if open_file:
         open_file_folder(out_file)
@@ -2205,3 +2260,185 @@ if __name__ == "__main__":
 
 
 
+
+
+def dataframes_to_excel(sheets, out_file=None, open_file=None, **sheet_options):
+    """
+    Export several DataFrames to one Excel workbook in a single pass.
+
+    All sheets are streamed through one xlsxwriter session that shares its cell
+    formats, instead of re-loading and re-saving the growing file once per sheet.
+
+    Parameters:
+    -----------
+    sheets : dict
+        Mapping of sheet name to a DataFrame, or to a (DataFrame, options) tuple where
+        options holds dataframe_to_excel formatting arguments for that sheet only
+        (index, start_row, colors, report_headers, data_bars, column_formats, ...)
+    out_file : str or Path, optional
+        Output file path, replaced if it exists. Defaults to a temp location if None
+    open_file : bool, optional
+        Whether to open the file after creation
+    **sheet_options
+        Formatting arguments applied to every sheet; per-sheet options take precedence
+
+    Examples:
+    ---------
+    dataframes_to_excel(
+        {
+            "summary": (summary_df, {"column_formats": {"Share": "0.0%"}}),
+            "detail": detail_df,
+        },
+        "report.xlsx",
+        header_bg_color="#4472C4",
+    )
+    """
+    if out_file is None:
+        out_file = Path("C:/my_disk/____tmp/dataframes_to_excel.xlsx")
+
+    out_file = Path(out_file)
+    workbook = xlsxwriter.Workbook(out_file, EXCEL_WORKBOOK_OPTIONS)
+    formats = {}
+    try:
+        for sheet_name, sheet in sheets.items():
+            df, options = sheet if isinstance(sheet, tuple) else (sheet, {})
+            _write_excel_sheet(
+                workbook,
+                df,
+                sheet_name=sheet_name,
+                formats=formats,
+                **{**sheet_options, **options},
+            )
+    finally:
+        workbook.close()
+
+    if open_file:
+        open_file_folder(out_file)
+
+
+def _render_report_job(job):
+    """Load and write one report-pack job; runs in a worker process."""
+    started = time.perf_counter()
+    options = dict(job)
+    data = options.pop("df")
+    out_file = options.pop("out_file")
+    options.pop("open_file", None)
+    try:
+        if callable(data):
+            data = data()
+        if isinstance(data, dict):
+            dataframes_to_excel(data, out_file, **options)
+            rows = sum(
+                len(sheet[0] if isinstance(sheet, tuple) else sheet) for sheet in data.values()
+            )
+        else:
+            dataframe_to_excel(data, out_file, **options)
+            rows = len(data) if isinstance(data, pd.DataFrame) else None
+        error = None
+    except Exception as e:
+        rows = None
+        error = f"{type(e).__name__}: {e}\n{traceback.format_exc(limit=-3)}"
+    return rows, time.perf_counter() - started, error
+
+
+def export_report_pack(jobs, max_workers=None, open_folder=None):
+    """
+    Render many formatted workbooks in parallel on a process pool.
+
+    Each job is written by dataframe_to_excel (or dataframes_to_excel for several
+    sheets) in its own worker process. Progress and per-job timings are printed as
+    jobs finish, and a failing job is reported without stopping the others.
+
+    Parameters:
+    -----------
+    jobs : list of dict
+        One dict per workbook with keys:
+        - "df": DataFrame, dict of sheets as accepted by dataframes_to_excel, or a
+          callable returning either. Callables are loaded inside the worker, which
+          avoids sending the data between processes; they must be picklable
+          (module-level functions or functools.partial of them)
+        - "out_file": output file path
+        - any other dataframe_to_excel / dataframes_to_excel formatting argument
+    max_workers : int, optional
+        Number of worker processes. Defaults to the number of CPUs if None
+    open_folder : bool, optional
+        Whether to open the folder of the first output file when done
+
+    Returns:
+    --------
+    DataFrame
+        One row per job, in job order, with columns out_file, status ("ok" or
+        "failed"), rows, seconds and error
+
+    Notes:
+    ------
+    On Windows the worker processes re-import the calling script, so call this
+    from under an ``if __name__ == "__main__":`` guard.
+
+    Examples:
+    ---------
+    from functools import partial
+
+    jobs = [
+        {
+            "df": partial(load_territory, territory),
+            "out_file": f"reports/{territory}.xlsx",
+            "column_formats": {"Sales": "#,##0"},
+        }
+        for territory in territories
+    ]
+    summary = export_report_pack(jobs, max_workers=8)
+    """
+    jobs = list(jobs)
+    results = [None] * len(jobs)
+    started = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(_render_report_job, job): i for i, job in enumerate(jobs)}
+        for done, future in enumerate(as_completed(futures), start=1):
+            i = futures[future]
+            try:
+                rows, seconds, error = future.result()
+            except Exception as e:
+                # The job could not be sent to or run in a worker (e.g. not picklable)
+                rows, seconds, error = None, None, f"{type(e).__name__}: {e}"
+            results[i] = {
+                "out_file": str(jobs[i]["out_file"]),
+                "status": "failed" if error else "ok",
+                "rows": rows,
+                "seconds": seconds,
+                "error": error,
+            }
+            name = Path(jobs[i]["out_file"]).name
+            if error:
+                print(f"[{done}/{len(jobs)}] FAILED {name}: {error.splitlines()[0]}")
+            else:
+                print(f"[{done}/{len(jobs)}] {name} ({seconds:.1f}s)")
+
+    summary = pd.DataFrame(
+        results, columns=["out_file", "status", "rows", "seconds", "error"]
+    )
+    summary["rows"] = summary["rows"].astype("Int64")
+    failed = (summary["status"] == "failed").sum()
+    print(
+        f"Report pack: {len(jobs) - failed} written, {failed} failed "
+        f"in {time.perf_counter() - started:.1f}s"
+    )
+
+    if open_folder and jobs:
+        open_file_folder(Path(jobs[0]["out_file"]).parent)
+
+    return summary
+
+
+if __name__ == "__main__":
+    df = pd.DataFrame({"Item": ["A", "B", "C"], "Share": [0.5, 0.3, 0.2]})
+
+    dataframes_to_excel(
+        {
+            "summary": (df, {"column_formats": {"Share": "0.0%"}, "data_bars": {"Share": "#63C384"}}),
+            "detail": df,
+        },
+        "report_pack.xlsx",
+        header_bg_color="#4472C4",
+    )
@@ -1,12 +1,281 @@
 # %% Import functions
 
 ## Dependencies
+import hashlib
+import io
+import os
+import re
+import struct
+import tempfile
+import threading
+import time
 import zipfile
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from fnmatch import fnmatchcase
+from pathlib import Path
+import numpy as np
 import pandas as pd
 import json
-from youtube_transcript_api import YouTubeTranscriptApi
+from youtube_transcript_api import (
+    AgeRestricted,
+    InvalidVideoId,
+    NoTranscriptFound,
+    TranscriptsDisabled,
+    VideoUnavailable,
+    VideoUnplayable,
+    YouTubeTranscriptApi,
+)
 import subprocess as sp
 
+
+# %% Zip archive handles
+
+## Pool of open archives, keyed by resolved path, mtime and size
+ZIP_ARCHIVE_POOL_SIZE = 8
+_zip_archive_pool = OrderedDict()
+_zip_archive_pool_lock = threading.Lock()
+
+
+class ZipArchive:
+    """
+    Open zip archive whose central directory is parsed once and reused for many member reads.
+
+    Pass an instance wherever an import_*_within_zip function expects `zip_filename`,
+    or use it as a context manager to control when the file is released.
+
+    Parameters:
+    - zip_filename (str or Path): Path to the zip file.
+    """
+
+    def __init__(self, zip_filename):
+        self.path = Path(zip_filename).resolve()
+        stat = os.stat(self.path)
+        self.key = (str(self.path), stat.st_mtime_ns, stat.st_size)
+        self.zf = zipfile.ZipFile(self.path)
+        self._lock = threading.Lock()
+
+    def _zipfile(self):
+        """The open ZipFile, reopened if the archive was closed while still held."""
+        with self._lock:
+            if self.zf.fp is None:
+                self.zf = zipfile.ZipFile(self.path)
+            return self.zf
+
+    def open(self, filename):
+        """Open a member for reading (a new stream per call)."""
+        return self._zipfile().open(filename)
+
+    def namelist(self):
+        return self._zipfile().namelist()
+
+    def infolist(self):
+        return self._zipfile().infolist()
+
+    def getinfo(self, filename):
+        return self._zipfile().getinfo(filename)
+
+    def data_offset(self, filename):
+        """Byte offset of a member's raw (possibly compressed) data within the archive file."""
+        info = self.getinfo(filename)
+        with open(self.path, "rb") as f:
+            f.seek(info.header_offset)
+            header = f.read(30)
+        if header[:4] != b"PK\x03\x04":
+            raise zipfile.BadZipFile(f"Bad local header for '{filename}' in '{self.path}'")
+        # Local header: 30 fixed bytes, then the file name and extra field
+        name_length, extra_length = struct.unpack("<HH", header[26:30])
+        return info.header_offset + 30 + name_length + extra_length
+
+    def close(self):
+        self.zf.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __repr__(self):
+        return f"ZipArchive('{self.path}', members={len(self.zf.filelist)})"
+
+
+def get_zip_archive(zip_filename):
+    """
+    Return a pooled ZipArchive for the given path, reusing the parsed central directory.
+
+    The pool holds up to ZIP_ARCHIVE_POOL_SIZE archives in least-recently-used order.
+    A handle is reopened when the archive's mtime or size changes on disk. Handles
+    dropped from the pool are not closed, since callers may still hold them; their
+    file is released once the last reference goes away.
+    ZipArchive instances are returned unchanged.
+
+    Parameters:
+    - zip_filename (str, Path or ZipArchive): Path to the zip file or an open archive.
+
+    Returns:
+    - ZipArchive: Open archive handle.
+    """
+    if isinstance(zip_filename, ZipArchive):
+        return zip_filename
+
+    path = Path(zip_filename).resolve()
+    stat = os.stat(path)
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+
+    with _zip_archive_pool_lock:
+        archive = _zip_archive_pool.get(str(path))
+        if archive is not None and archive.key == key:
+            _zip_archive_pool.move_to_end(str(path))
+            return archive
+
+        # Archive changed on disk (or never opened): the stale handle is only dropped
+        archive = ZipArchive(path)
+        _zip_archive_pool[str(path)] = archive
+        while len(_zip_archive_pool) > ZIP_ARCHIVE_POOL_SIZE:
+            _zip_archive_pool.popitem(last=False)
+
+    return archive
+
+
+def clear_zip_archive_pool():
+    """
+    Close every pooled archive (e.g. before deleting or moving the zip files).
+
+    Handles still held by callers reopen their archive on next use.
+    """
+    with _zip_archive_pool_lock:
+        while _zip_archive_pool:
+            _, archive = _zip_archive_pool.popitem()
+            archive.close()
+
+
+# %% Memory-optimal dtypes
+
+
+def downcast_dtypes(df, categorical_threshold=0.5, arrow_strings=False):
+    """
+    Shrink a DataFrame's memory footprint by choosing smaller dtypes per column.
+
+    - Integers are downcast to the smallest (unsigned) integer type that holds them.
+    - Floats become float32 only when every value survives the round trip exactly.
+    - String columns with few distinct values become categoricals; the rest
+      optionally become Arrow-backed strings.
+
+    Parameters:
+    - df (pd.DataFrame): DataFrame to optimize.
+    - categorical_threshold (float, optional): Maximum ratio of distinct values to rows
+      for a string column to become categorical. Default is 0.5.
+    - arrow_strings (bool, optional): Store remaining string columns as 'string[pyarrow]'. Default is False.
+
+    Returns:
+    - tuple: (optimized pd.DataFrame, pd.DataFrame report of bytes saved per column).
+    """
+    df = df.copy()
+    rows = []
+    for position in range(df.shape[1]):
+        series = df.iloc[:, position]
+        converted = series
+
+        if len(series) == 0 or pd.api.types.is_bool_dtype(series):
+            pass
+        elif pd.api.types.is_integer_dtype(series) and not isinstance(series.dtype, pd.api.extensions.ExtensionDtype):
+            downcast = "unsigned" if series.min() >= 0 else "integer"
+            converted = pd.to_numeric(series, downcast=downcast)
+        elif pd.api.types.is_float_dtype(series) and series.dtype == np.float64:
+            as_float32 = series.astype(np.float32)
+            if np.array_equal(as_float32.to_numpy(np.float64), series.to_numpy(), equal_nan=True):
+                converted = as_float32
+        elif (
+            series.dtype == object or pd.api.types.is_string_dtype(series)
+        ) and pd.api.types.infer_dtype(series, skipna=True) == "string":
+            if series.nunique(dropna=True) / len(series) <= categorical_threshold:
+                converted = series.astype("category")
+            elif arrow_strings:
+                converted = series.astype("string[pyarrow]")
+
+        if converted is not series:
+            df.isetitem(position, converted)
+
+        bytes_before = series.memory_usage(deep=True, index=False)
+        bytes_after = converted.memory_usage(deep=True, index=False)
+        rows.append(
+            {
+                "column": df.columns[position],
+                "dtype_before": str(series.dtype),
+                "dtype_after": str(converted.dtype),
+                "bytes_before": int(bytes_before),
+                "bytes_after": int(bytes_after),
+                "bytes_saved": int(bytes_before - bytes_after),
+            }
+        )
+
+    report = pd.DataFrame(
+        rows,
+        columns=["column", "dtype_before", "dtype_after", "bytes_before", "bytes_after", "bytes_saved"],
+    )
+    return df, report
+
+
+def _optimize_result(result, optimize_dtypes):
+    """
+    Apply downcast_dtypes to an import result when requested.
+
+    optimize_dtypes may be True or a dict of downcast_dtypes options. The per-column
+    report is kept as records in df.attrs['dtype_report']. Dicts of sheets and chunk
+    iterators are optimized frame by frame.
+    """
+    if not optimize_dtypes:
+        return result
+    options = optimize_dtypes if isinstance(optimize_dtypes, dict) else {}
+
+    if isinstance(result, pd.DataFrame):
+        df, report = downcast_dtypes(result, **options)
+        df.attrs["dtype_report"] = report.to_dict("records")
+        return df
+    if isinstance(result, dict):
+        return {key: _optimize_result(value, options or True) for key, value in result.items()}
+    if isinstance(result, pd.Series):
+        return result
+    return (_optimize_result(chunk, options or True) for chunk in result)
+
+
+# %% Import from zip
+
+
+def _csv_engine_kwargs(read_kwargs, engine, chunksize=None):
+    """Map engine='arrow' onto pandas' multi-threaded pyarrow parser, or fall back when it can't be used."""
+    if engine not in ("arrow", "pyarrow"):
+        return dict(read_kwargs, engine=engine) if engine else read_kwargs
+
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return read_kwargs
+
+    sep = read_kwargs.get("sep")
+    header = read_kwargs.get("header")
+    unsupported = (
+        chunksize
+        or read_kwargs.get("skipfooter")
+        or not isinstance(read_kwargs.get("skiprows") or 0, int)
+        or not (isinstance(sep, str) and len(sep) == 1)
+        or not (header is None or isinstance(header, int))
+        or callable(read_kwargs.get("usecols"))
+    )
+    if unsupported:
+        return read_kwargs
+    return dict(read_kwargs, engine="pyarrow")
+
+
+def _iter_csv_chunks_within_zip(zip_filename, filename, chunksize, read_kwargs):
+    """Yield DataFrames of at most `chunksize` rows straight from a zip member stream."""
+    archive = get_zip_archive(zip_filename)
+    with archive.open(filename) as file:
+        with pd.read_csv(file, chunksize=chunksize, **read_kwargs) as reader:
+            yield from reader
+
+
 def import_csv_within_zip(
     zip_filename,
     filename,
@@ -19,37 +288,66 @@ def import_csv_within_zip(
     index_col=0,
     skipfooter=0,
     names=None,
+    chunksize=None,
+    optimize_dtypes=False,
+    usecols=None,
+    dtype=None,
+    engine=None,
+    dtype_backend=None,
 ):
     """
     Import a CSV file within a zip archive with flexible options.
 
     Parameters:
-    - zip_filename (str): Path to the zip file.
+    - zip_filename (str or ZipArchive): Path to the zip file, or an open ZipArchive.
     - filename (str): Name of the CSV file within the zip archive.
     - sep (str, optional): Delimiter to use. Default is ','.
     - header (int, optional): Row number to use as column names. Default is 0.
     - parse_dates (list or None, optional): Columns to parse as dates. Default is None.
     - encoding (str or None, optional): Encoding to use. Default is None.
     - na_values (list or None, optional): Additional strings to recognize as NA/NaN. Default is None.
+    - chunksize (int or None, optional): If set, return an iterator of DataFrames with at most
+      this many rows each, streamed from the member without loading it whole. Default is None.
+    - optimize_dtypes (bool or dict, optional): Downcast dtypes to save memory (see downcast_dtypes);
+      the per-column report is stored in df.attrs['dtype_report']. Default is False.
+    - usecols (list or None, optional): Columns to read; the rest are never materialized. Default is None.
+    - dtype (type, str or dict, optional): Dtype for all or specific columns. Default is None.
+    - engine (str or None, optional): Parser engine. 'arrow' uses the multi-threaded pyarrow CSV reader
+      and falls back to the default engine for options it does not support (skipfooter, chunksize,
+      list skiprows, regex or sniffed separators) or when pyarrow is not installed. Default is None.
+    - dtype_backend (str or None, optional): 'pyarrow' for Arrow-backed columns or 'numpy_nullable'.
+      Default is None (NumPy dtypes).
 
     Returns:
-    - pd.DataFrame: DataFrame containing the CSV data.
-    """
-    with zipfile.ZipFile(zip_filename) as zf:
-        with zf.open(filename) as file:
-            df = pd.read_csv(
-                file,
-                sep=sep,
-                header=header,
-                parse_dates=parse_dates,
-                encoding=encoding,
-                na_values=na_values,
-                skiprows=skiprows,
-                index_col=index_col,
-                skipfooter=skipfooter,
-                names=names,
-            )
-    return df
+    - pd.DataFrame (or an iterator of DataFrames when chunksize is set): DataFrame containing the CSV data.
+    """
+    read_kwargs = dict(
+        sep=sep,
+        header=header,
+        parse_dates=parse_dates,
+        encoding=encoding,
+        na_values=na_values,
+        skiprows=skiprows,
+        index_col=index_col,
+        skipfooter=skipfooter,
+        names=names,
+        usecols=usecols,
+        dtype=dtype,
+    )
+    if dtype_backend:
+        read_kwargs["dtype_backend"] = dtype_backend
+    read_kwargs = _csv_engine_kwargs(read_kwargs, engine, chunksize)
+
+    if chunksize:
+        return _optimize_result(
+            _iter_csv_chunks_within_zip(zip_filename, filename, chunksize, read_kwargs),
+            optimize_dtypes,
+        )
+
+    archive = get_zip_archive(zip_filename)
+    with archive.open(filename) as file:
+        df = pd.read_csv(file, **read_kwargs)
+    return _optimize_result(df, optimize_dtypes)
 
 
 def import_excel_within_zip(
@@ -63,12 +361,13 @@ def import_excel_within_zip(
     na_values=None,
     skiprows=0,
     index_col=0,
+    optimize_dtypes=False,
 ):
     """
     Import an Excel file within a zip archive with flexible options.
 
     Parameters:
-    - zip_filename (str): Path to the zip file.
+    - zip_filename (str or ZipArchive): Path to the zip file, or an open ZipArchive.
     - filename (str): Name of the Excel file within the zip archive.
     - sheet_name (str, int, or None, optional): The sheet name or index to read. Default is 0 (first sheet).
     - header (int, optional): Row number to use as column names. Default is 0.
@@ -78,29 +377,265 @@ def import_excel_within_zip(
     - na_values (list or None, optional): Additional strings to recognize as NA/NaN. Default is None.
     - skiprows (int or list, optional): Number of rows to skip or a list of row indices to skip. Default is 0.
     - index_col (int, str, or None, optional): Column(s) to set as the index. Default is 0.
+    - optimize_dtypes (bool or dict, optional): Downcast dtypes to save memory (see downcast_dtypes);
+      the per-column report is stored in df.attrs['dtype_report']. Default is False.
 
     Returns:
     - pd.DataFrame: DataFrame containing the Excel data.
     """
-    import pandas as pd
-    import zipfile
-
-    with zipfile.ZipFile(zip_filename) as zf:
-        with zf.open(filename) as file:
-            df = pd.read_excel(
-                file,
-                sheet_name=sheet_name,
-                header=header,
-                usecols=usecols,
-                parse_dates=parse_dates,
-                # encoding=encoding,
-                na_values=na_values,
-                skiprows=skiprows,
-                index_col=index_col,
-            )
+    archive = get_zip_archive(zip_filename)
+    with archive.open(filename) as file:
+        df = pd.read_excel(
+            file,
+            sheet_name=sheet_name,
+            header=header,
+            usecols=usecols,
+            parse_dates=parse_dates,
+            # encoding=encoding,
+            na_values=na_values,
+            skiprows=skiprows,
+            index_col=index_col,
+        )
+    return _optimize_result(df, optimize_dtypes)
+
+
+def _excel_usecols_positions(usecols):
+    """Translate Excel-style usecols ('A:C,E') or integer positions to sorted 0-based positions."""
+    if isinstance(usecols, str):
+        from openpyxl.utils import column_index_from_string
+
+        positions = []
+        for part in usecols.replace(" ", "").split(","):
+            first, _, last = part.partition(":")
+            start = column_index_from_string(first) - 1
+            end = column_index_from_string(last) - 1 if last else start
+            positions.extend(range(start, end + 1))
+        return sorted(set(positions))
+    if all(isinstance(col, int) for col in usecols):
+        return sorted(set(usecols))
+    return None
+
+
+def _read_excel_sheet_streaming(
+    zip_filename,
+    filename,
+    sheet_name=0,
+    header=0,
+    usecols=None,
+    skiprows=0,
+    nrows=None,
+    na_values=None,
+    index_col=0,
+):
+    """Stream one worksheet in openpyxl read-only mode straight into per-column lists."""
+    import openpyxl
+
+    archive = get_zip_archive(zip_filename)
+    with archive.open(filename) as file:
+        content = io.BytesIO(file.read())
+
+    wb = openpyxl.load_workbook(content, read_only=True, data_only=True)
+    try:
+        ws = wb.worksheets[sheet_name] if isinstance(sheet_name, int) else wb[sheet_name]
+
+        # Bound the columns openpyxl materializes when positions are known up front
+        positions = None
+        if usecols is not None and not callable(usecols):
+            positions = _excel_usecols_positions(usecols)
+        first_col = positions[0] if positions else 0
+        iter_kwargs = {"values_only": True}
+        if positions:
+            iter_kwargs.update(min_col=first_col + 1, max_col=positions[-1] + 1)
+
+        if isinstance(skiprows, int):
+            skip = range(skiprows)
+        else:
+            skip = set(skiprows or [])
+
+        columns = None
+        column_values = []
+        appends = []  # Bound list.append of each column, in column order
+        n_data = 0
+        rows_seen = 0  # Rows left after skiprows
+        last_non_empty = 0
+        for row_number, row in enumerate(ws.iter_rows(**iter_kwargs)):
+            if row_number in skip:
+                continue
+            rows_seen += 1
+
+            if header is not None and columns is None:
+                if rows_seen <= header:
+                    continue
+                columns = [
+                    f"Unnamed: {first_col + i}" if value is None else value
+                    for i, value in enumerate(row)
+                ]
+                if usecols is not None and positions is None:
+                    # Column names or a callable: resolve against the header row
+                    wanted = [
+                        i
+                        for i, name in enumerate(columns)
+                        if (usecols(name) if callable(usecols) else name in usecols)
+                    ]
+                    positions = [first_col + i for i in wanted]
+                continue
+
+            if nrows is not None and n_data >= nrows:
+                break
+            if positions is not None:
+                row = [row[p - first_col] if p - first_col < len(row) else None for p in positions]
+
+            # Values go straight into their column; a wider row opens new columns
+            while len(appends) < len(row):
+                column_values.append([None] * n_data)
+                appends.append(column_values[-1].append)
+            for append, value in zip(appends, row):
+                append(value)
+            for append in appends[len(row) :]:
+                append(None)
+            n_data += 1
+            if any(value is not None for value in row):
+                last_non_empty = n_data
+    finally:
+        wb.close()
+
+    if columns is not None and positions is not None:
+        columns = [
+            columns[p - first_col] if p - first_col < len(columns) else f"Unnamed: {p}"
+            for p in positions
+        ]
+    width = max(len(column_values), len(columns or positions or []))
+    if columns is None:
+        columns = list(positions) if positions is not None else list(range(width))
+
+    # Trailing blank rows are formatting, not data
+    column_values = [values[:last_non_empty] for values in column_values]
+    column_values += [[None] * last_non_empty for _ in range(width - len(column_values))]
+
+    df = pd.DataFrame(dict(enumerate(column_values)), columns=range(width))
+    df.columns = columns + [f"Unnamed: {i}" for i in range(len(columns), width)]
+    if na_values is not None:
+        df = df.mask(df.isin(list(na_values)))
+    df = df.infer_objects()
+    if index_col is not None:
+        df = df.set_index(df.columns[index_col] if isinstance(index_col, int) else index_col)
     return df
 
 
+def import_excel_within_zip_fast(
+    zip_filename,
+    filename,
+    sheet_name=0,
+    header=0,
+    usecols=None,
+    skiprows=0,
+    nrows=None,
+    na_values=None,
+    index_col=0,
+    max_workers=None,
+    optimize_dtypes=False,
+):
+    """
+    Import an Excel file within a zip archive by streaming rows in read-only mode.
+
+    Rows go straight into column lists without building cell objects, and usecols,
+    skiprows and nrows are applied while streaming, so large sheets load much faster
+    than with import_excel_within_zip. Several sheets are parsed in parallel processes
+    (on Windows, call this from under an `if __name__ == "__main__":` guard).
+    Cached formula values are returned, as in pd.read_excel.
+
+    Parameters:
+    - zip_filename (str or ZipArchive): Path to the zip file, or an open ZipArchive.
+    - filename (str): Name of the Excel file within the zip archive.
+    - sheet_name (str, int, list or None, optional): Sheet name or index; a list or None (all sheets) returns a dict. Default is 0.
+    - header (int or None, optional): Row number (after skiprows) to use as column names. Default is 0.
+    - usecols (str, list, callable or None, optional): 'A:C,E', positions, names or a callable on names. Default is None.
+    - skiprows (int or list, optional): Number of leading rows, or 0-based row numbers, to skip. Default is 0.
+    - nrows (int or None, optional): Number of data rows to read. Default is None (all rows).
+    - na_values (list or None, optional): Additional values to treat as NA. Default is None.
+    - index_col (int, str, or None, optional): Column to set as the index. Default is 0.
+    - max_workers (int or None, optional): Process pool size for multiple sheets. Default is None.
+    - optimize_dtypes (bool or dict, optional): Downcast dtypes to save memory (see downcast_dtypes);
+      the per-column report is stored in df.attrs['dtype_report']. Default is False.
+
+    Returns:
+    - pd.DataFrame, or dict of DataFrames keyed by sheet name when several sheets are read.
+    """
+    import openpyxl
+
+    read_kwargs = dict(
+        header=header,
+        usecols=usecols,
+        skiprows=skiprows,
+        nrows=nrows,
+        na_values=na_values,
+        index_col=index_col,
+    )
+
+    if sheet_name is not None and not isinstance(sheet_name, list):
+        df = _read_excel_sheet_streaming(zip_filename, filename, sheet_name, **read_kwargs)
+        return _optimize_result(df, optimize_dtypes)
+
+    archive = get_zip_archive(zip_filename)
+    if sheet_name is None:
+        with archive.open(filename) as file:
+            wb = openpyxl.load_workbook(io.BytesIO(file.read()), read_only=True)
+            sheet_name = wb.sheetnames
+            wb.close()
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            sheet: executor.submit(
+                _read_excel_sheet_streaming, str(archive.path), filename, sheet, **read_kwargs
+            )
+            for sheet in sheet_name
+        }
+        dfs = {sheet: future.result() for sheet, future in futures.items()}
+    return _optimize_result(dfs, optimize_dtypes)
+
+
+## Smallest byte range worth handing to a worker in import_txt(parallel=True)
+TXT_PARALLEL_MIN_BYTES = 16 * 1024**2
+
+
+def _txt_byte_ranges(filename, skiprows, header, n_ranges):
+    """Split a delimited file's data rows into byte ranges that start and end on line boundaries."""
+    size = os.path.getsize(filename)
+    with open(filename, "rb") as f:
+        for _ in range(skiprows):
+            if not f.readline():
+                break
+        if header is not None:
+            # Like pandas, blank lines do not count towards the header row number
+            rows = 0
+            while rows <= header:
+                line = f.readline()
+                if not line:
+                    break
+                if line.strip():
+                    rows += 1
+        data_start = f.tell()
+
+        step = max((size - data_start) // n_ranges, 1)
+        bounds = [data_start]
+        for k in range(1, n_ranges):
+            f.seek(max(data_start + k * step - 1, bounds[-1]))
+            f.readline()
+            if f.tell() >= size:
+                break
+            if f.tell() > bounds[-1]:
+                bounds.append(f.tell())
+        bounds.append(size)
+
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def _read_txt_byte_range(filename, start, end, read_kwargs):
+    """Parse one byte range of a delimited file (module level so process pools can pickle it)."""
+    with open(filename, "rb") as f:
+        f.seek(start)
+        content = f.read(end - start)
+    return pd.read_csv(io.BytesIO(content), header=None, **read_kwargs)
 
 
 def import_txt(
@@ -114,6 +649,13 @@ def import_txt(
     index_col=None,
     skipfooter=0,
     names=None,
+    optimize_dtypes=False,
+    parallel=False,
+    max_workers=None,
+    usecols=None,
+    dtype=None,
+    engine=None,
+    dtype_backend=None,
 ):
     """
     Import a TXT file with flexible options.
@@ -125,23 +667,113 @@ def import_txt(
     - parse_dates (list or None, optional): Columns to parse as dates. Default is None.
     - encoding (str or None, optional): Encoding to use. Default is None.
     - na_values (list or None, optional): Additional strings to recognize as NA/NaN. Default is None.
+    - optimize_dtypes (bool or dict, optional): Downcast dtypes to save memory (see downcast_dtypes);
+      the per-column report is stored in df.attrs['dtype_report']. Default is False.
+    - parallel (bool, optional): Split the data rows into newline-aligned byte ranges, parse them
+      in worker processes and concatenate in order. Quoted fields must not contain line breaks.
+      Falls back to a single pass for skipfooter, list/callable skiprows, multi-row headers,
+      UTF-16/32 files and files too small to split. On Windows, call this from under an
+      `if __name__ == "__main__":` guard. Default is False.
+    - max_workers (int or None, optional): Number of worker processes. Default is None (CPU count).
+    - usecols (list or None, optional): Columns to read; the rest are never materialized. Default is None.
+    - dtype (type, str or dict, optional): Dtype for all or specific columns. Default is None.
+    - engine (str or None, optional): Parser engine. 'arrow' uses the multi-threaded pyarrow CSV reader
+      and falls back to the default engine for options it does not support (skipfooter, chunksize,
+      list skiprows, regex or sniffed separators) or when pyarrow is not installed. The Arrow reader
+      is itself multi-threaded, so `parallel` is ignored when it is used. Default is None.
+    - dtype_backend (str or None, optional): 'pyarrow' for Arrow-backed columns or 'numpy_nullable'.
+      Default is None (NumPy dtypes).
 
     Returns:
     - pd.DataFrame: DataFrame containing the TXT data.
     """
-    df = pd.read_csv(
-        filename,
+    read_kwargs = dict(
         sep=sep,
-        header=header,
         parse_dates=parse_dates,
         encoding=encoding,
         na_values=na_values,
-        skiprows=skiprows,
         index_col=index_col,
-        skipfooter=skipfooter,
-        names=names,
+        usecols=usecols,
+        dtype=dtype,
+    )
+    if dtype_backend:
+        read_kwargs["dtype_backend"] = dtype_backend
+
+    serial_kwargs = _csv_engine_kwargs(
+        dict(read_kwargs, header=header, skiprows=skiprows, skipfooter=skipfooter, names=names),
+        engine,
     )
-    return df
+
+    n_ranges = 1
+    if parallel and serial_kwargs.get("engine") != "pyarrow":
+        n_ranges = min(
+            max_workers or os.cpu_count() or 1,
+            os.path.getsize(filename) // TXT_PARALLEL_MIN_BYTES,
+        )
+    splittable = (
+        not skipfooter
+        and isinstance(skiprows, int)
+        and (header is None or isinstance(header, int))
+        and not (encoding and encoding.lower().replace("-", "").startswith(("utf16", "utf32")))
+    )
+
+    if n_ranges > 1 and splittable:
+        # Resolve column names once, exactly as the serial parser would
+        columns = pd.read_csv(
+            filename,
+            sep=sep,
+            header=header,
+            encoding=encoding,
+            skiprows=skiprows,
+            names=names,
+            nrows=1,
+        ).columns
+        read_kwargs["names"] = list(columns)
+        # The index is set after the ranges are reconciled, as one frame
+        read_kwargs["index_col"] = None
+
+        ranges = _txt_byte_ranges(filename, skiprows, header, n_ranges)
+        with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+            futures = [
+                executor.submit(_read_txt_byte_range, str(filename), start, end, read_kwargs)
+                for start, end in ranges
+            ]
+            dfs = [future.result() for future in futures]
+
+            # Each range infers its own dtypes. Where ranges disagree beyond int/float
+            # (e.g. digits in one range, text in another) the serial parser keeps the
+            # column as strings, so re-read those columns as str in the other ranges
+            fixed = dtype if isinstance(dtype, dict) else {} if dtype is None else None
+            text_columns = [] if fixed is None else [
+                col
+                for col in dfs[0].columns
+                if col not in fixed
+                and len({str(d[col].dtype) for d in dfs}) > 1
+                and not all(pd.api.types.is_numeric_dtype(d[col]) and d[col].dtype != bool for d in dfs)
+            ]
+            if text_columns:
+                futures = {
+                    i: executor.submit(
+                        _read_txt_byte_range,
+                        str(filename),
+                        start,
+                        end,
+                        dict(read_kwargs, dtype={**fixed, **{col: str for col in text_columns}}),
+                    )
+                    for i, (start, end) in enumerate(ranges)
+                }
+                dfs = [future.result() for future in futures.values()]
+
+        df = pd.concat(dfs, ignore_index=True)
+        if index_col is not None and index_col is not False:
+            keys = index_col if isinstance(index_col, list) else [index_col]
+            df = df.set_index(
+                [df.columns[key] if isinstance(key, int) else key for key in keys]
+            )
+        return _optimize_result(df, optimize_dtypes)
+
+    df = pd.read_csv(filename, **serial_kwargs)
+    return _optimize_result(df, optimize_dtypes)
 
 if __name__ == '__main__':
     df = import_txt("path/to/your/file.txt", sep=",", header=0)
@@ -167,40 +799,191 @@ def import_txt_within_zip(
     index_col=None,
     skipfooter=0,
     names=None,
+    chunksize=None,
+    optimize_dtypes=False,
+    usecols=None,
+    dtype=None,
+    engine=None,
+    dtype_backend=None,
 ):
     """
     Import a TXT file within a zip archive with flexible options.
 
     Parameters:
-    - zip_filename (str): Path to the zip file.
+    - zip_filename (str or ZipArchive): Path to the zip file, or an open ZipArchive.
     - filename (str): Name of the TXT file within the zip archive.
     - sep (str, optional): Delimiter to use. Default is '\t' (tab).
     - header (int or None, optional): Row number to use as column names. Default is None.
     - parse_dates (list or None, optional): Columns to parse as dates. Default is None.
     - encoding (str or None, optional): Encoding to use. Default is None.
     - na_values (list or None, optional): Additional strings to recognize as NA/NaN. Default is None.
+    - chunksize (int or None, optional): If set, return an iterator of DataFrames with at most
+      this many rows each, streamed from the member without loading it whole. Default is None.
+    - optimize_dtypes (bool or dict, optional): Downcast dtypes to save memory (see downcast_dtypes);
+      the per-column report is stored in df.attrs['dtype_report']. Default is False.
+    - usecols (list or None, optional): Columns to read; the rest are never materialized. Default is None.
+    - dtype (type, str or dict, optional): Dtype for all or specific columns. Default is None.
+    - engine (str or None, optional): Parser engine. 'arrow' uses the multi-threaded pyarrow CSV reader
+      and falls back to the default engine for options it does not support (skipfooter, chunksize,
+      list skiprows, regex or sniffed separators) or when pyarrow is not installed. Default is None.
+    - dtype_backend (str or None, optional): 'pyarrow' for Arrow-backed columns or 'numpy_nullable'.
+      Default is None (NumPy dtypes).
 
     Returns:
-    - pd.DataFrame: DataFrame containing the TXT data.
+    - pd.DataFrame (or an iterator of DataFrames when chunksize is set): DataFrame containing the TXT data.
     """
-    import pandas as pd
-    import zipfile
-
-    with zipfile.ZipFile(zip_filename) as zf:
-        with zf.open(filename) as file:
-            df = pd.read_csv(
-                file,
-                sep=sep,
-                header=header,
-                parse_dates=parse_dates,
-                encoding=encoding,
-                na_values=na_values,
-                skiprows=skiprows,
-                index_col=index_col,
-                skipfooter=skipfooter,
-                names=names,
+    read_kwargs = dict(
+        sep=sep,
+        header=header,
+        parse_dates=parse_dates,
+        encoding=encoding,
+        na_values=na_values,
+        skiprows=skiprows,
+        index_col=index_col,
+        skipfooter=skipfooter,
+        names=names,
+        usecols=usecols,
+        dtype=dtype,
+    )
+    if dtype_backend:
+        read_kwargs["dtype_backend"] = dtype_backend
+    read_kwargs = _csv_engine_kwargs(read_kwargs, engine, chunksize)
+
+    if chunksize:
+        return _optimize_result(
+            _iter_csv_chunks_within_zip(zip_filename, filename, chunksize, read_kwargs),
+            optimize_dtypes,
+        )
+
+    archive = get_zip_archive(zip_filename)
+    with archive.open(filename) as file:
+        df = pd.read_csv(file, **read_kwargs)
+    return _optimize_result(df, optimize_dtypes)
+
+
+## Records parsed per json.loads call when reading JSON Lines
+JSON_LINES_BATCH_SIZE = 100_000
+
+
+def _json_lines_to_frame_pandas(lines, encoding=None, usecols=None):
+    """Parse a batch of JSON Lines with a single json.loads call and flatten it with json_normalize."""
+    payload = b"[" + b",".join(lines) + b"]"
+    records = json.loads(payload.decode(encoding) if encoding else payload)
+
+    if usecols is not None:
+        # Project before flattening so unused nested fields are never expanded
+        fields = {col.split(".", 1)[0] for col in usecols}
+        records = [{k: v for k, v in r.items() if k in fields} for r in records]
+        return pd.json_normalize(records).reindex(columns=usecols)
+
+    return pd.json_normalize(records)
+
+
+def _json_normalize_order(fields, prefix=""):
+    """Flattened column names of Arrow struct fields, in json_normalize's order."""
+    import pyarrow as pa
+
+    # json_normalize lists a level's plain fields first, then each nested object's
+    names = [prefix + field.name for field in fields if not pa.types.is_struct(field.type)]
+    for field in fields:
+        if pa.types.is_struct(field.type):
+            children = [field.type.field(i) for i in range(field.type.num_fields)]
+            names += _json_normalize_order(children, prefix + field.name + ".")
+    return names
+
+
+def _json_type_without_dates(type_):
+    """Arrow type with inferred timestamps and dates (at any depth) replaced by strings."""
+    import pyarrow as pa
+
+    if pa.types.is_timestamp(type_) or pa.types.is_date(type_):
+        return pa.string()
+    if pa.types.is_struct(type_):
+        return pa.struct(
+            [
+                type_.field(i).with_type(_json_type_without_dates(type_.field(i).type))
+                for i in range(type_.num_fields)
+            ]
+        )
+    if pa.types.is_list(type_) or pa.types.is_large_list(type_):
+        value_field = type_.value_field
+        value_field = value_field.with_type(_json_type_without_dates(value_field.type))
+        return pa.list_(value_field) if pa.types.is_list(type_) else pa.large_list(value_field)
+    return type_
+
+
+def _json_lines_to_frame(lines, encoding=None, usecols=None):
+    """
+    Parse and flatten a batch of JSON Lines with pyarrow's multi-threaded JSON reader.
+
+    Nested objects become dotted columns as with json_normalize, which is used instead
+    when pyarrow cannot read the batch (e.g. a field changes type between records).
+    pyarrow infers timestamps from date-like strings; such batches are parsed again
+    with those fields as strings, so both paths return json_normalize's dtypes.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.json as pa_json
+    except ImportError:
+        return _json_lines_to_frame_pandas(lines, encoding, usecols)
+
+    payload = b"\n".join(lines)
+    if encoding and encoding.lower().replace("-", "").replace("_", "") not in ("utf8", "ascii"):
+        payload = payload.decode(encoding).encode("utf-8")
+    # Every record must fit in one block
+    block_size = max(1024**2, 2 * max((len(line) for line in lines), default=0))
+    read_options = pa_json.ReadOptions(block_size=block_size)
+    try:
+        table = pa_json.read_json(io.BytesIO(payload), read_options=read_options)
+        schema = pa.schema(
+            [field.with_type(_json_type_without_dates(field.type)) for field in table.schema]
+        )
+        if not schema.equals(table.schema):
+            table = pa_json.read_json(
+                io.BytesIO(payload),
+                read_options=read_options,
+                parse_options=pa_json.ParseOptions(explicit_schema=schema),
             )
-    return df
+    except pa.ArrowInvalid:
+        return _json_lines_to_frame_pandas(lines, encoding, usecols)
+
+    # flatten() expands one level of structs at a time
+    columns = _json_normalize_order(table.schema)
+    while any(pa.types.is_struct(field.type) for field in table.schema):
+        table = table.flatten()
+    if usecols is not None:
+        columns = [col for col in usecols if col in table.column_names]
+    table = table.select(columns)
+
+    df = table.to_pandas()
+    for field in table.schema:
+        if pa.types.is_list(field.type) or pa.types.is_large_list(field.type):
+            # Arrow lists arrive as arrays; json_normalize keeps Python lists
+            df[field.name] = [None if v is None else list(v) for v in df[field.name]]
+    return df if usecols is None else df.reindex(columns=usecols)
+
+
+def _iter_json_lines_within_zip(zip_filename, filename, encoding=None, batch_size=None, usecols=None):
+    """Yield flattened DataFrames of at most `batch_size` records from a JSON Lines member."""
+    batch_size = batch_size or JSON_LINES_BATCH_SIZE
+    archive = get_zip_archive(zip_filename)
+    start = 0
+    with archive.open(filename) as file:
+        batch = []
+        for line in file:
+            line = line.strip()
+            if line:
+                batch.append(line)
+            if len(batch) >= batch_size:
+                df = _json_lines_to_frame(batch, encoding, usecols)
+                df.index = pd.RangeIndex(start, start + len(df))
+                start += len(df)
+                batch = []
+                yield df
+        if batch:
+            df = _json_lines_to_frame(batch, encoding, usecols)
+            df.index = pd.RangeIndex(start, start + len(df))
+            yield df
 
 
 def import_json_within_zip(
@@ -216,12 +999,15 @@ def import_json_within_zip(
     precise_float=False,
     date_unit=None,
     lines=False,
+    chunksize=None,
+    usecols=None,
+    optimize_dtypes=False,
 ):
     """
     Import a JSON file within a zip archive with flexible options.
 
     Parameters:
-    - zip_filename (str): Path to the zip file.
+    - zip_filename (str or ZipArchive): Path to the zip file, or an open ZipArchive.
     - filename (str): Name of the JSON file within the zip archive.
     - encoding (str or None, optional): Encoding to use. Default is None.
     - orient (str or None, optional): Indication of expected JSON string format.
@@ -233,59 +1019,879 @@ def import_json_within_zip(
     - precise_float (bool, optional): If True, use precise float parsing. Default is False.
     - date_unit (str or None, optional): The timestamp unit. Default is None.
     - lines (bool, optional): If True, read the file as a JSON lines format. Default is False.
+    - chunksize (int or None, optional): With lines=True, return an iterator of flattened
+      DataFrames of at most this many records each. Default is None.
+    - usecols (list or None, optional): With lines=True, flattened columns to keep,
+      e.g. ['id', 'user.name']. Other columns are dropped after parsing. Default is None.
+    - optimize_dtypes (bool or dict, optional): Downcast dtypes to save memory (see downcast_dtypes);
+      the per-column report is stored in df.attrs['dtype_report']. Default is False.
 
     Returns:
-    - pd.DataFrame or pd.Series: Data from the JSON file.
-    """
-    with zipfile.ZipFile(zip_filename) as zf:
-        with zf.open(filename) as file:
-            if lines:
-                # For JSON lines format
-                data = []
-                for line in file:
-                    if encoding:
-                        line = line.decode(encoding)
-                    data.append(json.loads(line))
-                df = pd.json_normalize(data)
-            else:
-                # For regular JSON
-                if encoding:
-                    content = file.read().decode(encoding)
-                else:
-                    content = file.read().decode("utf-8")
-                df = pd.read_json(
-                    content,
-                    orient=orient,
-                    typ=typ,
-                    dtype=dtype,
-                    convert_axes=convert_axes,
-                    convert_dates=convert_dates,
-                    keep_default_dates=keep_default_dates,
-                    precise_float=precise_float,
-                    date_unit=date_unit,
-                )
-    return df
+    - pd.DataFrame or pd.Series (or an iterator of DataFrames when chunksize is set): Data from the JSON file.
+    """
+    if lines:
+        batches = _iter_json_lines_within_zip(
+            zip_filename,
+            filename,
+            encoding=encoding,
+            batch_size=chunksize,
+            usecols=usecols,
+        )
+        if chunksize:
+            return _optimize_result(batches, optimize_dtypes)
+        dfs = list(batches)
+        df = pd.concat(dfs) if dfs else pd.DataFrame(columns=usecols)
+        return _optimize_result(df, optimize_dtypes)
+
+    archive = get_zip_archive(zip_filename)
+    with archive.open(filename) as file:
+        # For regular JSON
+        if encoding:
+            content = file.read().decode(encoding)
+        else:
+            content = file.read().decode("utf-8")
+        df = pd.read_json(
+            content,
+            orient=orient,
+            typ=typ,
+            dtype=dtype,
+            convert_axes=convert_axes,
+            convert_dates=convert_dates,
+            keep_default_dates=keep_default_dates,
+            precise_float=precise_float,
+            date_unit=date_unit,
+        )
+    return _optimize_result(df, optimize_dtypes)
+
+
+def _stored_member_buffer(archive, filename):
+    """
+    Zero-copy pyarrow buffer over an uncompressed, unencrypted member, or None.
+
+    The slice is backed by a memory map of the archive, so nothing is read until used.
+    """
+    info = archive.getinfo(filename)
+    if info.compress_type != zipfile.ZIP_STORED or info.flag_bits & 0x1:
+        return None
+    try:
+        import pyarrow as pa
+    except ImportError:
+        return None
+
+    offset = archive.data_offset(filename)
+    with pa.memory_map(str(archive.path)) as source:
+        return source.read_at(info.file_size, offset)
 
 
-def import_parquet_within_zip(zip_filename, filename, columns=None, **kwargs):
+def import_parquet_within_zip(
+    zip_filename, filename, columns=None, optimize_dtypes=False, **kwargs
+):
     """
     Import a Parquet file within a zip archive.
 
+    Members stored without compression (ZIP_STORED) are memory-mapped in place, so the
+    Parquet reader can seek to the footer and only touch the column chunks and row
+    groups it needs. Compressed members are streamed through zf.open() instead.
+
     Parameters:
-    - zip_filename (str): Path to the zip file.
+    - zip_filename (str or ZipArchive): Path to the zip file, or an open ZipArchive.
     - filename (str): Name of the Parquet file within the zip archive.
     - columns (list or None, optional): List of columns to read. Default is None.
-    - **kwargs: Additional keyword arguments for pd.read_parquet.
+    - **kwargs: Additional keyword arguments for pd.read_parquet, e.g. filters=[('year', '=', 2025)].
+    - optimize_dtypes (bool or dict, optional): Downcast dtypes to save memory (see downcast_dtypes);
+      the per-column report is stored in df.attrs['dtype_report']. Default is False.
 
     Returns:
     - pd.DataFrame: DataFrame containing the Parquet data.
     """
-    with zipfile.ZipFile(zip_filename) as zf:
-        with zf.open(filename) as file:
-            df = pd.read_parquet(file, columns=columns, **kwargs)
+    archive = get_zip_archive(zip_filename)
+
+    buffer = _stored_member_buffer(archive, filename)
+    if buffer is not None and kwargs.get("engine", "auto") in ("auto", "pyarrow"):
+        import pyarrow as pa
+
+        df = pd.read_parquet(pa.BufferReader(buffer), columns=columns, **kwargs)
+        return _optimize_result(df, optimize_dtypes)
+
+    with archive.open(filename) as file:
+        df = pd.read_parquet(file, columns=columns, **kwargs)
+    return _optimize_result(df, optimize_dtypes)
+
+
+# %% Import many members from zip
+
+## Readers available to import_glob_within_zip
+ZIP_READERS = {
+    "csv": import_csv_within_zip,
+    "excel": import_excel_within_zip,
+    "txt": import_txt_within_zip,
+    "json": import_json_within_zip,
+    "parquet": import_parquet_within_zip,
+}
+
+
+def _import_member_within_zip(reader, zip_filename, filename, kwargs):
+    """Read one member with the named reader (module level so process pools can pickle it)."""
+    return ZIP_READERS[reader](zip_filename, filename, **kwargs)
+
+
+def find_members_within_zip(zip_filename, pattern):
+    """
+    List the members of a zip archive matching a glob pattern, in archive order.
+
+    Patterns without a '/' are matched against the member's base name as well,
+    so 'claims_2025*.csv' also finds 'data/claims_202501.csv'.
+
+    Parameters:
+    - zip_filename (str or ZipArchive): Path to the zip file, or an open ZipArchive.
+    - pattern (str): Glob pattern, e.g. 'claims_2025*.csv'.
+
+    Returns:
+    - list: Matching member names.
+    """
+    archive = get_zip_archive(zip_filename)
+    match_basename = "/" not in pattern
+    return [
+        name
+        for name in archive.namelist()
+        if not name.endswith("/")
+        and (
+            fnmatchcase(name, pattern)
+            or (match_basename and fnmatchcase(name.rsplit("/", 1)[-1], pattern))
+        )
+    ]
+
+
+def import_glob_within_zip(
+    zip_filename,
+    pattern,
+    reader="csv",
+    max_workers=None,
+    use_processes=False,
+    source_column=None,
+    optimize_dtypes=False,
+    **kwargs,
+):
+    """
+    Import every member of a zip archive matching a glob pattern and concatenate the results.
+
+    Members are decompressed and parsed concurrently. Threads share the pooled archive
+    handle; processes (use_processes=True) open the archive themselves, which helps when
+    parsing rather than decompression dominates. With processes on Windows, call this
+    from under an `if __name__ == "__main__":` guard.
+
+    Parameters:
+    - zip_filename (str or ZipArchive): Path to the zip file, or an open ZipArchive.
+    - pattern (str): Glob pattern for member names, e.g. 'claims_2025*.csv'.
+    - reader (str, optional): One of 'csv', 'excel', 'txt', 'json', 'parquet'. Default is 'csv'.
+    - max_workers (int or None, optional): Pool size. Default is None (executor default).
+    - use_processes (bool, optional): Use a process pool instead of threads. Default is False.
+    - source_column (str or None, optional): If set, add a column holding each row's member name. Default is None.
+    - **kwargs: Additional keyword arguments for the reader, e.g. sep, index_col.
+    - optimize_dtypes (bool or dict, optional): Downcast dtypes to save memory (see downcast_dtypes);
+      the per-column report is stored in df.attrs['dtype_report']. Default is False.
+
+    Returns:
+    - pd.DataFrame: Rows of all matching members, in archive order.
+    """
+    if reader not in ZIP_READERS:
+        raise ValueError(f"reader must be one of {list(ZIP_READERS)}, got '{reader}'")
+
+    archive = get_zip_archive(zip_filename)
+    members = find_members_within_zip(archive, pattern)
+    if not members:
+        raise ValueError(f"No members of '{archive.path}' match '{pattern}'")
+
+    if use_processes:
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+        source = str(archive.path)
+    else:
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        source = archive
+
+    with executor:
+        futures = [
+            executor.submit(_import_member_within_zip, reader, source, member, kwargs)
+            for member in members
+        ]
+        dfs = [future.result() for future in futures]
+
+    if source_column:
+        for member, df in zip(members, dfs):
+            df.insert(0, source_column, member)
+
+    return _optimize_result(pd.concat(dfs), optimize_dtypes)
+
+
+# %% Import cache
+
+## Default location and size budget of the on-disk import cache
+IMPORT_CACHE_DIR = Path(tempfile.gettempdir()) / "analytics_tasks_utils_cache"
+IMPORT_CACHE_MAX_BYTES = 10 * 1024**3
+
+
+def _import_cache_key(archive, filename, reader, cache_format, kwargs):
+    """Fingerprint of a member's content (CRC, size, mtime) plus the reader arguments."""
+    info = archive.getinfo(filename)
+    fingerprint = json.dumps(
+        [
+            str(archive.path),
+            filename,
+            info.CRC,
+            info.file_size,
+            info.date_time,
+            reader,
+            cache_format,
+            sorted(kwargs.items()),
+        ],
+        default=str,
+    )
+    return hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()
+
+
+def _evict_import_cache(cache_dir, max_cache_bytes):
+    """Delete least recently used cache files until the cache fits in max_cache_bytes."""
+    entries = [
+        (entry.stat().st_mtime, entry.stat().st_size, entry)
+        for entry in Path(cache_dir).iterdir()
+        if entry.suffix in (".parquet", ".feather")
+    ]
+    total = sum(size for _, size, _ in entries)
+    for _, size, entry in sorted(entries, key=lambda e: e[0]):
+        if total <= max_cache_bytes:
+            break
+        entry.unlink(missing_ok=True)
+        total -= size
+
+
+def import_within_zip_cached(
+    zip_filename,
+    filename,
+    reader="csv",
+    cache_dir=None,
+    cache_format="parquet",
+    max_cache_bytes=IMPORT_CACHE_MAX_BYTES,
+    **kwargs,
+):
+    """
+    Import a file within a zip archive through an on-disk columnar cache.
+
+    The cache key combines the archive path, the member's CRC, size and modification
+    time, and the reader arguments, so a changed member or different options always
+    re-read the source. Hits are memory-mapped Parquet/Feather reads instead of
+    decompressing and parsing again. Results that are not DataFrames (e.g. chunk
+    iterators) and frames the cache format cannot store are returned uncached.
+
+    Parameters:
+    - zip_filename (str or ZipArchive): Path to the zip file, or an open ZipArchive.
+    - filename (str): Name of the file within the zip archive.
+    - reader (str, optional): One of 'csv', 'excel', 'txt', 'json', 'parquet'. Default is 'csv'.
+    - cache_dir (str, Path or None, optional): Cache folder. Default is IMPORT_CACHE_DIR.
+    - cache_format (str, optional): 'parquet' or 'feather'. Default is 'parquet'.
+    - max_cache_bytes (int, optional): Size budget; least recently used entries are evicted. Default is 10 GB.
+    - **kwargs: Additional keyword arguments for the reader.
+
+    Returns:
+    - pd.DataFrame: DataFrame containing the file data.
+    """
+    import pyarrow.feather as feather
+
+    if reader not in ZIP_READERS:
+        raise ValueError(f"reader must be one of {list(ZIP_READERS)}, got '{reader}'")
+    if cache_format not in ("parquet", "feather"):
+        raise ValueError(f"cache_format must be 'parquet' or 'feather', got '{cache_format}'")
+
+    cache_dir = Path(cache_dir or IMPORT_CACHE_DIR)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    archive = get_zip_archive(zip_filename)
+    key = _import_cache_key(archive, filename, reader, cache_format, kwargs)
+    cache_file = cache_dir / f"{key}.{cache_format}"
+
+    if cache_file.exists():
+        os.utime(cache_file)  # Mark as recently used
+        if cache_format == "parquet":
+            return pd.read_parquet(cache_file, memory_map=True)
+        return feather.read_table(cache_file, memory_map=True).to_pandas()
+
+    df = ZIP_READERS[reader](archive, filename, **kwargs)
+    if not isinstance(df, pd.DataFrame):
+        return df
+
+    # Unique per writer, so concurrent threads and processes never share a temp file
+    with tempfile.NamedTemporaryFile(dir=cache_dir, suffix=".tmp", delete=False) as tmp:
+        tmp_file = Path(tmp.name)
+    try:
+        if cache_format == "parquet":
+            df.to_parquet(tmp_file)
+        else:
+            feather.write_feather(df, tmp_file)
+        os.replace(tmp_file, cache_file)
+    except Exception:
+        # Frames the columnar format cannot store (e.g. mixed object columns) stay uncached
+        tmp_file.unlink(missing_ok=True)
+        return df
+
+    _evict_import_cache(cache_dir, max_cache_bytes)
     return df
 
 
+def clear_import_cache(cache_dir=None):
+    """Delete every cached import in cache_dir (default IMPORT_CACHE_DIR)."""
+    cache_dir = Path(cache_dir or IMPORT_CACHE_DIR)
+    if cache_dir.exists():
+        for entry in cache_dir.iterdir():
+            if entry.suffix in (".parquet", ".feather", ".tmp"):
+                entry.unlink(missing_ok=True)
+
+
+# %% Zip catalog
+
+## Member extensions recognized by catalog_zip
+CATALOG_FORMATS = {
+    ".csv": "csv",
+    ".txt": "txt",
+    ".tsv": "txt",
+    ".tab": "txt",
+    ".json": "json",
+    ".jsonl": "json",
+    ".ndjson": "json",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+}
+
+
+def _preview_delimited(sample, complete, file_size, sep):
+    """Columns, dtypes and row estimate from the first bytes of a delimited member."""
+    if not complete:
+        sample = sample[: sample.rfind(b"\n") + 1] or sample
+    if sep is None:
+        import csv
+
+        try:
+            sep = csv.Sniffer().sniff(sample[:8192].decode("utf-8", "replace"), ",\t;|").delimiter
+        except csv.Error:
+            sep = ","
+    df = pd.read_csv(io.BytesIO(sample), sep=sep)
+    if complete:
+        return df, len(df), True
+    lines = max(sample.count(b"\n"), 1)
+    return df, int(file_size * lines / len(sample)) - 1, False
+
+
+def _preview_json(sample, complete, file_size, json_lines):
+    """Columns, dtypes and row estimate from the first bytes of a JSON or JSON Lines member."""
+    if json_lines:
+        lines = sample.splitlines()
+        if not complete:
+            lines = lines[:-1]  # Last line may be cut off
+        lines = [line.strip() for line in lines if line.strip()]
+        df = _json_lines_to_frame(lines)
+        if complete:
+            return df, len(df), True
+        return df, int(file_size * len(lines) / max(len(sample), 1)), False
+
+    if complete:
+        df = pd.json_normalize(json.loads(sample))
+        return df, len(df), True
+
+    # Truncated JSON array: decode just the first record
+    text = sample.decode("utf-8", "replace").lstrip()
+    if not text.startswith("["):
+        raise ValueError("Preview too short to parse a JSON object")
+    first, end = json.JSONDecoder().raw_decode(text[1:].lstrip())
+    return pd.json_normalize([first]), int(file_size / max(end + 1, 1)), False
+
+
+def catalog_zip(zip_filename, preview_bytes=64 * 1024, sep=None):
+    """
+    Preview the columns, dtypes and row counts of every member of a zip archive.
+
+    CSV/TXT/JSON members are decompressed only up to `preview_bytes`; row counts are
+    extrapolated from the preview unless it covers the whole member. Parquet members
+    are described from their footer (memory-mapped when stored uncompressed).
+    Other members are listed with their sizes only.
+
+    Parameters:
+    - zip_filename (str or ZipArchive): Path to the zip file, or an open ZipArchive.
+    - preview_bytes (int, optional): Decompressed bytes to inspect per text member. Default is 64 KB.
+    - sep (str or None, optional): Delimiter for CSV/TXT members. Default is None (',' for CSV, sniffed for TXT).
+
+    Returns:
+    - pd.DataFrame: One row per member with format, sizes, columns, dtypes and row counts.
+    """
+    archive = get_zip_archive(zip_filename)
+    rows = []
+    for info in archive.infolist():
+        if info.is_dir():
+            continue
+
+        fmt = CATALOG_FORMATS.get(os.path.splitext(info.filename)[1].lower())
+        row = {
+            "member": info.filename,
+            "format": fmt,
+            "compressed_size": info.compress_size,
+            "file_size": info.file_size,
+            "n_columns": None,
+            "columns": None,
+            "dtypes": None,
+            "rows": None,
+            "rows_exact": None,
+            "error": None,
+        }
+
+        try:
+            if fmt == "parquet":
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+
+                buffer = _stored_member_buffer(archive, info.filename)
+                with archive.open(info.filename) as file:
+                    parquet_file = pq.ParquetFile(
+                        pa.BufferReader(buffer) if buffer is not None else file
+                    )
+                    schema = parquet_file.schema_arrow
+                    row["columns"] = schema.names
+                    row["dtypes"] = {field.name: str(field.type) for field in schema}
+                    row["rows"] = parquet_file.metadata.num_rows
+                    row["rows_exact"] = True
+
+            elif fmt is not None:
+                with archive.open(info.filename) as file:
+                    sample = file.read(preview_bytes)
+                complete = len(sample) >= info.file_size
+
+                if fmt == "json":
+                    json_lines = info.filename.lower().endswith((".jsonl", ".ndjson")) or (
+                        sample.lstrip()[:1] == b"{" and b"\n" in sample.strip()
+                    )
+                    df, n_rows, exact = _preview_json(sample, complete, info.file_size, json_lines)
+                else:
+                    member_sep = "," if fmt == "csv" and sep is None else sep
+                    df, n_rows, exact = _preview_delimited(sample, complete, info.file_size, member_sep)
+                row["columns"] = list(df.columns)
+                row["dtypes"] = {str(col): str(dtype) for col, dtype in df.dtypes.items()}
+                row["rows"] = n_rows
+                row["rows_exact"] = exact
+
+            if row["columns"] is not None:
+                row["n_columns"] = len(row["columns"])
+
+        except Exception as e:
+            row["error"] = str(e)
+
+        rows.append(row)
+
+    return pd.DataFrame(rows).astype({"n_columns": "Int64", "rows": "Int64"})
+
+
+# %% Row index for zipped CSV members
+
+## Compressed bytes read per step while indexing or resuming
+ROW_INDEX_BLOCK_BYTES = 1024**2
+
+
+class ZipCsvRowIndex:
+    """
+    Checkpoints through a CSV member of a zip archive for fast access to deep row ranges.
+
+    One pass over the member records, every `checkpoint_every_mb` of compressed data, the
+    row number reached together with a copy of the inflate state (window included).
+    read_rows() resumes inflation from the nearest checkpoint at or before the requested
+    row instead of inflating the member from the start.
+
+    Checkpoints live in memory: CPython's zlib can copy a decompressor but cannot export
+    its window state to disk, so build the index once per session and reuse it.
+    Rows are counted by line breaks, so quoted fields must not contain newlines.
+
+    Parameters:
+    - zip_filename (str or ZipArchive): Path to the zip file, or an open ZipArchive.
+    - filename (str): Name of the CSV file within the zip archive.
+    - checkpoint_every_mb (int or float, optional): Compressed megabytes between checkpoints. Default is 64.
+    - header (int or None, optional): 0 if the first line holds column names, None otherwise. Default is 0.
+    """
+
+    def __init__(self, zip_filename, filename, checkpoint_every_mb=64, header=0):
+        import zlib
+
+        archive = get_zip_archive(zip_filename)
+        info = archive.getinfo(filename)
+        if info.flag_bits & 0x1:
+            raise ValueError(f"'{filename}' is encrypted")
+        if info.compress_type not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+            raise ValueError(f"'{filename}' must be stored or deflated to be indexed")
+        if header not in (0, None):
+            raise ValueError("header must be 0 or None")
+
+        self.path = archive.path
+        self.filename = filename
+        self.compress_size = info.compress_size
+        self.deflated = info.compress_type == zipfile.ZIP_DEFLATED
+        self.data_offset = archive.data_offset(filename)
+        self.header_line = b""
+        self.checkpoints = []  # (lines completed, compressed position, inflate state, partial line)
+
+        every = max(int(checkpoint_every_mb * 1024**2), ROW_INDEX_BLOCK_BYTES)
+        inflater = zlib.decompressobj(-15) if self.deflated else None
+        lines = 0
+        tail = b""
+        position = 0
+        next_checkpoint = 0
+        with open(self.path, "rb") as f:
+            f.seek(self.data_offset)
+            while position < self.compress_size:
+                if position >= next_checkpoint:
+                    self.checkpoints.append(
+                        (lines, position, inflater.copy() if inflater else None, tail)
+                    )
+                    next_checkpoint += every
+                block = f.read(min(ROW_INDEX_BLOCK_BYTES, self.compress_size - position))
+                if not block:
+                    break
+                position += len(block)
+                data = tail + (inflater.decompress(block) if inflater else block)
+                if header == 0 and lines == 0 and b"\n" in data:
+                    self.header_line = data[: data.index(b"\n") + 1]
+                lines += data.count(b"\n")
+                tail = data[data.rfind(b"\n") + 1 :]
+
+        self.n_lines = lines + (1 if tail.strip() else 0)
+        self.header_lines = 1 if header == 0 else 0
+        self._line_numbers = [checkpoint[0] for checkpoint in self.checkpoints]
+
+    @property
+    def n_rows(self):
+        """Number of data rows (lines after the header)."""
+        return max(self.n_lines - self.header_lines, 0)
+
+    def _iter_lines(self, first_line):
+        """Yield raw lines from `first_line` on, resuming at the nearest checkpoint."""
+        import bisect
+
+        k = bisect.bisect_right(self._line_numbers, first_line) - 1
+        lines, position, inflater, tail = self.checkpoints[k]
+        inflater = inflater.copy() if inflater else None  # Keep the checkpoint reusable
+
+        with open(self.path, "rb") as f:
+            f.seek(self.data_offset + position)
+            while True:
+                block = f.read(min(ROW_INDEX_BLOCK_BYTES, self.compress_size - position))
+                position += len(block)
+                data = tail + (inflater.decompress(block) if inflater and block else block)
+                chunk_lines = data.split(b"\n")
+                tail = chunk_lines.pop() if block else b""
+                for line in chunk_lines:
+                    if lines >= first_line:
+                        yield line + b"\n"
+                    lines += 1
+                if not block:
+                    if tail:
+                        yield tail
+                    return
+
+    def read_rows(self, start, stop, **kwargs):
+        """
+        Read data rows [start, stop) into a DataFrame.
+
+        Parameters:
+        - start (int): First data row (0-based, header excluded).
+        - stop (int): Row after the last one to read.
+        - **kwargs: Additional keyword arguments for pd.read_csv (e.g. sep, dtype).
+
+        Returns:
+        - pd.DataFrame: The requested rows, indexed by their row numbers.
+        """
+        stop = min(stop, self.n_rows)
+        if start >= stop:
+            return pd.read_csv(io.BytesIO(self.header_line), **kwargs) if self.header_line else pd.DataFrame()
+
+        selected = []
+        for line in self._iter_lines(start + self.header_lines):
+            selected.append(line)
+            if len(selected) >= stop - start:
+                break
+
+        kwargs.setdefault("header", 0 if self.header_lines else None)
+        df = pd.read_csv(io.BytesIO(self.header_line + b"".join(selected)), **kwargs)
+        df.index = pd.RangeIndex(start, start + len(df))
+        return df
+
+    def __repr__(self):
+        return (
+            f"ZipCsvRowIndex('{self.path}', '{self.filename}', "
+            f"rows={self.n_rows}, checkpoints={len(self.checkpoints)})"
+        )
+
+
+def build_csv_row_index(zip_filename, filename, checkpoint_every_mb=64, header=0):
+    """
+    Build a ZipCsvRowIndex for a CSV member (one full pass over the member).
+
+    Parameters:
+    - zip_filename (str or ZipArchive): Path to the zip file, or an open ZipArchive.
+    - filename (str): Name of the CSV file within the zip archive.
+    - checkpoint_every_mb (int or float, optional): Compressed megabytes between checkpoints. Default is 64.
+    - header (int or None, optional): 0 if the first line holds column names, None otherwise. Default is 0.
+
+    Returns:
+    - ZipCsvRowIndex: Index whose read_rows(start, stop) reads deep row ranges quickly.
+    """
+    return ZipCsvRowIndex(zip_filename, filename, checkpoint_every_mb, header)
+
+
+# %% Streaming aggregation over zipped CSVs
+
+## How per-chunk partial aggregates are computed and then merged
+_PARTIAL_AGGREGATES = {
+    "sum": [("sum", "sum")],
+    "count": [("count", "sum")],
+    "size": [("size", "sum")],
+    "min": [("min", "min")],
+    "max": [("max", "max")],
+    "mean": [("sum", "sum"), ("count", "sum")],
+}
+
+
+def aggregate_csv_within_zip(
+    zip_filename,
+    filename,
+    aggs,
+    by=None,
+    predicate=None,
+    chunksize=1_000_000,
+    **kwargs,
+):
+    """
+    Filter and aggregate a CSV file within a zip archive chunk by chunk.
+
+    Each chunk is filtered, reduced to partial aggregates per group and merged into a
+    running state, so memory holds one chunk plus one row per group however large
+    the member is.
+
+    Parameters:
+    - zip_filename (str or ZipArchive): Path to the zip file, or an open ZipArchive.
+    - filename (str): Name of the CSV file within the zip archive.
+    - aggs (dict): Column to aggregation name or list of names, e.g. {'paid': ['sum', 'mean'], 'id': 'count'}.
+      Supported: 'sum', 'count', 'size', 'min', 'max', 'mean'.
+    - by (str, list or None, optional): Group keys. Default is None (aggregate all rows).
+    - predicate (callable, str or None, optional): Row filter, either a function returning a
+      boolean mask for a chunk or a DataFrame.query() string. Default is None.
+    - chunksize (int, optional): Rows per chunk. Default is 1,000,000.
+    - **kwargs: Additional keyword arguments for import_csv_within_zip (e.g. sep, encoding).
+
+    Returns:
+    - pd.DataFrame: Aggregates per group; columns are (column, aggregation) pairs unless
+      every aggregation in `aggs` is a single name.
+    """
+    specs = [
+        (col, func)
+        for col, funcs in aggs.items()
+        for func in ([funcs] if isinstance(funcs, str) else funcs)
+    ]
+    for col, func in specs:
+        if func not in _PARTIAL_AGGREGATES:
+            raise ValueError(
+                f"Aggregation '{func}' for '{col}' cannot be merged across chunks; "
+                f"use one of {list(_PARTIAL_AGGREGATES)}"
+            )
+
+    # Each partial is computed once per chunk, even if several outputs need it
+    partials = {}
+    for col, func in specs:
+        for part, merge in _PARTIAL_AGGREGATES[func]:
+            partials[f"{col}__{part}"] = (col, part, merge)
+
+    kwargs.setdefault("index_col", None)
+    keys = by if by is not None else (lambda _: 0)
+
+    state = None
+    for chunk in import_csv_within_zip(zip_filename, filename, chunksize=chunksize, **kwargs):
+        if predicate is not None:
+            chunk = chunk.query(predicate) if isinstance(predicate, str) else chunk[predicate(chunk)]
+        if chunk.empty:
+            continue
+
+        partial = chunk.groupby(keys).agg(
+            **{name: (col, part) for name, (col, part, _) in partials.items()}
+        )
+        if state is not None:
+            partial = pd.concat([state, partial])
+            partial = partial.groupby(level=list(range(partial.index.nlevels))).agg(
+                {name: merge for name, (_, _, merge) in partials.items()}
+            )
+        state = partial
+
+    if state is None:
+        columns = pd.MultiIndex.from_tuples(specs)
+        result = pd.DataFrame(columns=columns)
+    else:
+        result = pd.DataFrame(
+            {
+                (col, func): (
+                    state[f"{col}__sum"] / state[f"{col}__count"]
+                    if func == "mean"
+                    else state[f"{col}__{func}"]
+                )
+                for col, func in specs
+            },
+            index=state.index,
+        )
+
+    if by is None:
+        result = result.reset_index(drop=True)
+    if all(isinstance(funcs, str) for funcs in aggs.values()):
+        result.columns = result.columns.droplevel(1)
+    return result
+
+
+# %% Folder of zips as one dataset
+
+
+class ZipDataset:
+    r"""
+    A folder of zip archives holding the same members, read as one partitioned dataset.
+
+    Partition keys come from named groups of regular expressions applied to the archive
+    file names and the member names, e.g. r"extract_(?P<period>\d{6})\.zip". A filter
+    on those keys prunes archives by file name before any of them is opened; surviving
+    members are read in parallel with the import_*_within_zip readers.
+
+    Parameters:
+    - folder (str or Path): Folder holding the archives.
+    - archive_pattern (str, optional): Glob for archive file names. Default is '*.zip'.
+    - member_pattern (str, optional): Glob for members inside each archive (see find_members_within_zip). Default is '*'.
+    - archive_regex (str or None, optional): Regex with named groups parsed from archive names. Default is None.
+    - member_regex (str or None, optional): Regex with named groups parsed from member names. Default is None.
+
+    Example:
+        ds = ZipDataset("landing", member_pattern="claims.csv",
+                        archive_regex=r"extract_(?P<period>\d{6})\.zip")
+        df = ds.read(filter=lambda p: p["period"] >= "202508")
+    """
+
+    def __init__(
+        self,
+        folder,
+        archive_pattern="*.zip",
+        member_pattern="*",
+        archive_regex=None,
+        member_regex=None,
+    ):
+        self.folder = Path(folder)
+        self.archive_pattern = archive_pattern
+        self.member_pattern = member_pattern
+        self.archive_regex = re.compile(archive_regex) if archive_regex else None
+        self.member_regex = re.compile(member_regex) if member_regex else None
+
+    @staticmethod
+    def _parse_keys(regex, name):
+        if regex is None:
+            return {}
+        match = regex.search(name)
+        return match.groupdict() if match else None
+
+    @staticmethod
+    def _matches(keys, filter, partial):
+        """Apply a filter to partition keys; with partial keys, unknown keys never prune."""
+        if filter is None:
+            return True
+        if callable(filter):
+            try:
+                return bool(filter(keys))
+            except KeyError:
+                if partial:
+                    return True
+                raise
+        for key, condition in filter.items():
+            if key not in keys:
+                if partial:
+                    continue
+                return False
+            value = keys[key]
+            if callable(condition):
+                ok = condition(value)
+            elif isinstance(condition, (list, tuple, set)):
+                ok = value in condition
+            else:
+                ok = value == condition
+            if not ok:
+                return False
+        return True
+
+    def partitions(self, filter=None):
+        """
+        List the (archive, member) partitions that pass the filter.
+
+        Parameters:
+        - filter (callable, dict or None, optional): Function of the partition-key dict, or
+          {key: value, list of values, or callable}. Default is None (everything).
+
+        Returns:
+        - pd.DataFrame: One row per partition with 'archive', 'member' and the key columns.
+        """
+        rows = []
+        for archive_path in sorted(self.folder.glob(self.archive_pattern)):
+            archive_keys = self._parse_keys(self.archive_regex, archive_path.name)
+            if archive_keys is None or not self._matches(archive_keys, filter, partial=True):
+                continue
+
+            for member in find_members_within_zip(archive_path, self.member_pattern):
+                member_keys = self._parse_keys(self.member_regex, member)
+                if member_keys is None:
+                    continue
+                keys = {**archive_keys, **member_keys}
+                if self._matches(keys, filter, partial=False):
+                    rows.append({"archive": archive_path, "member": member, **keys})
+
+        return pd.DataFrame(rows, columns=None if rows else ["archive", "member"])
+
+    def read(
+        self,
+        filter=None,
+        reader="csv",
+        max_workers=None,
+        partition_columns=True,
+        **kwargs,
+    ):
+        """
+        Read every partition that passes the filter and concatenate the results.
+
+        Parameters:
+        - filter (callable, dict or None, optional): See partitions(). Default is None.
+        - reader (str, optional): One of 'csv', 'excel', 'txt', 'json', 'parquet'. Default is 'csv'.
+        - max_workers (int or None, optional): Thread pool size. Default is None.
+        - partition_columns (bool, optional): Add the partition keys as columns. Default is True.
+        - **kwargs: Additional keyword arguments for the reader.
+
+        Returns:
+        - pd.DataFrame: Rows of all surviving partitions, in archive and member order.
+        """
+        if reader not in ZIP_READERS:
+            raise ValueError(f"reader must be one of {list(ZIP_READERS)}, got '{reader}'")
+
+        parts = self.partitions(filter)
+        if parts.empty:
+            return pd.DataFrame()
+        key_columns = [col for col in parts.columns if col not in ("archive", "member")]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(ZIP_READERS[reader], part.archive, part.member, **kwargs)
+                for part in parts.itertuples(index=False)
+            ]
+            dfs = [future.result() for future in futures]
+
+        if partition_columns:
+            for (_, part), df in zip(parts.iterrows(), dfs):
+                for position, key in enumerate(key_columns):
+                    df.insert(position, key, part[key])
+
+        return pd.concat(dfs)
+
+    def __repr__(self):
+        return f"ZipDataset('{self.folder}', archives='{self.archive_pattern}', members='{self.member_pattern}')"
+
+
 
 
 
@@ -325,6 +1931,111 @@ def import_youtube_subtitle(video_id, language='en'):
     return fetched_transcript
 
 
+## Where import_youtube_subtitles keeps fetched transcripts
+YOUTUBE_CACHE_DIR = IMPORT_CACHE_DIR / "youtube"
+
+## Errors that retrying will not fix
+_YOUTUBE_PERMANENT_ERRORS = (
+    TranscriptsDisabled,
+    NoTranscriptFound,
+    VideoUnavailable,
+    InvalidVideoId,
+    AgeRestricted,
+    VideoUnplayable,
+)
+
+
+def _fetch_youtube_transcript(client, video_id, language, cache_dir, retries, backoff):
+    """Fetch one transcript as a list of snippet dicts, from the cache when possible."""
+    cache_file = cache_dir / f"{video_id}_{language}.json"
+    if cache_file.exists():
+        with open(cache_file, encoding="utf-8") as f:
+            return json.load(f)
+
+    for attempt in range(retries + 1):
+        try:
+            fetched = client.fetch(video_id, languages=[language])
+            break
+        except _YOUTUBE_PERMANENT_ERRORS:
+            raise
+        except Exception:
+            if attempt == retries:
+                raise
+            time.sleep(backoff * 2**attempt)
+
+    snippets = [
+        {"text": snippet.text, "start": snippet.start, "duration": snippet.duration}
+        for snippet in fetched
+    ]
+    tmp_file = cache_file.with_suffix(f".{threading.get_ident()}.tmp")
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        json.dump(snippets, f)
+    os.replace(tmp_file, cache_file)
+    return snippets
+
+
+def import_youtube_subtitles(
+    video_ids,
+    language="en",
+    cache_dir=None,
+    max_workers=8,
+    retries=3,
+    backoff=1.0,
+    client=None,
+):
+    """
+    Fetches transcripts for many YouTube videos concurrently into one DataFrame.
+
+    Transcripts are cached on disk per video ID and language, so nothing is downloaded
+    twice. Transient failures are retried with exponential backoff; videos that still
+    fail are reported and left out, with their errors in df.attrs['errors'].
+
+    Args:
+        video_ids (list): YouTube video IDs (duplicates are fetched once).
+        language (str, optional): The language of the subtitles. Defaults to 'en'.
+        cache_dir (str or Path, optional): Transcript cache folder. Defaults to YOUTUBE_CACHE_DIR.
+        max_workers (int, optional): Maximum concurrent requests. Defaults to 8.
+        retries (int, optional): Retries per video after the first attempt. Defaults to 3.
+        backoff (float, optional): Seconds before the first retry, doubled each time. Defaults to 1.0.
+        client (object, optional): Object with a YouTubeTranscriptApi-style
+            fetch(video_id, languages=[...]) method. Defaults to YouTubeTranscriptApi().
+
+    Returns:
+        pd.DataFrame: Columns video_id, language, start, duration, text.
+    """
+    client = client or YouTubeTranscriptApi()
+    cache_dir = Path(cache_dir or YOUTUBE_CACHE_DIR)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    video_ids = list(dict.fromkeys(video_ids))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            video_id: executor.submit(
+                _fetch_youtube_transcript, client, video_id, language, cache_dir, retries, backoff
+            )
+            for video_id in video_ids
+        }
+
+    dfs = []
+    errors = {}
+    for video_id, future in futures.items():
+        try:
+            snippets = future.result()
+        except Exception as e:
+            print(f"An error occurred for {video_id}: {e}")
+            errors[video_id] = str(e)
+            continue
+        df = pd.DataFrame(snippets, columns=["start", "duration", "text"])
+        df.insert(0, "language", language)
+        df.insert(0, "video_id", video_id)
+        dfs.append(df)
+
+    columns = ["video_id", "language", "start", "duration", "text"]
+    df = pd.concat(dfs, ignore_index=True) if dfs else pd.DataFrame(columns=columns)
+    df.attrs["errors"] = errors
+    return df
+
+
 if __name__ == '__main__':
     video_id = "yN9XgwVHvK4"
     import_youtube_subtitle(video_id)
@@ -1,11 +1,48 @@
 # %% Test functions
 
 ## Dependencies
+import base64
+import gzip
+import io
+import json
+import re
+import zipfile
+from types import SimpleNamespace
+import openpyxl
 import pandas as pd
 from pathlib import Path
 from analytics_tasks_utils.controlling import log_start, log_end, timer_start, timer_end
-from analytics_tasks_utils.exporting import dataframe_to_data_table, dataframe_to_excel
+from analytics_tasks_utils.exporting import (
+    dataframe_to_data_table,
+    dataframe_to_excel,
+    dataframes_to_excel,
+    export_folder_as_zip_nfp,
+    export_report_pack,
+    generate_data_table_from_dataframe,
+    generate_html_from_dataframe,
+    write_data_table_html,
+)
+from analytics_tasks_utils import exporting, importing
 from analytics_tasks_utils.formatting import round_columns
+from analytics_tasks_utils.importing import (
+    ZIP_ARCHIVE_POOL_SIZE,
+    ZipDataset,
+    aggregate_csv_within_zip,
+    build_csv_row_index,
+    catalog_zip,
+    clear_zip_archive_pool,
+    get_zip_archive,
+    import_csv_within_zip,
+    import_excel_within_zip,
+    import_excel_within_zip_fast,
+    import_glob_within_zip,
+    import_json_within_zip,
+    import_parquet_within_zip,
+    import_within_zip_cached,
+    import_txt,
+    import_txt_within_zip,
+    import_youtube_subtitles,
+)
 from analytics_tasks_utils.os_functions import open_file_folder
 from analytics_tasks_utils.reporting import eda_snapshot
 
@@ -31,6 +68,32 @@ dataframe_to_data_table(df, out_file="x.html")
 dataframe_to_data_table(
     df, func="generate_data_table_from_dataframe_internet", out_file="x.html"
 )
+dataframe_to_data_table(df, out_file="x.html", virtual=True, compress=True)
+
+## generate_data_table_from_dataframe writes the cells of the row-by-row build
+_table = pd.DataFrame({"i": [1, 2, 3], "f": [1.5, None, 3.25], "s": ["a", None, "#fff"]})
+_cells = [str(row[col]) for _, row in _table.iterrows() for col in _table.columns]
+_html = generate_data_table_from_dataframe(_table)
+assert re.findall(r"<th>(.*?)</th>", _html) == list(_table.columns)
+assert re.findall(r"<td>(.*?)</td>", _html) == _cells
+_output = io.StringIO()
+write_data_table_html(_table, _output, asset_path="../../assets/data_table/")
+assert _output.getvalue() == _html
+_html = generate_html_from_dataframe(_table, "s")
+assert re.findall(r"<td>(.*?)</td>", _html) == _cells
+assert _html.count('class="color-cell"') == len(_table)
+
+## write_data_table_html virtual pages embed strict JSON
+_df = pd.DataFrame({"x": [1.5, float("inf"), None], "s": ["</script>", "a\u2028b", "&"]})
+for _compress in (False, True):
+    _html = io.StringIO()
+    write_data_table_html(_df, _html, virtual=True, compress=_compress)
+    _payload = _html.getvalue().split('<script id="tableData"')[1]
+    _payload = _payload.split(">", 1)[1].split("</script>")[0]
+    if _compress:
+        _payload = gzip.decompress(base64.b64decode(_payload))
+    _columns = json.loads(_payload)
+    assert _columns == [[1.5, "inf", None], _df["s"].tolist()]
 
 
 ## dataframe_to_excel
@@ -89,12 +152,371 @@ dataframe_to_excel(
 )
 
 
+## dataframe_to_excel with empty and all-missing text columns
+_empty = pd.DataFrame({"s": pd.Series([None, None], dtype="str"), "n": [1, 2]})
+dataframe_to_excel(_empty.head(0), out_file=_tmp / "qc_empty.xlsx")
+dataframe_to_excel(_empty, out_file=_tmp / "qc_missing.xlsx")
+assert pd.read_excel(_tmp / "qc_missing.xlsx", skiprows=1)["n"].tolist() == [1, 2]
+
+
+## dataframe_to_excel inject_sheet matches the regular append
+for _file, _inject in ((_tmp / "qc_append.xlsx", False), (_tmp / "qc_inject.xlsx", True)):
+    _file.unlink(missing_ok=True)
+    dataframe_to_excel(df, out_file=_file, sheet_name="first")
+    dataframe_to_excel(df, out_file=_file, sheet_name="second", inject_sheet=_inject)
+_appended = pd.read_excel(_tmp / "qc_append.xlsx", sheet_name=None, skiprows=1)
+_injected = pd.read_excel(_tmp / "qc_inject.xlsx", sheet_name=None, skiprows=1)
+assert list(_injected) == ["first", "second"]
+assert all(_injected[name].equals(_appended[name]) for name in _appended)
+
+
+## dataframe_to_excel column widths match the full-scan text lengths
+_widths = pd.DataFrame(
+    {
+        "name": ["a", "b" * 22, None, "ccc"],
+        "n": [1, -123456, 3, 4],
+        "long header here": [1, 2, 3, 4],
+    }
+)
+_full_scan = [
+    max(_widths[col].dropna().astype(str).str.len().max(), len(col)) + 2 for col in _widths
+]
+for _max_width in (None, 12):
+    dataframe_to_excel(_widths, out_file=_tmp / "qc_widths.xlsx", max_column_width=_max_width)
+    _ws = openpyxl.load_workbook(_tmp / "qc_widths.xlsx").active
+    assert [int(_ws.column_dimensions[letter].width) for letter in "ABC"] == [
+        min(width, _max_width or width) for width in _full_scan
+    ]
+
+## dataframe_to_excel appends DataFrame chunks like the whole frame
+_big = pd.DataFrame({"a": range(100), "b": [f"x{i}" for i in range(100)]})
+for _file, _data in (
+    (_tmp / "qc_append_whole.xlsx", _big),
+    (_tmp / "qc_append_chunks.xlsx", (_big.iloc[i : i + 30] for i in range(0, 100, 30))),
+):
+    _file.unlink(missing_ok=True)
+    dataframe_to_excel(df, out_file=_file, sheet_name="first")
+    dataframe_to_excel(_data, out_file=_file, sheet_name="second")
+assert pd.read_excel(_tmp / "qc_append_chunks.xlsx", sheet_name="second", skiprows=1).equals(
+    pd.read_excel(_tmp / "qc_append_whole.xlsx", sheet_name="second", skiprows=1)
+)
+
+
+## dataframe_to_excel spills past EXCEL_MAX_ROWS onto numbered sheets
+_max_rows = exporting.EXCEL_MAX_ROWS
+exporting.EXCEL_MAX_ROWS = 12
+_spill = pd.DataFrame({"a": range(25), "b": [f"x{i}" for i in range(25)]})
+dataframe_to_excel(_spill, out_file=_tmp / "qc_spill.xlsx")
+exporting.EXCEL_MAX_ROWS = _max_rows
+_sheets = pd.read_excel(_tmp / "qc_spill.xlsx", sheet_name=None, skiprows=1)
+assert list(_sheets) == ["df", "df_2", "df_3"]
+assert pd.concat(_sheets.values(), ignore_index=True).equals(_spill)
+
+
+## dataframes_to_excel
+dataframes_to_excel(
+    {
+        "summary": (df, {"data_bars": {"Column A": "#5F799A"}}),
+        "detail": df,
+    },
+    out_file=Path("C:/my_disk/____tmp/qc_pack.xlsx"),
+    header_bg_color="#FAF4F4",
+    open_file=1,
+)
+
+
+## dataframes_to_excel sheets match separate dataframe_to_excel calls
+_sheets = {"summary": (_spill, {"data_bars": {"a": "#5F799A"}}), "detail": _big}
+dataframes_to_excel(_sheets, out_file=_tmp / "qc_batch.xlsx")
+(_tmp / "qc_separate.xlsx").unlink(missing_ok=True)
+for _name, _sheet in _sheets.items():
+    _frame, _options = _sheet if isinstance(_sheet, tuple) else (_sheet, {})
+    dataframe_to_excel(_frame, out_file=_tmp / "qc_separate.xlsx", sheet_name=_name, **_options)
+_batch = pd.read_excel(_tmp / "qc_batch.xlsx", sheet_name=None, skiprows=1)
+_separate = pd.read_excel(_tmp / "qc_separate.xlsx", sheet_name=None, skiprows=1)
+assert list(_batch) == list(_sheets)
+assert all(_batch[name].equals(_separate[name]) for name in _sheets)
+
+
+## export_report_pack
+if __name__ == "__main__":
+    export_report_pack(
+        [
+            {"df": df, "out_file": Path(f"C:/my_disk/____tmp/qc_pack_{i}.xlsx")}
+            for i in range(4)
+        ],
+        max_workers=2,
+    )
+
+
+## export_report_pack workbooks match dataframe_to_excel and failures stay isolated
+if __name__ == "__main__":
+    _jobs = [{"df": _spill, "out_file": _tmp / f"qc_job_{i}.xlsx"} for i in range(3)]
+    _jobs.append({"df": "not a frame", "out_file": _tmp / "qc_job_failed.xlsx"})
+    for _job in _jobs:
+        _job["out_file"].unlink(missing_ok=True)
+    _report = export_report_pack(_jobs, max_workers=2)
+    assert _report["status"].tolist() == ["ok"] * 3 + ["failed"]
+    (_tmp / "qc_job_serial.xlsx").unlink(missing_ok=True)
+    dataframe_to_excel(_spill, out_file=_tmp / "qc_job_serial.xlsx")
+    _serial = pd.read_excel(_tmp / "qc_job_serial.xlsx", skiprows=1)
+    for i in range(3):
+        assert pd.read_excel(_tmp / f"qc_job_{i}.xlsx", skiprows=1).equals(_serial)
+
+
+## export_folder_as_zip_nfp parallel compression matches the serial archive
+_zip_src = _tmp / "qc_zip_src"
+(_zip_src / "a").mkdir(parents=True, exist_ok=True)
+for i in range(20):
+    (_zip_src / "a" / f"f{i}.csv").write_text("x,y\n" * 1000 * i)
+_members = {}
+for _parallel in (False, True):
+    export_folder_as_zip_nfp(_zip_src, _tmp, parallel=_parallel, max_workers=4)
+    with zipfile.ZipFile(_tmp / "qc_zip_src.zip") as zf:
+        assert zf.testzip() is None
+        _members[_parallel] = [(name, zf.read(name)) for name in zf.namelist()]
+assert _members[True] == _members[False]
+
+
 # %% Formatting
 
 ## round_columns
 round_columns(pd.DataFrame({"a": [1.4343, 2.4564]}), "a", 2)
 
 
+# %% Importing
+
+## import_csv_within_zip with a reused archive handle
+_zip = Path("C:/my_disk/____tmp/qc.zip")
+archive = get_zip_archive(_zip)
+import_csv_within_zip(archive, "qc.csv")
+
+## import_csv_within_zip chunksize streams the same rows as a full read
+_data = pd.DataFrame(
+    {
+        "id": range(5000),
+        "group": [f"g{i % 7}" for i in range(5000)],
+        "paid": [i * 0.25 for i in range(5000)],
+    }
+)
+_data_zip = _tmp / "qc_data.zip"
+with zipfile.ZipFile(_data_zip, "w", zipfile.ZIP_DEFLATED) as zf:
+    zf.writestr("qc_data.csv", _data.to_csv(index=False))
+    zf.writestr("qc_data.txt", _data.to_csv(index=False, sep="\t"))
+for _reader, _member, _options in (
+    (import_csv_within_zip, "qc_data.csv", {"index_col": None}),
+    (import_txt_within_zip, "qc_data.txt", {"header": 0}),
+):
+    _full = _reader(_data_zip, _member, **_options)
+    assert _full.equals(_data)
+    assert pd.concat(_reader(_data_zip, _member, chunksize=1000, **_options)).equals(_full)
+
+## import_csv_within_zip optimize_dtypes keeps the values in smaller dtypes
+_optimized = import_csv_within_zip(_data_zip, "qc_data.csv", index_col=None, optimize_dtypes=True)
+assert _optimized.astype(_data.dtypes.to_dict()).equals(_data)
+assert _optimized.memory_usage(deep=True).sum() < _data.memory_usage(deep=True).sum()
+assert [row["column"] for row in _optimized.attrs["dtype_report"]] == list(_data.columns)
+
+## import_csv_within_zip engine="arrow" parses like the default engine
+for _reader, _member, _options in (
+    (import_csv_within_zip, "qc_data.csv", {"index_col": None}),
+    (import_txt_within_zip, "qc_data.txt", {"header": 0, "usecols": ["id", "paid"]}),
+):
+    assert _reader(_data_zip, _member, engine="arrow", **_options).equals(
+        _reader(_data_zip, _member, **_options)
+    )
+_data.to_csv(_tmp / "qc_data.txt", sep="\t", index=False)
+assert import_txt(_tmp / "qc_data.txt", header=0, engine="arrow").equals(
+    import_txt(_tmp / "qc_data.txt", header=0)
+)
+
+## get_zip_archive handle stays usable after the pool evicts it
+expected = import_csv_within_zip(archive, "qc.csv")
+for i in range(ZIP_ARCHIVE_POOL_SIZE + 1):
+    _pool_zip = _tmp / f"qc_pool_{i}.zip"
+    with zipfile.ZipFile(_pool_zip, "w") as zf:
+        zf.writestr("qc.csv", "a,b\n1,2\n")
+    import_csv_within_zip(_pool_zip, "qc.csv")
+assert import_csv_within_zip(archive, "qc.csv").equals(expected)
+
+## import_excel_within_zip_fast matches import_excel_within_zip
+_xlsx_zip = _tmp / "qc_xlsx.zip"
+_sheet = pd.DataFrame({"id": range(100), "name": [f"n{i}" for i in range(100)], "x": 1.5})
+with zipfile.ZipFile(_xlsx_zip, "w") as zf, zf.open("qc.xlsx", "w") as file:
+    _sheet.to_excel(file, index=False)
+assert import_excel_within_zip_fast(_xlsx_zip, "qc.xlsx").equals(
+    import_excel_within_zip(_xlsx_zip, "qc.xlsx")
+)
+assert import_excel_within_zip_fast(_xlsx_zip, "qc.xlsx", usecols="A,C", nrows=10).equals(
+    import_excel_within_zip(_xlsx_zip, "qc.xlsx", usecols="A,C").head(10)
+)
+
+## import_glob_within_zip
+import_glob_within_zip(_zip, "qc_*.csv", source_column="member", index_col=None)
+clear_zip_archive_pool()
+
+## import_glob_within_zip matches reading the members one by one
+_parts_zip = _tmp / "qc_parts.zip"
+with zipfile.ZipFile(_parts_zip, "w", zipfile.ZIP_DEFLATED) as zf:
+    for i in range(3):
+        zf.writestr(f"part_{i}.csv", _data.iloc[i::3].to_csv(index=False))
+_parts = [import_csv_within_zip(_parts_zip, f"part_{i}.csv", index_col=None) for i in range(3)]
+assert import_glob_within_zip(_parts_zip, "part_*.csv", index_col=None).equals(pd.concat(_parts))
+if __name__ == "__main__":
+    assert import_glob_within_zip(
+        _parts_zip, "part_*.csv", use_processes=True, index_col=None
+    ).equals(pd.concat(_parts))
+
+## import_parquet_within_zip memory-maps stored members like a plain read
+_data.to_parquet(_tmp / "qc_data.parquet")
+_parquet_zip = _tmp / "qc_parquet.zip"
+with zipfile.ZipFile(_parquet_zip, "w") as zf:
+    zf.write(_tmp / "qc_data.parquet", "stored.parquet", zipfile.ZIP_STORED)
+    zf.write(_tmp / "qc_data.parquet", "deflated.parquet", zipfile.ZIP_DEFLATED)
+_options = {"columns": ["id"], "filters": [("group", "=", "g1")]}
+for _member in ("stored.parquet", "deflated.parquet"):
+    assert import_parquet_within_zip(_parquet_zip, _member).equals(
+        pd.read_parquet(_tmp / "qc_data.parquet")
+    )
+    assert import_parquet_within_zip(_parquet_zip, _member, **_options).equals(
+        pd.read_parquet(_tmp / "qc_data.parquet", **_options)
+    )
+
+## catalog_zip previews match full reads of each member
+_catalog = catalog_zip(_data_zip, preview_bytes=1024**2).set_index("member")
+_catalog_full = {
+    "qc_data.csv": import_csv_within_zip(_data_zip, "qc_data.csv", index_col=None),
+    "qc_data.txt": import_txt_within_zip(_data_zip, "qc_data.txt", header=0),
+}
+for _member, _frame in _catalog_full.items():
+    assert _catalog.loc[_member, "columns"] == list(_frame.columns)
+    assert _catalog.loc[_member, "rows"] == len(_frame) and _catalog.loc[_member, "rows_exact"]
+_catalog = catalog_zip(_parquet_zip).set_index("member")
+assert _catalog.loc["stored.parquet", "rows"] == len(_data)
+assert catalog_zip(_data_zip, preview_bytes=1024)["rows_exact"].eq(False).all()
+
+## build_csv_row_index reads deep row ranges like an iloc slice
+_block_bytes = importing.ROW_INDEX_BLOCK_BYTES
+importing.ROW_INDEX_BLOCK_BYTES = 4096
+_row_index = build_csv_row_index(_data_zip, "qc_data.csv", checkpoint_every_mb=0.004)
+assert len(_row_index.checkpoints) > 1 and _row_index.n_rows == len(_data)
+for _start, _stop in ((0, 10), (3000, 3100), (4990, 6000)):
+    assert _row_index.read_rows(_start, _stop).equals(_data.iloc[_start:_stop])
+importing.ROW_INDEX_BLOCK_BYTES = _block_bytes
+
+## aggregate_csv_within_zip matches a pandas groupby on the full table
+_aggs = {"paid": ["sum", "mean", "min", "max"], "id": ["count", "size"]}
+pd.testing.assert_frame_equal(
+    aggregate_csv_within_zip(
+        _data_zip, "qc_data.csv", _aggs, by="group", predicate="paid > 100", chunksize=700
+    ),
+    _data.query("paid > 100").groupby("group").agg(_aggs),
+)
+_total = aggregate_csv_within_zip(_data_zip, "qc_data.csv", {"paid": "sum"}, chunksize=700)
+assert _total["paid"].item() == _data["paid"].sum()
+
+## ZipDataset reads the unpruned partitions like concatenating them by hand
+_dataset_dir = _tmp / "qc_dataset"
+_dataset_dir.mkdir(exist_ok=True)
+_periods = ["202507", "202508", "202509"]
+for i, _period in enumerate(_periods):
+    with zipfile.ZipFile(_dataset_dir / f"extract_{_period}.zip", "w") as zf:
+        zf.writestr("claims.csv", _data.iloc[i::3].to_csv(index=False))
+_dataset = ZipDataset(
+    _dataset_dir, member_pattern="claims.csv", archive_regex=r"extract_(?P<period>\d{6})\.zip"
+)
+_filter = lambda keys: keys["period"] >= "202508"
+assert _dataset.partitions(_filter)["period"].tolist() == _periods[1:]
+_expected = []
+for i, _period in enumerate(_periods[1:], start=1):
+    _part = _data.iloc[i::3].reset_index(drop=True)
+    _part.insert(0, "period", _period)
+    _expected.append(_part)
+assert _dataset.read(_filter, index_col=None).equals(pd.concat(_expected))
+
+## import_json_within_zip JSON Lines match json_normalize
+_jsonl_zip = _tmp / "qc_jsonl.zip"
+_records = [
+    {"id": i, "user": {"name": f"u{i}", "geo": {"lat": i / 10}}, "tags": ["a"] * (i % 3)}
+    for i in range(1000)
+]
+with zipfile.ZipFile(_jsonl_zip, "w") as zf:
+    zf.writestr("qc.jsonl", "\n".join(json.dumps(r) for r in _records))
+assert import_json_within_zip(_jsonl_zip, "qc.jsonl", lines=True).equals(
+    pd.json_normalize(_records)
+)
+
+## import_within_zip_cached hit matches a direct read
+_cache_dir = _tmp / "qc_import_cache"
+_direct = import_csv_within_zip(_pool_zip, "qc.csv")
+for cache_format in ("parquet", "feather"):
+    for _ in range(2):  # Miss, then hit
+        cached = import_within_zip_cached(
+            _pool_zip, "qc.csv", cache_dir=_cache_dir, cache_format=cache_format
+        )
+        assert cached.equals(_direct)
+
+## import_json_within_zip keeps date-like strings as text on both parse paths
+_dated = [
+    {"ts": "2024-01-01 10:00:00", "d": "2024-01-02", "event": {"at": "2024-01-03T08:00:00"}},
+    {"ts": "2024-02-01 10:00:00", "d": "2024-02-02", "event": {"at": "2024-02-03T08:00:00"}},
+    {"ts": "2024-03-01 10:00:00", "d": "2024-03-02", "event": {"at": 1}},  # Mixed type: fallback
+    {"ts": "2024-04-01 10:00:00", "d": "2024-04-02", "event": {"at": "2024-04-03T08:00:00"}},
+]
+with zipfile.ZipFile(_jsonl_zip, "w") as zf:
+    zf.writestr("qc_dated.jsonl", "\n".join(json.dumps(r) for r in _dated))
+_chunks = list(import_json_within_zip(_jsonl_zip, "qc_dated.jsonl", lines=True, chunksize=2))
+for i, _chunk in enumerate(_chunks):
+    _expected = pd.json_normalize(_dated[2 * i : 2 * i + 2])
+    _expected.index = _chunk.index
+    assert _chunk.equals(_expected)
+assert _chunks[0][["ts", "d"]].dtypes.equals(_chunks[1][["ts", "d"]].dtypes)
+
+## import_txt parallel byte ranges match the serial parse
+_txt = _tmp / "qc_parallel.txt"
+_codes = [f"{i:05d}" if i < 3040 else f"A{i}" for i in range(4000)]
+pd.DataFrame({"id": range(4000), "code": _codes}).to_csv(_txt, sep="\t", index=False)
+if __name__ == "__main__":
+    importing.TXT_PARALLEL_MIN_BYTES = 1024
+    serial = import_txt(_txt, header=0)
+    assert import_txt(_txt, header=0, parallel=True, max_workers=4).equals(serial)
+    assert import_txt(_txt, header=0, index_col="id", parallel=True).equals(
+        import_txt(_txt, header=0, index_col="id")
+    )
+
+## import_youtube_subtitles fetches each video once and then reads the cache
+class _FakeTranscriptClient:
+    def __init__(self):
+        self.calls = []
+
+    def fetch(self, video_id, languages):
+        self.calls.append(video_id)
+        if video_id == "broken":
+            raise ConnectionError("offline")
+        return [
+            SimpleNamespace(text=f"{video_id} {i}", start=i * 2.0, duration=2.0) for i in range(3)
+        ]
+
+
+_expected = pd.DataFrame(
+    {
+        "video_id": ["a"] * 3 + ["b"] * 3,
+        "language": "en",
+        "start": [0.0, 2.0, 4.0] * 2,
+        "duration": 2.0,
+        "text": [f"{video_id} {i}" for video_id in "ab" for i in range(3)],
+    }
+)
+_client = _FakeTranscriptClient()
+_youtube_cache = _tmp / "qc_youtube_cache"
+for _ in range(2):
+    _subtitles = import_youtube_subtitles(
+        ["a", "b", "a", "broken"], cache_dir=_youtube_cache, retries=1, backoff=0, client=_client
+    )
+    assert _subtitles.equals(_expected) and list(_subtitles.attrs["errors"]) == ["broken"]
+assert sorted(_client.calls) == ["a", "b"] + ["broken"] * 4
+
+
 # %% OS
 
 ## open_file_folder